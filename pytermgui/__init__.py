@@ -31,6 +31,7 @@ from .prettifiers import *
 from .regex import *
 from .serialization import *
 from .term import *
+from .virtual_terminal import *
 from .widgets import *
 from .window_manager import *
 
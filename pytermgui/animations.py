@@ -260,6 +260,7 @@ class Animator:
         """Initializes an animator."""
 
         self._animations: list[Animation] = []
+        self._listeners: list[Callable[[Animation], Any]] = []
 
     def __contains__(self, item: object) -> bool:
         """Returns whether the item is inside _animations."""
@@ -272,6 +273,12 @@ class Animator:
 
         return len(self._animations) > 0
 
+    @property
+    def animations(self) -> list[Animation]:
+        """Returns a copy of the currently scheduled animations."""
+
+        return self._animations.copy()
+
     def step(self, elapsed: float) -> None:
         """Steps the animation forward by the given elapsed time."""
 
@@ -285,6 +292,28 @@ class Animator:
 
         self._animations.append(animation)
 
+        for callback in self._listeners:
+            callback(animation)
+
+    def subscribe(self, callback: Callable[[Animation], Any]) -> None:
+        """Subscribes a callback to be called whenever an animation is scheduled.
+
+        Args:
+            callback: The callable to be called. It is given the new animation.
+        """
+
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback: Callable[[Animation], Any]) -> None:
+        """Removes a callback added by `subscribe`.
+
+        Args:
+            callback: The callable to remove.
+        """
+
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
     def animate_attr(self, **animation_args: Any) -> AttrAnimation:
         """Creates and schedules an AttrAnimation.
 
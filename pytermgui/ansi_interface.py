@@ -77,25 +77,25 @@ def save_screen() -> None:
     Use `restore_screen()` to get them back.
     """
 
-    print("\x1b[?47h")
+    get_terminal().write("\x1b[?47h\n")
 
 
 def restore_screen() -> None:
     """Restores the contents of the screen saved by `save_screen()`."""
 
-    print("\x1b[?47l")
+    get_terminal().write("\x1b[?47l\n")
 
 
 def set_alt_buffer() -> None:
     """Starts an alternate buffer."""
 
-    print("\x1b[?1049h")
+    get_terminal().write("\x1b[?1049h\n")
 
 
 def unset_alt_buffer() -> None:
     """Returns to main buffer, restoring its original state."""
 
-    print("\x1b[?1049l")
+    get_terminal().write("\x1b[?1049l\n")
 
 
 def clear(what: str = "screen") -> None:
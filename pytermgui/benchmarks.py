@@ -0,0 +1,590 @@
+"""Benchmarks for the hot paths of the library.
+
+These can be run using `ptg --bench`. Results can be saved as a JSON baseline, and
+later runs compared against it to catch performance regressions:
+
+```
+$ ptg --bench --bench-save baseline.json
+$ ptg --bench --bench-compare baseline.json --bench-threshold 0.15
+```
+
+Benchmarks that start with a cold cache clear the relevant caches before every call,
+and so are timed one call at a time. Every benchmark is called once before timing it,
+so the widgets & text it uses are created outside of the timed rounds.
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import re
+import sys
+import timeit
+from argparse import ArgumentParser, Namespace
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from io import TextIOBase
+from typing import Any, Callable
+
+from .colors import Color, IndexedColor, clear_color_cache, str_to_color
+from .enums import Overflow, RenderMode
+from .exporters import to_html, to_svg
+from .helpers import break_line, slice_ansi
+from .markup import CompiledMarkup, consume_tag, tim, tokenize_ansi, tokenize_markup
+from .regex import clear_width_cache, real_length
+from .term import ColorSystem, Terminal, get_terminal, set_global_terminal
+from .widgets import (
+    Button,
+    Checkbox,
+    Container,
+    DataTable,
+    Label,
+    Splitter,
+    Toggle,
+)
+from .window_manager import Compositor, Window
+
+__all__ = [
+    "Benchmark",
+    "BenchmarkResult",
+    "Comparison",
+    "BENCHMARKS",
+    "run_benchmarks",
+    "compare_results",
+    "save_results",
+    "load_results",
+    "add_arguments",
+    "run_from_args",
+]
+
+SAMPLE_MARKUP = (
+    "[bold 141 @61]Hello[/] [italic !gradient(210)]there[/!gradient /italic], "
+    "[~https://example.com underline]this[/~ /underline] is [#ff8800]some[/fg] "
+    "[dim @surface]markup text[/] with [inverse]a lot[/inverse] of [strikethrough]"
+    "different[/] tags!"
+)
+
+SAMPLE_MARKUP_NO_MACROS = SAMPLE_MARKUP.replace("!gradient(210)", "210").replace(
+    "/!gradient ", ""
+)
+
+SAMPLE_PLAIN = "Some plain text, like most label values: 42 items, 3.14 seconds."
+
+
+@dataclass
+class Benchmark:
+    """A single benchmark."""
+
+    name: str
+    """The name of the benchmark, used as its key in results."""
+
+    func: Callable[[], Any]
+    """The function that is timed."""
+
+    setup: Callable[[], Any] | None = None
+    """A function called before each round of `number` calls, not included in the
+    timing. Used to clear caches for cold benchmarks."""
+
+    number: int = 100
+    """The amount of calls to `func` timed together."""
+
+    def run(self, repeat: int) -> BenchmarkResult:
+        """Runs the benchmark.
+
+        Args:
+            repeat: The amount of rounds to time, scaled for cold benchmarks.
+
+        Returns:
+            The timings of this benchmark.
+        """
+
+        if self.number == 1:
+            repeat *= 20
+
+        # Untimed, so building the fixtures used by `func` isn't part of any round
+        if self.setup is not None:
+            self.setup()
+
+        self.func()
+
+        timer = timeit.Timer(self.func, setup=self.setup or (lambda: None))
+        timings = [total / self.number for total in timer.repeat(repeat, self.number)]
+
+        return BenchmarkResult(
+            best=min(timings),
+            mean=sum(timings) / len(timings),
+            number=self.number,
+            repeat=repeat,
+        )
+
+
+@dataclass
+class BenchmarkResult:
+    """The timings of a benchmark, in seconds per call."""
+
+    best: float
+    mean: float
+    number: int
+    repeat: int
+
+
+@dataclass
+class Comparison:
+    """The comparison of a benchmark's result to its baseline."""
+
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """Returns the current best time relative to the baseline's."""
+
+        return self.current / self.baseline if self.baseline > 0 else 1.0
+
+    def is_regression(self, threshold: float) -> bool:
+        """Determines whether the benchmark got slower by more than `threshold`.
+
+        Args:
+            threshold: The allowed slowdown, e.g. `0.1` for 10%.
+        """
+
+        return self.ratio > 1 + threshold
+
+
+class _NullStream(TextIOBase):
+    """A stream that discards everything written to it."""
+
+    def write(self, data: str) -> int:  # type: ignore
+        """Discards the data."""
+
+        return len(data)
+
+
+def _create_container(depth: int) -> Container:
+    """Creates a container nested `depth` times, with some widgets at each level."""
+
+    container = Container(
+        Label("[bold]Leaf"),
+        Button("Button"),
+        Splitter(Checkbox(), Toggle(("On", "Off"))),
+    )
+
+    for level in range(depth):
+        container = Container(
+            Label(f"[141]Level {level}"),
+            container,
+            Splitter(Label("Left"), Label("[italic]Right")),
+        )
+
+    return container
+
+
+@lru_cache(maxsize=None)
+def _get_container(depth: int = 5) -> Container:
+    """Returns a container nested `depth` times, created on first use."""
+
+    return _create_container(depth)
+
+
+@lru_cache(maxsize=None)
+def _get_label(cache_lines: bool) -> Label:
+    """Returns a label of some wrapping markup, optionally without a line cache."""
+
+    label = Label(SAMPLE_MARKUP_NO_MACROS, width=40)
+    label.cache_lines = cache_lines
+
+    return label
+
+
+@lru_cache(maxsize=None)
+def _get_plain_container() -> Container:
+    """Returns a container of plain text labels, like a typical dashboard frame."""
+
+    return Container(*(Label(f"{SAMPLE_PLAIN} #{i}") for i in range(40)), width=100)
+
+
+@lru_cache(maxsize=None)
+def _get_large_container() -> Container:
+    """Returns a container of 2000 labels, grouped into 100 inner containers."""
+
+    return Container(
+        *(
+            Container(*(Label(f"{SAMPLE_PLAIN} #{i}.{j}") for j in range(20)))
+            for i in range(100)
+        ),
+        width=100,
+    )
+
+
+def _update_large_container() -> None:
+    """Changes the value of a single label, and renders the large container."""
+
+    container = _get_large_container()
+    label = container[50][10]  # type: ignore
+
+    label.value = "Changed" if label.value != "Changed" else SAMPLE_PLAIN
+    container.get_lines()
+
+
+@lru_cache(maxsize=None)
+def _get_virtual_container() -> Container:
+    """Returns a scrolled, virtualized container of many labels."""
+
+    container = Container(height=40, overflow=Overflow.SCROLL, virtualize=True)
+
+    for i in range(10000):
+        container.lazy_add(Label(f"{SAMPLE_PLAIN} #{i}"))
+
+    container.get_lines()
+    container.scroll(5000)
+
+    return container
+
+
+@lru_cache(maxsize=None)
+def _get_data_table() -> DataTable:
+    """Returns a scrolled table of a million rows, generated on demand."""
+
+    table = DataTable(
+        lambda i: (i, f"worker-{i}", i % 100 / 10),
+        length=1_000_000,
+        columns=["PID", "Name", "CPU%"],
+        width=80,
+        height=40,
+    )
+
+    table.scroll(500_000)
+
+    return table
+
+
+@lru_cache(maxsize=None)
+def _get_splitter() -> Splitter:
+    """Returns a splitter of nested containers, created on first use."""
+
+    splitter = Splitter(width=120)
+
+    for _ in range(3):
+        splitter += _create_container(3)
+
+    return splitter
+
+
+@lru_cache(maxsize=None)
+def _get_windows() -> list[Window]:
+    """Creates some overlapping windows for the compositor benchmarks."""
+
+    windows = []
+
+    for i in range(4):
+        window = Window(_create_container(2), width=60)
+        window.pos = (1 + i * 10, 1 + i * 3)
+        windows.append(window)
+
+    return windows
+
+
+@lru_cache(maxsize=None)
+def _get_ansi_text() -> str:
+    """Returns some parsed, ANSI-coded text."""
+
+    return tim.parse(SAMPLE_MARKUP)
+
+
+@lru_cache(maxsize=None)
+def _get_compiled() -> CompiledMarkup:
+    """Returns a compiled template of some status markup."""
+
+    return tim.compile("[bold 141]{name}[/] [72]{value:>5}[/] [dim]units")
+
+
+def _draw(mode: RenderMode) -> Callable[[], None]:
+    """Returns a function that force-draws the benchmark windows using `mode`."""
+
+    compositor: Compositor | None = None
+
+    def _inner() -> None:
+        nonlocal compositor
+
+        if compositor is None:
+            compositor = Compositor(_get_windows(), framerate=60, render_mode=mode)
+
+        compositor.draw(force=True)
+
+    return _inner
+
+
+def _clear_parse_caches() -> None:
+    """Clears the caches involved in parsing markup."""
+
+    tim.clear_cache()
+    consume_tag.cache_clear()
+    str_to_color.cache_clear()
+    clear_color_cache()
+
+
+BENCHMARKS = [
+    Benchmark(
+        "tim.parse (cold)",
+        lambda: tim.parse(SAMPLE_MARKUP),
+        setup=_clear_parse_caches,
+        number=1,
+    ),
+    Benchmark("tim.parse (warm)", lambda: tim.parse(SAMPLE_MARKUP), number=1000),
+    Benchmark(
+        "tim.parse (warm, no macros)",
+        lambda: tim.parse(SAMPLE_MARKUP_NO_MACROS),
+        number=10000,
+    ),
+    Benchmark(
+        "tim.compile (call)",
+        lambda: _get_compiled()(name="Counter", value=42),
+        number=10000,
+    ),
+    Benchmark(
+        "tim.parse (plain text)",
+        lambda: tim.parse(SAMPLE_PLAIN, cache=False),
+        number=10000,
+    ),
+    Benchmark("tokenize_ansi (plain text)", lambda: list(tokenize_ansi(SAMPLE_PLAIN))),
+    Benchmark("tokenize_markup", lambda: list(tokenize_markup(SAMPLE_MARKUP))),
+    Benchmark("tokenize_ansi", lambda: list(tokenize_ansi(_get_ansi_text()))),
+    Benchmark(
+        "real_length (cold)",
+        lambda: real_length(_get_ansi_text()),
+        setup=clear_width_cache,
+        number=1,
+    ),
+    Benchmark(
+        "real_length (warm)", lambda: real_length(_get_ansi_text()), number=10000
+    ),
+    Benchmark("break_line", lambda: list(break_line(_get_ansi_text() * 5, 40))),
+    Benchmark("slice_ansi", lambda: slice_ansi(_get_ansi_text() * 20, 20, 1000)),
+    Benchmark(
+        "Label.get_lines (cached)", lambda: _get_label(True).get_lines(), number=1000
+    ),
+    Benchmark(
+        "Label.get_lines (uncached)",
+        lambda: _get_label(False).get_lines(),
+        number=1000,
+    ),
+    Benchmark("Container.get_lines", lambda: _get_container().get_lines(), number=20),
+    Benchmark(
+        "Container.get_lines (plain text)",
+        lambda: _get_plain_container().get_lines(),
+        number=20,
+    ),
+    Benchmark(
+        "Container.get_lines (2000 widgets, one changed)",
+        _update_large_container,
+        number=20,
+    ),
+    Benchmark(
+        "Container.get_lines (virtualized, 10k)",
+        lambda: _get_virtual_container().get_lines(),
+        number=20,
+    ),
+    Benchmark(
+        "DataTable.get_lines (1M rows)",
+        lambda: _get_data_table().get_lines(),
+        number=20,
+    ),
+    Benchmark("Splitter.get_lines", lambda: _get_splitter().get_lines(), number=20),
+    Benchmark("Compositor.draw (full)", _draw(RenderMode.FULL), number=20),
+    Benchmark("Compositor.draw (damage)", _draw(RenderMode.DAMAGE), number=20),
+    Benchmark("to_svg", lambda: to_svg(_get_container(2)), number=5),
+    Benchmark("to_html", lambda: to_html(_get_container(2)), number=5),
+    Benchmark("Color.parse", lambda: Color.parse("#ff8800"), number=1000),
+    Benchmark(
+        "IndexedColor.from_rgb (cold)",
+        lambda: IndexedColor.from_rgb((255, 136, 0)),
+        setup=clear_color_cache,
+        number=1,
+    ),
+]
+"""All available benchmarks."""
+
+
+def run_benchmarks(
+    pattern: str | None = None,
+    repeat: int = 5,
+    on_result: Callable[[str, BenchmarkResult], Any] | None = None,
+) -> dict[str, BenchmarkResult]:
+    """Runs benchmarks on a true color terminal that discards its output.
+
+    Args:
+        pattern: If given, only benchmarks whose names match this regex are run.
+        repeat: The amount of rounds to time each benchmark for.
+        on_result: A callback called with each benchmark's name and result as soon as
+            it finishes.
+
+    Returns:
+        A dictionary of benchmark names to their results.
+    """
+
+    original = get_terminal()
+
+    bench_terminal = Terminal(_NullStream(), size=(120, 40))  # type: ignore
+    bench_terminal.forced_colorsystem = ColorSystem.TRUE
+
+    results: dict[str, BenchmarkResult] = {}
+
+    set_global_terminal(bench_terminal)
+
+    try:
+        for benchmark in BENCHMARKS:
+            if pattern is not None and re.search(pattern, benchmark.name) is None:
+                continue
+
+            result = results[benchmark.name] = benchmark.run(repeat)
+
+            if on_result is not None:
+                on_result(benchmark.name, result)
+
+    finally:
+        set_global_terminal(original)
+
+    return results
+
+
+def compare_results(
+    results: dict[str, BenchmarkResult], baseline: dict[str, BenchmarkResult]
+) -> list[Comparison]:
+    """Compares results to a baseline, using the best timing of each benchmark.
+
+    Benchmarks missing from either side are skipped.
+    """
+
+    return [
+        Comparison(name, baseline[name].best, result.best)
+        for name, result in results.items()
+        if name in baseline
+    ]
+
+
+def save_results(results: dict[str, BenchmarkResult], path: str) -> None:
+    """Saves results as a JSON baseline, along with some system information."""
+
+    from . import __version__  # pylint: disable=import-outside-toplevel
+
+    data = {
+        "version": __version__,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": {name: asdict(result) for name, result in results.items()},
+    }
+
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(data, file, indent=4)
+
+
+def load_results(path: str) -> dict[str, BenchmarkResult]:
+    """Loads results saved by `save_results`."""
+
+    with open(path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+
+    return {name: BenchmarkResult(**result) for name, result in data["results"].items()}
+
+
+def add_arguments(parser: ArgumentParser) -> None:
+    """Adds the benchmark arguments used by `ptg --bench` to a parser."""
+
+    group = parser.add_argument_group("Benchmarks")
+
+    group.add_argument(
+        "--bench",
+        help="Run benchmarks. If a PATTERN is given, only matching ones are run.",
+        metavar="PATTERN",
+        const="",
+        nargs="?",
+    )
+    group.add_argument(
+        "--bench-save",
+        help="Save the benchmark results as a JSON baseline.",
+        metavar="FILE",
+    )
+    group.add_argument(
+        "--bench-compare",
+        help="Compare the benchmark results to a JSON baseline.",
+        metavar="FILE",
+    )
+    group.add_argument(
+        "--bench-threshold",
+        help="The slowdown over the baseline counted as a regression. Default: 0.1",
+        metavar="RATIO",
+        type=float,
+        default=0.1,
+    )
+    group.add_argument(
+        "--bench-repeat",
+        help="The amount of rounds each benchmark is timed for. Default: 5",
+        metavar="N",
+        type=int,
+        default=5,
+    )
+
+
+def _format_result(
+    name: str,
+    result: BenchmarkResult,
+    baseline: dict[str, BenchmarkResult] | None,
+    threshold: float,
+) -> str:
+    """Formats a single result, compared to its baseline if there is one."""
+
+    line = f"[ptg.detail]{name:<32}[/] [157]{result.best * 1e6:>12.2f}µs[/]"
+
+    if baseline is not None and name in baseline:
+        (comparison,) = compare_results({name: result}, {name: baseline[name]})
+
+        color = "210" if comparison.is_regression(threshold) else "157"
+        line += f" [{color}]{comparison.ratio:>7.2f}x"
+
+    return tim.parse(line)
+
+
+def run_from_args(args: Namespace) -> None:
+    """Runs benchmarks using the arguments from `add_arguments`.
+
+    Results are printed to the global terminal, and saved or compared to a baseline
+    if requested. Exits with a status of 1 if any benchmark regressed.
+    """
+
+    baseline = None
+    if args.bench_compare:
+        baseline = load_results(args.bench_compare)
+
+    # Benchmarks run on a virtual terminal, so results go to the current one
+    terminal = get_terminal()
+
+    tim.print(f"[ptg.title]{'Benchmark':<32} {'Best per call':>14}")
+    results = run_benchmarks(
+        args.bench or None,
+        repeat=args.bench_repeat,
+        on_result=lambda name, result: terminal.print(
+            _format_result(name, result, baseline, args.bench_threshold)
+        ),
+    )
+
+    if args.bench_save:
+        save_results(results, args.bench_save)
+
+    if baseline is None:
+        return
+
+    regressions = [
+        comparison.name
+        for comparison in compare_results(results, baseline)
+        if comparison.is_regression(args.bench_threshold)
+    ]
+
+    if len(regressions) > 0:
+        tim.print(
+            f"[210 bold]{len(regressions)} regression(s)"
+            + f" over {args.bench_threshold:.0%}:[/] "
+            + ", ".join(regressions)
+        )
+
+        sys.exit(1)
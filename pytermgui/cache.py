@@ -0,0 +1,154 @@
+"""A bounded, least-recently-used cache with hit, miss & eviction statistics."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, NamedTuple, TypeVar
+
+__all__ = ["CacheInfo", "LRUCache"]
+
+T = TypeVar("T")
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of an `LRUCache`, similar to `functools.lru_cache`'s."""
+
+    hits: int
+    misses: int
+    evictions: int
+    currsize: int
+    currbytes: int
+    maxsize: int | None
+    max_bytes: int | None
+
+
+class LRUCache(Generic[T]):
+    """A cache that evicts its least recently used entries once it grows too large.
+
+    The cache can be bounded by its amount of entries (`maxsize`), by the total size
+    of its entries (`max_bytes`), or both. Sizes are given by the caller when storing
+    an entry, so what a "byte" means is up to them.
+    """
+
+    def __init__(self, maxsize: int | None = 1024, max_bytes: int | None = None) -> None:
+        """Initializes the cache.
+
+        Args:
+            maxsize: The most entries the cache may hold. `None` means unbounded, and
+                `0` disables the cache.
+            max_bytes: The largest total size of the entries the cache may hold. `None`
+                means unbounded.
+        """
+
+        self._data: OrderedDict[Hashable, tuple[T, int]] = OrderedDict()
+
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.currbytes = 0
+
+    def __len__(self) -> int:
+        """Returns the amount of entries in the cache."""
+
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Determines whether the key is cached, without counting a hit or miss."""
+
+        return key in self._data
+
+    @property
+    def enabled(self) -> bool:
+        """Returns whether the cache can hold any entries."""
+
+        return self.maxsize != 0 and self.max_bytes != 0
+
+    def get(self, key: Hashable) -> T | None:
+        """Gets an entry, and marks it as the most recently used one.
+
+        Returns:
+            The cached value, or None if the key isn't cached.
+        """
+
+        entry = self._data.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._data.move_to_end(key)
+
+        return entry[0]
+
+    def set(self, key: Hashable, value: T, size: int = 0) -> None:
+        """Stores an entry, evicting the least recently used ones if needed.
+
+        Entries larger than `max_bytes` are not stored at all.
+
+        Args:
+            key: The key to store the value under.
+            value: The value to store.
+            size: The size of the entry, counted towards `max_bytes`.
+        """
+
+        if not self.enabled or (self.max_bytes is not None and size > self.max_bytes):
+            return
+
+        old = self._data.pop(key, None)
+        if old is not None:
+            self.currbytes -= old[1]
+
+        self._data[key] = (value, size)
+        self.currbytes += size
+
+        while (self.maxsize is not None and len(self._data) > self.maxsize) or (
+            self.max_bytes is not None and self.currbytes > self.max_bytes
+        ):
+            _, (_, evicted_size) = self._data.popitem(last=False)
+
+            self.currbytes -= evicted_size
+            self.evictions += 1
+
+    def remove_if(self, predicate: Callable[[Hashable, T], bool]) -> int:
+        """Removes all entries that match a predicate. These don't count as evictions.
+
+        Args:
+            predicate: Called with the key & value of every entry, returning whether it
+                should be removed.
+
+        Returns:
+            The amount of entries removed.
+        """
+
+        removed = [
+            key for key, (value, _) in self._data.items() if predicate(key, value)
+        ]
+
+        for key in removed:
+            _, size = self._data.pop(key)
+            self.currbytes -= size
+
+        return len(removed)
+
+    def clear(self) -> None:
+        """Removes all entries. The hit, miss and eviction counters are kept."""
+
+        self._data.clear()
+        self.currbytes = 0
+
+    def info(self) -> CacheInfo:
+        """Returns the statistics of the cache."""
+
+        return CacheInfo(
+            self.hits,
+            self.misses,
+            self.evictions,
+            len(self._data),
+            self.currbytes,
+            self.maxsize,
+            self.max_bytes,
+        )
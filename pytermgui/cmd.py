@@ -17,6 +17,8 @@ from typing import Any, Callable, Iterable, Type
 
 import pytermgui as ptg
 
+from . import benchmarks
+
 
 def _title() -> str:
     """Returns 'PyTermGUI', formatted."""
@@ -531,6 +533,8 @@ def process_args(argv: list[str] | None = None) -> Namespace:
         action="store_true",
     )
 
+    benchmarks.add_arguments(parser)
+
     export_group = parser.add_argument_group("Exporters")
 
     export_group.add_argument(
@@ -907,6 +911,11 @@ def main(argv: list[str] | None = None) -> None:
         else ("tim" if args.tim else ("color" if args.color else None))
     )
 
+    if args.bench is not None:
+        benchmarks.run_from_args(args)
+
+        return
+
     if args.app or len(sys.argv) == 1:
         run_environment(args)
 
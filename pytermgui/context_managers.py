@@ -81,11 +81,17 @@ def alt_buffer(echo: bool = False, cursor: bool = True) -> Generator[None, None,
     """
 
     terminal = get_terminal()
+    toggle_echo = (
+        not echo
+        and name == "posix"
+        and not terminal.is_interactive()
+        and terminal.isatty()
+    )
 
     try:
         set_alt_buffer()
 
-        if not echo and name == "posix" and not terminal.is_interactive():
+        if toggle_echo:
             unset_echo()
 
         if not cursor:
@@ -96,7 +102,7 @@ def alt_buffer(echo: bool = False, cursor: bool = True) -> Generator[None, None,
     finally:
         unset_alt_buffer()
 
-        if not echo and name == "posix" and not terminal.is_interactive():
+        if toggle_echo:
             set_echo()
             cursor_up()
 
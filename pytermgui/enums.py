@@ -29,6 +29,7 @@ __all__ = [
     "HorizontalAlignment",
     "VerticalAlignment",
     "Overflow",
+    "RenderMode",
 ]
 
 
@@ -136,8 +137,19 @@ class WidgetChange(Enum):
     """The height of the widget changed, possibly involving LINES type changes."""
 
 
+class RenderMode(DefaultEnum):
+    """The ways `pytermgui.window_manager.Compositor` can draw its frames."""
+
+    FULL = 0
+    """Clear the screen and write every line of every window on each frame."""
+
+    DAMAGE = 1
+    """Keep the previous frame as a cell grid, and only write the cells that changed."""
+
+
 defaults[SizePolicy] = SizePolicy.FILL
 defaults[CenteringPolicy] = CenteringPolicy.ALL
 defaults[HorizontalAlignment] = HorizontalAlignment.CENTER
 defaults[VerticalAlignment] = VerticalAlignment.CENTER
 defaults[Overflow] = Overflow.RESIZE
+defaults[RenderMode] = RenderMode.FULL
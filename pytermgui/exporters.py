@@ -257,10 +257,8 @@ def token_to_css(token: Token, invert: bool = False) -> str:
 
         style = "color:" + color.hex
 
-        if invert:
-            color.background = not color.background
-
-        if color.background:
+        # Tokens (and their colors) are shared, so they must not be modified
+        if color.background != invert:
             style = "background-" + style
 
         return style
@@ -2,17 +2,39 @@
 
 from __future__ import annotations
 
+import sys
 from typing import Iterator
 
+from wcwidth import wcwidth
 from wcwidth import wrap as wcwidth_wrap
 
-from .regex import real_length
+from .regex import RE_SEQUENCE, real_length
 
 __all__ = [
     "break_line",
+    "slice_ansi",
+    "clip_ansi",
 ]
 
 
+def _fits_unchanged(segment: str, limit: int) -> bool:
+    """Determines whether wrapping would return the segment as-is, as a single line.
+
+    This is the case for plain text, optionally followed by a reset, that fits within
+    the limit. Text with other sequences, trailing whitespace or non-printable
+    characters is modified by wrapping, so it is not considered.
+    """
+
+    text = segment[:-4] if segment.endswith("\x1b[0m") else segment
+
+    return (
+        text != ""
+        and text.isprintable()
+        and not text[-1].isspace()
+        and real_length(text) <= limit
+    )
+
+
 def break_line(
     line: str, limit: int, non_first_limit: int | None = None, fill: str | None = None
 ) -> Iterator[str]:
@@ -53,8 +75,118 @@ def break_line(
             limit = non_first_limit
             continue
 
+        if _fits_unchanged(segment, limit):
+            yield _pad_line(segment, limit)
+            limit = non_first_limit
+            continue
+
         wrapped = wcwidth_wrap(segment, limit)
 
         for wrapped_line in wrapped:
             yield _pad_line(wrapped_line, limit)
             limit = non_first_limit
+
+
+def _slice_plain(text: str, col: int, start: int, end: int, parts: list[str]) -> int:
+    """Adds the part of some text without sequences that falls within [start, end).
+
+    Wide characters that are cut in half are replaced by spaces, so the output
+    always spans the exact columns that were visible.
+
+    Args:
+        text: The text, which contains no escape sequences.
+        col: The column the text starts at.
+        start: The first column to keep.
+        end: The column to stop before.
+        parts: The list the kept text is appended to.
+
+    Returns:
+        The column after the text. Once this goes past `end`, the rest of the text
+        is not measured.
+    """
+
+    if text.isascii() and text.isprintable():
+        parts.append(text[max(start - col, 0) : end - col])
+        return col + len(text)
+
+    for char in text:
+        width = max(wcwidth(char), 0)
+
+        if width == 0:
+            # Combining characters belong to the visible character before them
+            if start < col <= end:
+                parts.append(char)
+
+        elif start <= col and col + width <= end:
+            parts.append(char)
+
+        elif col < end and col + width > start:
+            parts.append(" " * (min(col + width, end) - max(col, start)))
+
+        col += width
+
+        if col > end:
+            break
+
+    return col
+
+
+def slice_ansi(text: str, start: int, end: int | None = None) -> str:
+    """Slices text by display columns, keeping its escape sequences.
+
+    The text is processed in a single pass. Styles & links opened before `start`
+    are kept, so the slice looks the same as it did within the whole text. After
+    `end`, only SGR & OSC sequences are kept, so styles and links still get closed.
+
+    Args:
+        text: The text to slice. May contain ANSI sequences & wide characters.
+        start: The first column to keep.
+        end: The column to stop before. If not given, the rest of the text is kept.
+
+    Returns:
+        The columns in [start, end) of the text.
+    """
+
+    if "\x1b" not in text and text.isascii() and text.isprintable():
+        return text[max(start, 0) : end]
+
+    start = max(start, 0)
+
+    if end is None:
+        end = sys.maxsize
+
+    parts: list[str] = []
+    col = 0
+    cursor = 0
+
+    for matchobj in RE_SEQUENCE.finditer(text):
+        seq_start, seq_end = matchobj.span()
+
+        if cursor < seq_start and col < end:
+            col = _slice_plain(text[cursor:seq_start], col, start, end, parts)
+
+        if col < end or matchobj.group(2) == "m" or matchobj.group(3) is not None:
+            parts.append(matchobj.group())
+
+        cursor = seq_end
+
+    if cursor < len(text) and col < end:
+        _slice_plain(text[cursor:], col, start, end, parts)
+
+    return "".join(parts)
+
+
+def clip_ansi(text: str, width: int) -> str:
+    """Clips text to some amount of display columns, keeping its escape sequences.
+
+    This is a shorthand for `slice_ansi(text, 0, width)`.
+
+    Args:
+        text: The text to clip.
+        width: The most columns the output may span.
+
+    Returns:
+        The clipped text.
+    """
+
+    return slice_ansi(text, 0, width)
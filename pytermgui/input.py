@@ -89,6 +89,18 @@ def feed(text: str) -> None:
     feeder_stream.seek(0)
 
 
+def _pop_fed_text() -> str:
+    """Returns & clears the text given to `feed`, if there is any."""
+
+    fed_text = feeder_stream.getvalue()
+
+    if fed_text != "":
+        feeder_stream.seek(0)
+        feeder_stream.truncate(0)
+
+    return fed_text
+
+
 class _GetchUnix:
     """Getch implementation for UNIX systems."""
 
@@ -423,11 +435,9 @@ def getch(
             no input is available) isn't silenced.
     """
 
-    fed_text = feeder_stream.getvalue()
+    fed_text = _pop_fed_text()
 
     if fed_text != "":
-        feeder_stream.seek(0)
-        feeder_stream.truncate(0)
         return fed_text
 
     try:
@@ -1,6 +1,8 @@
 """Everything related to the TIM language."""
 
 from . import tokens
+from .compiled import *
 from .language import *
 from .parsing import *
+from .stream import *
 from .tokens import *
@@ -0,0 +1,173 @@
+"""Markup templates that are parsed ahead of time, and formatted on every call."""
+
+from __future__ import annotations
+
+import re
+from string import Formatter
+from typing import TYPE_CHECKING, Any, Match
+
+from ..exceptions import MarkupSyntaxError
+from .parsing import parse_tokens, tokenize_markup
+from .tokens import PlainToken, Token
+
+if TYPE_CHECKING:
+    from .language import MarkupLanguage
+
+__all__ = ["CompiledMarkup"]
+
+RE_PLACEHOLDER = re.compile("\ue000(\\d+)\ue001")
+
+_FORMATTER = Formatter()
+
+
+class CompiledMarkup:  # pylint: disable=too-many-instance-attributes
+    """Markup with placeholders, parsed ahead of time.
+
+    These are created by `MarkupLanguage.compile`. The template is parsed with a
+    sentinel in place of every placeholder, and the result is split around them. Calls
+    then only have to join the values with these parsed segments.
+
+    Placeholders within the scope of a macro cannot be parsed ahead of time, as the
+    macro has to be applied to their values. Templates that use macros fall back to
+    parsing their tokens on every call, which still skips tokenization.
+
+    The template is recompiled if the language's aliases or macros change.
+    """
+
+    def __init__(
+        self,
+        lang: MarkupLanguage,
+        template: str,
+        optimize: bool = False,
+        append_reset: bool = True,
+    ) -> None:
+        """Initializes the compiled markup.
+
+        Args:
+            lang: The language whose context is used for parsing.
+            template: The markup to compile, with `str.format`-style placeholders.
+            optimize: See `MarkupLanguage.parse`.
+            append_reset: See `MarkupLanguage.parse`.
+
+        Raises:
+            MarkupSyntaxError: A placeholder is used within a tag.
+        """
+
+        self.lang = lang
+        self.template = template
+        self.optimize = optimize
+        self.append_reset = append_reset
+
+        self._fields: list[tuple[str, str | None, str]] = []
+        self._markup = ""
+        auto_index = 0
+        placeholders = []
+
+        for literal, name, spec, conversion in _FORMATTER.parse(template):
+            self._markup += literal
+
+            if name is None:
+                continue
+
+            placeholders.append(
+                "{"
+                + name
+                + (f"!{conversion}" if conversion else "")
+                + (f":{spec}" if spec else "")
+                + "}"
+            )
+
+            if name == "":
+                name = str(auto_index)
+                auto_index += 1
+
+            self._markup += f"\ue000{len(self._fields)}\ue001"
+            self._fields.append((name, conversion, spec or ""))
+
+        # Tags are looked up as a whole, so their values can't be inserted later
+        for token in tokenize_markup(self._markup):
+            if not token.is_plain() and RE_PLACEHOLDER.search(token.markup):
+                tag = RE_PLACEHOLDER.sub(
+                    lambda matchobj: placeholders[int(matchobj.group(1))],
+                    token.markup,
+                )
+
+                raise MarkupSyntaxError(
+                    tag,
+                    "uses a placeholder, which can't be inserted into tags",
+                    template,
+                )
+
+        self._tokens: list[Token] = []
+        self._segments: list[str] | None = None
+        self._version = -1
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.template!r})"
+
+    def _compile(self) -> None:
+        """Parses the template using the current context of the language."""
+
+        self._version = self.lang._version  # pylint: disable=protected-access
+        self._tokens = list(tokenize_markup(self._markup))
+        self._segments = None
+
+        if any(token.is_macro() for token in self._tokens):
+            return
+
+        output = self._parse(self._tokens)
+        pieces = RE_PLACEHOLDER.split(output)
+
+        # Every other piece is a placeholder's index, they must all be intact & ordered
+        if pieces[1::2] == [str(i) for i in range(len(self._fields))]:
+            self._segments = pieces[::2]
+
+    def _parse(self, tokens: list[Token]) -> str:
+        """Parses the given tokens using the language's settings."""
+
+        return parse_tokens(
+            tokens,
+            optimize=self.optimize,
+            append_reset=self.append_reset,
+            context=self.lang.context,
+            ignore_unknown_tags=not self.lang.strict,
+        )
+
+    def __call__(self, *args: Any, **kwargs: Any) -> str:
+        """Formats the template with the given values.
+
+        Returns:
+            The parsed, ANSI-coded result.
+        """
+
+        if self._version != self.lang._version:  # pylint: disable=protected-access
+            self._compile()
+
+        values = []
+
+        for name, conversion, spec in self._fields:
+            value, _ = _FORMATTER.get_field(name, args, kwargs)
+            value = _FORMATTER.convert_field(value, conversion)
+
+            values.append(_FORMATTER.format_field(value, spec))
+
+        if self._segments is not None:
+            parts = [self._segments[0]]
+
+            for value, segment in zip(values, self._segments[1:]):
+                parts.append(value)
+                parts.append(segment)
+
+            return "".join(parts)
+
+        def _insert(matchobj: Match) -> str:
+            return values[int(matchobj.group(1))]
+
+        tokens = [
+            PlainToken(RE_PLACEHOLDER.sub(_insert, token.value))
+            if token.is_plain()
+            else token
+            for token in self._tokens
+        ]
+
+        return self._parse(tokens)
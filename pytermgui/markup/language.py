@@ -3,17 +3,26 @@
 from __future__ import annotations
 
 import os
+import pickle
+import sys
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
 from functools import cached_property
-from typing import Callable, Generator, Iterator, Match
+from itertools import islice
+from typing import Any, Callable, Generator, Iterable, Iterator, Match
 
+from ..cache import CacheInfo, LRUCache
 from ..colors import Color, ColorSyntaxError, str_to_color
+from ..exceptions import MarkupSyntaxError
 from ..regex import RE_MARKUP
 from ..term import get_terminal
 from .aliases import apply_default_aliases
+from .compiled import CompiledMarkup
 from .macros import apply_default_macros
 from .parsing import (
     PARSERS,
+    RESET,
     ContextDict,
     MacroType,
     create_context_dict,
@@ -23,8 +32,10 @@ from .parsing import (
     tokenize_markup,
     tokens_to_markup,
 )
+from .stream import MarkupStream
 from .style_maps import CLEARERS
 from .tokens import Token
+from .workers import init_worker, parse_chunk
 
 STRICT_MARKUP = bool(os.getenv("PTG_STRICT_MARKUP"))
 
@@ -49,12 +60,15 @@ def escape(text: str) -> str:
     return RE_MARKUP.sub(_repl, text)
 
 
-class MarkupLanguage:
+class MarkupLanguage:  # pylint: disable=too-many-instance-attributes
     """A relatively simple object that binds context to TIM parsing functions.
 
     Most of the job this class has is to pass along a `ContextDict` to various
     "lower level" functions, in order to maintain a sort of state. It also exposes
     ways to modify this state, namely the `alias` and `define` methods.
+
+    Parsed text is kept in a bounded, least-recently-used cache. Its size can be set
+    per instance, and its statistics are available through `cache_info`.
     """
 
     def __init__(
@@ -63,12 +77,37 @@ class MarkupLanguage:
         strict: bool = False,
         default_aliases: bool = True,
         default_macros: bool = True,
+        cache_size: int | None = 1024,
+        cache_bytes: int | None = None,
     ) -> None:
-        self._cache: dict[tuple[str, bool, bool], tuple[str, list[Token], bool]] = {}
+        """Initializes the language.
+
+        Args:
+            strict: If set, unknown tags raise an error instead of being ignored.
+            default_aliases: Whether the default aliases should be defined.
+            default_macros: Whether the default macros should be defined.
+            cache_size: The most parse results that are cached. `None` means
+                unbounded, and `0` disables caching.
+            cache_bytes: The largest approximate memory use of the cached parse
+                results, in bytes. `None` means unbounded.
+        """
+
+        self._cache: LRUCache[
+            tuple[str, list[Token], bool, frozenset[str]]
+        ] = LRUCache(cache_size, cache_bytes)
+
+        # The tags referenced by the value of each alias, and the reverse of that
+        self._alias_references: dict[str, frozenset[str]] = {}
+        self._alias_dependents: dict[str, set[str]] = {}
+
+        # Incremented whenever the context changes, so compiled markup knows to update
+        self._version = 0
 
         self.context = create_context_dict()
         self._aliases = self.context["aliases"]
         self._macros = self.context["macros"]
+        self._alias_tokens = self.context["alias_tokens"]
+        self._pure_macros: set[str] = set()
 
         if default_aliases:
             apply_default_aliases(self)
@@ -90,15 +129,46 @@ class MarkupLanguage:
 
         return self._macros.copy()
 
+    @property
+    def version(self) -> int:
+        """Returns a counter that is incremented whenever the context changes.
+
+        Anything that caches parsed markup can compare this to know when to update.
+        """
+
+        return self._version
+
+    def has_impure_macro(self, text: str) -> bool:
+        """Determines whether some markup calls any macros that weren't defined as pure.
+
+        The output of such markup might change between calls, so it shouldn't be
+        cached.
+        """
+
+        if "!" not in text:
+            return False
+
+        return any(
+            token.is_macro() and token.value not in self._pure_macros
+            for token in tokenize_markup(text)
+        )
+
     def clear_cache(self) -> None:
         """Clears the internal cache.
 
-        Use this after re-defining aliases.
+        Defining aliases & macros only invalidates the cached results that use them,
+        so this is only needed after modifying `context` directly.
         """
 
         self._cache.clear()
+        self._version += 1
 
-    def define(self, name: str, method: MacroType) -> None:
+    def cache_info(self) -> CacheInfo:
+        """Returns the hit, miss & eviction counts and size of the parse cache."""
+
+        return self._cache.info()
+
+    def define(self, name: str, method: MacroType, *, pure: bool = False) -> None:
         """Defines a markup macro.
 
         Macros are essentially function bindings callable within markup. They can be
@@ -110,6 +180,9 @@ class MarkupLanguage:
             method: The function bound to the name given above. This function will take
                 any number of strings as arguments, and return a terminal-ready (i.e. parsed)
                 string.
+            pure: Set this if the output of the macro only depends on its arguments.
+                Markup using only pure macros is cached like any other, while markup
+                using impure ones (like a clock) is re-parsed on every call.
         """
 
         if not name.startswith("!"):
@@ -117,6 +190,15 @@ class MarkupLanguage:
 
         self._macros[name] = method
 
+        if pure:
+            self._pure_macros.add(name)
+        else:
+            self._pure_macros.discard(name)
+
+        # Cached results may contain the output of the previous definition
+        self._invalidate({name})
+        self._version += 1
+
     def alias(self, name: str, value: str, *, generate_unsetter: bool = True) -> None:
         """Creates an alias from one custom name to a set of styles.
 
@@ -163,9 +245,87 @@ class MarkupLanguage:
             return unsetter.lstrip(" ")
 
         self._aliases[name] = value
+        changed = {name}
 
         if generate_unsetter:
             self._aliases[f"/{name}"] = _generate_unsetter()
+            changed.add(f"/{name}")
+
+        self._invalidate(self._compile_aliases(changed))
+        self._version += 1
+
+    def _compile_aliases(self, names: set[str]) -> set[str]:
+        """Flattens the given aliases, and all aliases that depend on them.
+
+        The flattened tokens are stored in the `alias_tokens` sub-dict of the context,
+        and used by `pytermgui.markup.parsing.parse_tokens` instead of expanding the
+        alias on every parse.
+
+        Args:
+            names: The aliases whose values changed.
+
+        Returns:
+            The names of all aliases affected by the change.
+        """
+
+        affected: set[str] = set()
+        queue = list(names)
+
+        while len(queue) > 0:
+            name = queue.pop()
+
+            if name in affected:
+                continue
+
+            affected.add(name)
+            queue.extend(self._alias_dependents.get(name, ()))
+
+            for reference in self._alias_references.get(name, ()):
+                self._alias_dependents[reference].discard(name)
+
+            value = self._aliases[name]
+
+            try:
+                references = frozenset(
+                    token.value for token in tokenize_markup(f"[{value}]")
+                )
+                self._alias_tokens[name] = tuple(
+                    tokenize_markup(f"[{eval_alias(value, self.context)}]")
+                )
+
+            # Invalid aliases are left to raise when they are used
+            except MarkupSyntaxError:
+                references = frozenset(value.split())
+                self._alias_tokens.pop(name, None)
+
+            self._alias_references[name] = references
+
+            for reference in references:
+                self._alias_dependents.setdefault(reference, set()).add(name)
+
+        return affected
+
+    def _get_dependencies(self, tags: set[str]) -> frozenset[str]:
+        """Gets the given tags, and all tags the aliases among them reference."""
+
+        dependencies: set[str] = set()
+        queue = list(tags)
+
+        while len(queue) > 0:
+            tag = queue.pop()
+
+            if tag in dependencies:
+                continue
+
+            dependencies.add(tag)
+            queue.extend(self._alias_references.get(tag, ()))
+
+        return frozenset(dependencies)
+
+    def _invalidate(self, tags: set[str]) -> None:
+        """Removes the cached results that depend on any of the given tags."""
+
+        self._cache.remove_if(lambda _, entry: not entry[3].isdisjoint(tags))
 
     def alias_multiple(self, *, generate_unsetter: bool = True, **items: str) -> None:
         """Runs `MarkupLanguage.alias` repeatedly for all arguments.
@@ -196,6 +356,7 @@ class MarkupLanguage:
         text: str,
         optimize: bool = False,
         append_reset: bool = True,
+        cache: bool = True,
     ) -> str:
         """Parses some markup text.
 
@@ -211,20 +372,28 @@ class MarkupLanguage:
 
             return parse(*args, **kwargs)
         ```
+
+        Set `cache` to False for text that is unlikely to be parsed again, like the
+        value of a clock. It is then neither looked up in, nor added to the cache, so
+        it doesn't evict more useful entries.
         """
 
+        # Text without tags is returned as-is, without filling the cache with it
+        if "[" not in text:
+            return text + RESET if append_reset else text
+
         key = (text, optimize, append_reset)
 
-        cache_hit = self._cache.get(key)
+        cache_hit = self._cache.get(key) if cache else None
         if cache_hit is not None:
-            cached, tokens, has_macro = cache_hit
+            cached, tokens, has_impure_macro, _ = cache_hit
 
-            # Re-parse using known tokens when macro is present
+            # Re-parse using known tokens when an impure macro is present
             #
             # This saves a tiny fraction of time (around 0.2ms) when parsing
             # macros, for a loss of an even smaller time for the general,
             # non-macro usecase.
-            if has_macro:
+            if has_impure_macro:
                 output = parse_tokens(
                     tokens,
                     optimize=optimize,
@@ -247,12 +416,160 @@ class MarkupLanguage:
             ignore_unknown_tags=not self.strict,
         )
 
-        has_macro = any(token.is_macro() for token in tokens)
-
-        self._cache[key] = (output, tokens, has_macro)
+        if cache:
+            has_impure_macro = any(
+                token.is_macro() and token.value not in self._pure_macros
+                for token in tokens
+            )
+            size = sys.getsizeof(text) + sys.getsizeof(output)
+
+            # Any of these may be, or become, an alias or macro
+            dependencies = self._get_dependencies(
+                {
+                    token.value
+                    for token in tokens
+                    if token.is_alias() or token.is_clear() or token.is_macro()
+                }
+            )
+
+            self._cache.set(
+                key, (output, tokens, has_impure_macro, dependencies), size
+            )
 
         return output
 
+    def compile(
+        self, template: str, optimize: bool = False, append_reset: bool = True
+    ) -> CompiledMarkup:
+        """Compiles markup with placeholders into a reusable formatter.
+
+        The template is parsed only once, so formatting it only joins the values with
+        the already parsed parts:
+
+        ```python3
+        status = tim.compile("[bold 141]{name}[/] [72]{value:>5}")
+
+        for i in range(100):
+            print(status(name="Counter", value=i))
+        ```
+
+        Placeholders use `str.format` syntax, so literal braces need to be doubled.
+        Values are inserted as plain text, any markup within them is not parsed.
+        Placeholders can't be used within tags, e.g. `"[{style}]text"`.
+
+        Args:
+            template: The markup to compile.
+            optimize: See `parse`.
+            append_reset: See `parse`.
+
+        Returns:
+            A callable that takes the placeholders' values as positional or keyword
+            arguments, and returns the parsed result.
+
+        Raises:
+            MarkupSyntaxError: A placeholder is used within a tag.
+        """
+
+        return CompiledMarkup(self, template, optimize, append_reset)
+
+    def stream(self) -> MarkupStream:
+        """Creates a parser for markup that arrives in chunks.
+
+        Styles, links and macros left open in a chunk stay active for the following
+        ones. See `pytermgui.markup.stream.MarkupStream`.
+        """
+
+        return MarkupStream(self)
+
+    def parse_many(  # pylint: disable=too-many-arguments
+        self,
+        texts: Iterable[str],
+        optimize: bool = False,
+        append_reset: bool = True,
+        workers: int | None = None,
+        chunksize: int = 1000,
+    ) -> Iterator[str]:
+        """Parses many pieces of markup, yielding the results in order.
+
+        By default everything is parsed in this process. With `workers` set, the
+        texts are split into chunks of `chunksize`, and parsed by a pool of that many
+        processes. Each process gets a snapshot of this language's aliases, its pure
+        macros that can be pickled, and the terminal's color system. Texts that can't
+        be parsed with the snapshot, like ones using impure macros, are parsed here
+        instead.
+
+        Results are yielded as soon as they are ready, and at most `2 * workers`
+        chunks are in flight at once, so `texts` may be an arbitrarily long iterator.
+
+        Args:
+            texts: The markup to parse.
+            optimize: See `parse`.
+            append_reset: See `parse`.
+            workers: The amount of processes to parse with. If not given, or 1, all
+                parsing happens in this process.
+            chunksize: The amount of texts sent to a process at once.
+
+        Yields:
+            The parsed version of every text, in the same order.
+        """
+
+        # Bulk input is mostly unique, and would only evict more useful cache entries
+        if workers is None or workers <= 1:
+            for text in texts:
+                yield self.parse(text, optimize, append_reset, cache=False)
+
+            return
+
+        iterator = iter(texts)
+        pending: deque[tuple[list[str], Future[list[str | None]]]] = deque()
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_worker,
+            initargs=(type(self), self._get_snapshot()),
+        ) as executor:
+            while True:
+                while len(pending) < 2 * workers:
+                    chunk = list(islice(iterator, chunksize))
+
+                    if len(chunk) == 0:
+                        break
+
+                    future = executor.submit(parse_chunk, chunk, optimize, append_reset)
+                    pending.append((chunk, future))
+
+                if len(pending) == 0:
+                    break
+
+                chunk, future = pending.popleft()
+
+                for text, result in zip(chunk, future.result()):
+                    if result is None:
+                        result = self.parse(text, optimize, append_reset, cache=False)
+
+                    yield result
+
+    def _get_snapshot(self) -> dict[str, Any]:
+        """Gets the picklable state workers need to parse like this language."""
+
+        macros = {}
+
+        for name in self._pure_macros:
+            try:
+                pickle.dumps(self._macros[name])
+
+            except (pickle.PicklingError, AttributeError, TypeError):
+                continue
+
+            macros[name] = self._macros[name]
+
+        return {
+            "aliases": self._aliases.copy(),
+            "macros": macros,
+            "strict": self.strict,
+            "colorsystem": get_terminal().colorsystem,
+        }
+
     # TODO: This should be deprecated.
     @staticmethod
     def get_markup(text: str) -> str:
@@ -9,6 +9,9 @@ from .parsing import parse
 
 DEFAULT_MACROS = {}
 
+PURE_MACROS: set[str] = set()
+"""The names of default macros whose output only depends on their arguments."""
+
 MarkupLanguage = Any  # pylint: disable=invalid-name
 
 
@@ -25,6 +28,15 @@ def export_macro(func: MacroTemplate) -> MacroTemplate:
     return func
 
 
+def export_pure_macro(func: MacroTemplate) -> MacroTemplate:
+    """A decorator to add a function to `DEFAULT_MACROS`, and mark it as pure."""
+
+    export_macro(func)
+    PURE_MACROS.add("!" + "_".join(func.__name__.split("_")[1:]))  # type: ignore
+
+    return func
+
+
 def apply_default_macros(lang: MarkupLanguage) -> None:
     """Applies all macros in `DEFAULT_MACROS`.
 
@@ -33,31 +45,31 @@ def apply_default_macros(lang: MarkupLanguage) -> None:
     """
 
     for name, value in DEFAULT_MACROS.items():
-        lang.define(name, value)
+        lang.define(name, value, pure=name in PURE_MACROS)
 
 
-@export_macro
+@export_pure_macro
 def macro_upper(text: str) -> str:
     """Turns the text into uppercase."""
 
     return text.upper()
 
 
-@export_macro
+@export_pure_macro
 def macro_lower(text: str) -> str:
     """Turns the text into lowercase."""
 
     return text.lower()
 
 
-@export_macro
+@export_pure_macro
 def macro_title(text: str) -> str:
     """Turns the text into titlecase."""
 
     return text.title()
 
 
-@export_macro
+@export_pure_macro
 def macro_align(width: str, alignment: str, content: str) -> str:
     """Aligns given text using fstrings.
 
@@ -108,7 +120,7 @@ def _apply_colors(colors: list[str] | list[int], item: str) -> str:
     return parse(out + "[/fg]", append_reset=False) + "\x1b[0m"
 
 
-@export_macro
+@export_pure_macro
 def macro_rainbow(item: str) -> str:
     """Creates rainbow-colored text."""
 
@@ -117,7 +129,7 @@ def macro_rainbow(item: str) -> str:
     return _apply_colors(colors, item)
 
 
-@export_macro
+@export_pure_macro
 def macro_gradient(base_str: str, item: str) -> str:
     """Creates an xterm-256 gradient from a base color.
 
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Callable, Iterator, Protocol, TypedDict
 from warnings import filterwarnings, warn
 
@@ -36,11 +38,14 @@ STATE_REPLACE = "#/pop"
 
 LINK_TEMPLATE = "\x1b]8;;{uri}\x1b\\{label}\x1b]8;;\x1b\\"
 
+RESET = "\x1b[0m"
+
 STATE_PSEUDOS = [STATE_CUT, STATE_COPY, STATE_REPLACE, STATE_RESTORE]
 PSEUDO_TOKENS = ["#auto", *STATE_PSEUDOS]
 
 __all__ = [
     "ContextDict",
+    "ParserState",
     "create_context_dict",
     "consume_tag",
     "tokenize_markup",
@@ -51,6 +56,7 @@ __all__ = [
     "get_markup",
     "parse",
     "parse_tokens",
+    "parse_tokens_from",
 ]
 
 
@@ -66,10 +72,14 @@ class MacroType(Protocol):  # pylint: disable=too-few-public-methods
 class ContextDict(TypedDict):
     """A dictionary to hold context about a markup language's environment.
 
-    It has two sub-dicts:
+    It has three sub-dicts:
 
     - aliases
     - macros
+    - alias_tokens
+
+    The last one holds the flattened tokens of aliases, so they don't have to be
+    expanded on every parse. It is optional, and filled in by `MarkupLanguage.alias`.
 
     For information about what they do and contain, see the
     [MarkupLanguage docs](/reference/pytermgui/markup/
@@ -78,20 +88,42 @@ class ContextDict(TypedDict):
 
     aliases: dict[str, str]
     macros: dict[str, MacroType]
+    alias_tokens: dict[str, tuple[Token, ...]]
+
+
+@dataclass
+class ParserState:
+    """The state `parse_tokens` keeps while parsing, besides the output.
+
+    Passing the same state to multiple `parse_tokens` calls makes them continue where
+    the previous one left off, e.g. an open link or macro stays active for the next
+    call's text. See `pytermgui.markup.stream.MarkupStream`.
+    """
+
+    link: str | None = None
+    background: Color = field(default_factory=lambda: Color.parse("#000000"))
+    macros: list[MacroToken] = field(default_factory=list)
+    save_state: list[Token] = field(default_factory=list)
 
 
 def create_context_dict() -> ContextDict:
     """Creates a new context dictionary, initializing its sub-dicts.
 
     Returns:
-        A dictionary with `aliases` and `macros` defined as empty sub-dicts.
+        A dictionary with `aliases`, `macros` and `alias_tokens` defined as empty
+        sub-dicts.
     """
 
-    return {"aliases": {}, "macros": {}}
+    return {"aliases": {}, "macros": {}, "alias_tokens": {}}
 
 
+@lru_cache(maxsize=1024)
 def consume_tag(tag: str) -> Token:  # pylint: disable=too-many-return-statements
-    """Consumes a tag text, returns the associated Token."""
+    """Consumes a tag text, returns the associated Token.
+
+    Tokens are immutable, so the results are memoized: consuming the same tag again
+    returns the same, shared instance.
+    """
 
     if tag in STYLES:
         return StyleToken(tag)
@@ -147,6 +179,13 @@ def tokenize_markup(text: str) -> Iterator[Token]:
         The generated tokens, in the order they occur within the markup.
     """
 
+    # Text without brackets can't contain tags or escapes
+    if "[" not in text:
+        if text != "":
+            yield PlainToken(text)
+
+        return
+
     cursor = 0
     length = len(text)
     has_inverse = False
@@ -175,10 +214,10 @@ def tokenize_markup(text: str) -> Iterator[Token]:
             consumed = consume_tag(tag)
             if has_inverse:
                 if consumed.markup == "/fg":
-                    consumed = ClearToken("/fg")
+                    consumed = consume_tag("/fg")
 
                 elif consumed.markup == "/bg":
-                    consumed = ClearToken("/bg")
+                    consumed = consume_tag("/bg")
 
             yield consumed
 
@@ -200,6 +239,13 @@ def tokenize_ansi(  # pylint: disable=too-many-locals, too-many-branches, too-ma
         The generated tokens, in the order they occur within the text.
     """
 
+    # All sequences start with an escape character
+    if "\x1b" not in text:
+        if text != "":
+            yield PlainToken(text)
+
+        return
+
     cursor = 0
 
     for matchobj in RE_ANSI.finditer(text):
@@ -230,83 +276,105 @@ def tokenize_ansi(  # pylint: disable=too-many-locals, too-many-branches, too-ma
 
         cursor = end
 
-        if full.endswith(("J", "K")):
-            continue
+        yield from _decode_csi(full, content)
 
-        code = ""
+    remaining = text[cursor:]
+    if len(remaining) > 0:
+        yield PlainToken(remaining)
 
-        # Position
-        posmatch = RE_POSITION.match(full)
 
-        if posmatch is not None:
-            ypos, xpos = posmatch.groups()
-            if not ypos and not xpos:
-                ypos = xpos = "1"
+@lru_cache(maxsize=1024)
+def _decode_csi(  # pylint: disable=too-many-branches
+    full: str, content: str
+) -> tuple[Token, ...]:
+    """Decodes a CSI sequence into the tokens it represents.
 
-            yield CursorToken(content, int(ypos) or None, int(xpos) or None)
-            continue
+    The same sequences occur over and over when re-tokenizing parsed text, so the
+    results are memoized. Tokens are immutable, so they are safe to share.
 
-        parts = content.split(";")
+    Args:
+        full: The entire sequence.
+        content: The parameters of the sequence.
 
-        state = None
-        color_code = ""
-        for part in parts:
-            if state is None:
-                if part in REVERSE_STYLES:
-                    yield StyleToken(REVERSE_STYLES[part])
-                    continue
+    Returns:
+        The tokens of the sequence. Erase sequences result in no tokens.
+    """
 
-                if part in REVERSE_CLEARERS:
-                    yield ClearToken(REVERSE_CLEARERS[part])
-                    continue
+    if full.endswith(("J", "K")):
+        return ()
 
-                if part in ("38", "48"):
-                    state = "COLOR"
-                    color_code += part + ";"
-                    continue
+    code = ""
 
-                # standard colors
-                try:
-                    yield ColorToken(part, Color.parse(part, localize=False))
-                    continue
+    # Position
+    posmatch = RE_POSITION.match(full)
+
+    if posmatch is not None:
+        ypos, xpos = posmatch.groups()
+        if not ypos and not xpos:
+            ypos = xpos = "1"
+
+        return (CursorToken(content, int(ypos) or None, int(xpos) or None),)
 
-                except ColorSyntaxError as exc:
-                    raise ValueError(f"Could not parse color tag {part!r}.") from exc
+    tokens: list[Token] = []
+    parts = content.split(";")
 
-            if state != "COLOR":
+    state = None
+    color_code = ""
+    for part in parts:
+        if state is None:
+            if part in REVERSE_STYLES:
+                tokens.append(consume_tag(REVERSE_STYLES[part]))
                 continue
 
-            color_code += part + ";"
+            if part in REVERSE_CLEARERS:
+                tokens.append(consume_tag(REVERSE_CLEARERS[part]))
+                continue
 
-            # Ignore incomplete RGB colors
-            if (
-                color_code.startswith(("38;2;", "48;2;"))
-                and len(color_code.split(";")) != 6
-            ):
+            if part in ("38", "48"):
+                state = "COLOR"
+                color_code += part + ";"
                 continue
 
+            # standard colors
             try:
-                code = color_code
+                tokens.append(ColorToken(part, Color.parse(part, localize=False)))
+                continue
 
-                if code.startswith(("38;2;", "48;2;", "38;5;", "48;5;")):
-                    stripped = code[5:-1]
+            except ColorSyntaxError as exc:
+                raise ValueError(f"Could not parse color tag {part!r}.") from exc
 
-                    if code.startswith("4"):
-                        stripped = "@" + stripped
+        if state != "COLOR":
+            continue
 
-                    code = stripped
+        color_code += part + ";"
 
-                yield ColorToken(code, Color.parse(code, localize=False))
+        # Ignore incomplete RGB colors
+        if (
+            color_code.startswith(("38;2;", "48;2;"))
+            and len(color_code.split(";")) != 6
+        ):
+            continue
 
-            except ColorSyntaxError:
-                continue
+        try:
+            code = color_code
 
-            state = None
-            color_code = ""
+            if code.startswith(("38;2;", "48;2;", "38;5;", "48;5;")):
+                stripped = code[5:-1]
 
-    remaining = text[cursor:]
-    if len(remaining) > 0:
-        yield PlainToken(remaining)
+                if code.startswith("4"):
+                    stripped = "@" + stripped
+
+                code = stripped
+
+            tokens.append(ColorToken(code, Color.parse(code, localize=False)))
+
+        except ColorSyntaxError:
+            continue
+
+        state = None
+        color_code = ""
+
+    return tuple(tokens)
 
 
 def eval_alias(text: str, context: ContextDict) -> str:
@@ -637,6 +705,7 @@ def _sub_aliases(tokens: list[Token], context: ContextDict) -> list[Token]:
     """
 
     output: list[Token] = []
+    alias_tokens = context.get("alias_tokens", {})
 
     # It's more computationally efficient to create this lambda once and reuse it
     # every time. There is no need to define a full function, as it just returns
@@ -651,6 +720,12 @@ def _sub_aliases(tokens: list[Token], context: ContextDict) -> list[Token]:
         if token.value in context["aliases"] and (
             Token.is_clear(token) or Token.is_macro(token) or Token.is_alias(token)
         ):
+            flattened = alias_tokens.get(token.value)
+
+            if flattened is not None:
+                output.extend(flattened)
+                continue
+
             if Token.is_clear(token) or Token.is_macro(token):
                 token = AliasToken(token.value)
 
@@ -676,8 +751,7 @@ def _sub_aliases(tokens: list[Token], context: ContextDict) -> list[Token]:
     return output
 
 
-# This function could be broken up into pieces, but that will likely lose readability.
-def parse_tokens(  # pylint: disable=too-many-branches, too-many-locals, too-many-statements
+def parse_tokens(
     tokens: list[Token],
     *,
     optimize: bool = False,
@@ -708,6 +782,68 @@ def parse_tokens(  # pylint: disable=too-many-branches, too-many-locals, too-man
 
     token_list = _sub_aliases(tokens, context)
 
+    if optimize:
+        token_list = list(optimize_tokens(token_list))
+
+    if append_reset:
+        token_list.append(ClearToken("/"))
+
+    return _parse_token_list(
+        token_list, tokens, context, ignore_unknown_tags, ParserState()
+    )
+
+
+def parse_tokens_from(
+    state: ParserState,
+    tokens: list[Token],
+    *,
+    context: ContextDict | None = None,
+    ignore_unknown_tags: bool = True,
+) -> str:
+    """Parses a stream of tokens, continuing from the given state.
+
+    Nothing is appended to reset the styles at the end, as the following tokens may
+    rely on them. See `pytermgui.markup.stream.MarkupStream`.
+
+    Args:
+        state: The state to start parsing from, updated in place.
+        tokens: Any list of Tokens.
+        context: See `parse_tokens`.
+        ignore_unknown_tags: See `parse_tokens`.
+
+    Returns:
+        The ANSI-coded string that the token stream represents.
+    """
+
+    if context is None:
+        context = create_context_dict()
+
+    return _parse_token_list(
+        _sub_aliases(tokens, context), tokens, context, ignore_unknown_tags, state
+    )
+
+
+# This function could be broken up into pieces, but that will likely lose readability.
+def _parse_token_list(  # pylint: disable=too-many-branches, too-many-locals
+    token_list: list[Token],
+    tokens: list[Token],
+    context: ContextDict,
+    ignore_unknown_tags: bool,
+    state: ParserState,
+) -> str:
+    """Parses tokens whose aliases were already substituted.
+
+    Args:
+        token_list: The tokens to parse.
+        tokens: The tokens given by the caller, used by the state pseudo tags.
+        context: See `parse_tokens`.
+        ignore_unknown_tags: See `parse_tokens`.
+        state: The state to start parsing from, updated in place.
+
+    Returns:
+        The ANSI-coded string that the tokens represent.
+    """
+
     # It's more computationally efficient to create this lambda once and reuse it
     # every time. There is no need to define a full function, as it just returns
     # a function return.
@@ -717,20 +853,14 @@ def parse_tokens(  # pylint: disable=too-many-branches, too-many-locals, too-man
         )
     )
 
-    if optimize:
-        token_list = list(optimize_tokens(token_list))
-
-    if append_reset:
-        token_list.append(ClearToken("/"))
-
-    link = None
+    link = state.link
     output = ""
     segment = ""
-    background = Color.parse("#000000")
-    macros: list[MacroToken] = []
+    background = state.background
+    macros = state.macros
     unknown_aliases: list[Token] = []
 
-    save_state: list[Token] = []
+    save_state = state.save_state
 
     for i, token in enumerate(token_list):
         if token.is_plain():
@@ -754,6 +884,10 @@ def parse_tokens(  # pylint: disable=too-many-branches, too-many-locals, too-man
             continue
 
         if Token.is_macro(token):
+            # Re-opening a macro moves it to the end, so streams don't pile them up
+            if token in macros:
+                macros.remove(token)
+
             macros.append(token)
             continue
 
@@ -804,6 +938,9 @@ def parse_tokens(  # pylint: disable=too-many-branches, too-many-locals, too-man
 
     output += segment
 
+    state.link = link
+    state.background = background
+
     return output
 
 
@@ -831,6 +968,14 @@ def parse(
         The ANSI-coded string that the markup represents.
     """
 
+    # Text without tags only gets the resets of the `[/]` below and `append_reset`,
+    # which `optimize` collapses into one
+    if "[" not in text:
+        if not append_reset:
+            return text
+
+        return text + (RESET if optimize else RESET * 2)
+
     if context is None:
         context = create_context_dict()
 
@@ -0,0 +1,143 @@
+"""Incremental parsing of markup that arrives in chunks."""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from ..screen import DEFAULT_STYLE, Style, apply_sgr
+from .parsing import RESET, ParserState, parse_tokens_from, tokenize_markup
+
+if TYPE_CHECKING:
+    from .language import MarkupLanguage
+
+__all__ = ["MarkupStream"]
+
+RE_SGR = re.compile(r"\x1b\[([\d;:]*)m")
+
+# A tag that isn't closed yet, or an escape sequence that isn't terminated yet. Neither
+# can span lines, so unmatched brackets don't hold back the lines following them.
+RE_INCOMPLETE = re.compile(
+    r"(?:(?<!\x1b)\[[^\[\]\n]*|\x1b(?:\[[\d;:?]*|\](?:(?!\x1b\\)[^\x07\n])*)?)\Z"
+)
+
+
+class MarkupStream:
+    """A parser for markup that arrives in chunks, like the lines of a log.
+
+    Unlike calling `MarkupLanguage.parse` on every chunk, styles, links and macros
+    that are left open stay active for the following chunks, and no resets are added
+    in-between them. Tags and escape sequences that are split across chunks are held
+    back until they are complete.
+
+    Only the state of open tags is kept, so memory use does not grow with the
+    amount of text parsed:
+
+    ```python3
+    from pytermgui import tim
+
+    stream = tim.stream()
+
+    with open("build.log", "r") as log:
+        for output in stream.parse(log):
+            print(output, end="")
+    ```
+    """
+
+    max_pending = 4096
+    """The longest incomplete tag that is held back. Longer ones are output as-is."""
+
+    def __init__(self, lang: MarkupLanguage) -> None:
+        """Initializes the stream.
+
+        Args:
+            lang: The language whose context is used for parsing.
+        """
+
+        self.lang = lang
+
+        self._pending = ""
+        self._state = ParserState()
+        self._style = DEFAULT_STYLE
+
+    @property
+    def style(self) -> Style:
+        """Returns the style active at the end of the output so far."""
+
+        return self._style._replace(link=self._state.link)
+
+    def feed(self, chunk: str) -> str:
+        """Parses a chunk of markup, which may also contain ANSI sequences.
+
+        Args:
+            chunk: The next piece of the text.
+
+        Returns:
+            The ANSI-coded output of the chunk. Anything held back is output once the
+            following chunks complete it, or `close` is called.
+        """
+
+        text = self._pending + chunk
+
+        matchobj = RE_INCOMPLETE.search(text)
+        if matchobj is None or len(text) - matchobj.start() > self.max_pending:
+            self._pending = ""
+
+        else:
+            self._pending = text[matchobj.start() :]
+            text = text[: matchobj.start()]
+
+        return self._parse(text)
+
+    def close(self) -> str:
+        """Outputs anything held back, and resets all styles.
+
+        The stream can be reused afterwards, starting from a clean state.
+
+        Returns:
+            The remaining output.
+        """
+
+        output = self._parse(self._pending)
+
+        if self._style != DEFAULT_STYLE:
+            output += RESET
+
+        self._pending = ""
+        self._state = ParserState()
+        self._style = DEFAULT_STYLE
+
+        return output
+
+    def parse(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Parses chunks of markup, and closes the stream at the end.
+
+        Args:
+            chunks: Any iterable of strings, such as a file object.
+
+        Yields:
+            The output of each chunk, and finally the output of `close`.
+        """
+
+        for chunk in chunks:
+            yield self.feed(chunk)
+
+        yield self.close()
+
+    def _parse(self, text: str) -> str:
+        """Parses a complete piece of text, and updates the tracked style."""
+
+        if text == "":
+            return ""
+
+        output = parse_tokens_from(
+            self._state,
+            list(tokenize_markup(text)),
+            context=self.lang.context,
+            ignore_unknown_tags=not self.lang.strict,
+        )
+
+        for params in RE_SGR.findall(output):
+            self._style = apply_sgr(self._style, params)
+
+        return output
@@ -6,8 +6,7 @@ generate.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from functools import cached_property
+from dataclasses import dataclass, fields
 from typing import TYPE_CHECKING, Any, Generator, Iterator
 
 from typing_extensions import TypeGuard
@@ -39,17 +38,26 @@ class Token:
 
     They are meant to be immutable (frozen), and generated by some tokenization. They are also
     static representations of the data in its pre-parsed form.
+
+    Tokens are slotted, and the ones returned by `pytermgui.markup.parsing.consume_tag`
+    are shared between all uses of the same tag.
     """
 
+    __slots__ = ()
+
     value: str
 
-    @cached_property
+    def __reduce__(self) -> tuple[type, tuple[Any, ...]]:
+        # Frozen, slotted dataclasses can't have their state restored by setattr
+        return type(self), tuple(getattr(self, field.name) for field in fields(self))
+
+    @property
     def markup(self) -> str:
         """Returns markup representing this token."""
 
         return self.value
 
-    @cached_property
+    @property
     def prettified_markup(self) -> str:
         """Returns syntax-highlighted markup representing this token."""
 
@@ -137,9 +145,11 @@ class PlainToken(Token):
 class PseudoToken(Token):
     """A token that can modify it's context, but doesn't hold information of its own."""
 
+    __slots__ = ("value",)
+
     value: str
 
-    @cached_property
+    @property
     def prettified_markup(self) -> str:
         return f"[245 italic]{self.markup}[/]"
 
@@ -152,16 +162,16 @@ class ColorToken(Token):
     that it represents.
     """
 
-    __slots__ = ("value",)
+    __slots__ = ("value", "color")
 
     value: str
     color: Color
 
-    @cached_property
+    @property
     def markup(self) -> str:
         return self.color.markup
 
-    @cached_property
+    @property
     def prettified_markup(self) -> str:
         clearer = "bg" if self.color.background else "fg"
 
@@ -217,7 +227,7 @@ class ClearToken(Token):
 
     value: str
 
-    @cached_property
+    @property
     def prettified_markup(self) -> str:
         target = self.markup[1:]
 
@@ -281,13 +291,13 @@ class MacroToken(Token):
     def __iter__(self) -> Iterator[Any]:
         return iter((self.value, self.arguments))
 
-    @cached_property
+    @property
     def prettified_markup(self) -> str:
         target = self.markup[1:]
 
         return f"[210 bold]![/]{target}"
 
-    @cached_property
+    @property
     def markup(self) -> str:
         return f"{self.value}" + (
             f"({':'.join(self.arguments)})" if len(self.arguments) > 0 else ""
@@ -305,11 +315,11 @@ class HLinkToken(Token):
 
     value: str
 
-    @cached_property
+    @property
     def markup(self) -> str:
         return f"~{self.value}"
 
-    @cached_property
+    @property
     def prettified_markup(self) -> str:
         return f"[{self.markup}]~[blue underline]{self.value}[/fg /underline /~]"
 
@@ -336,6 +346,6 @@ class CursorToken(Token):
     def __fancy_repr__(self) -> Generator[FancyYield, None, None]:
         yield self.__repr__()
 
-    @cached_property
+    @property
     def markup(self) -> str:
         return f"({self.value})"
@@ -0,0 +1,61 @@
+"""The functions run by the worker processes of `MarkupLanguage.parse_many`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from ..exceptions import MarkupSyntaxError
+from ..term import get_terminal
+
+if TYPE_CHECKING:
+    from .language import MarkupLanguage
+
+__all__ = ["init_worker", "parse_chunk"]
+
+_WORKER_LANG: MarkupLanguage | None = None
+
+
+def init_worker(language: type[MarkupLanguage], snapshot: dict[str, Any]) -> None:
+    """Sets up the language of a `MarkupLanguage.parse_many` worker process.
+
+    Args:
+        language: The type of language to create.
+        snapshot: The state of the language that started the worker.
+    """
+
+    global _WORKER_LANG  # pylint: disable=global-statement
+
+    get_terminal().forced_colorsystem = snapshot["colorsystem"]
+
+    _WORKER_LANG = language(
+        strict=snapshot["strict"], default_aliases=False, default_macros=False
+    )
+
+    for name, value in snapshot["aliases"].items():
+        _WORKER_LANG.alias(name, value, generate_unsetter=False)
+
+    for name, method in snapshot["macros"].items():
+        _WORKER_LANG.define(name, method, pure=True)
+
+
+def parse_chunk(
+    chunk: list[str], optimize: bool, append_reset: bool
+) -> list[str | None]:
+    """Parses a chunk of texts in a worker process.
+
+    Texts that fail to parse are returned as None, so they can be retried by the
+    calling process, which knows about all macros.
+    """
+
+    assert _WORKER_LANG is not None
+
+    results: list[str | None] = []
+
+    for text in chunk:
+        try:
+            results.append(_WORKER_LANG.parse(text, optimize, append_reset))
+
+        except MarkupSyntaxError:
+            results.append(None)
+
+    return results
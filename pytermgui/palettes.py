@@ -301,7 +301,6 @@ class Palette:
             lang: The language to run `alias_multiple` on.
         """
 
-        lang.clear_cache()
         lang.alias_multiple(**self.data, generate_unsetter=False)
 
     def __fancy_repr__(self) -> Generator[FancyYield, None, None]:
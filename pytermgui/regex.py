@@ -2,10 +2,12 @@
 
 import re
 from functools import lru_cache
-from typing import Match
+from typing import Iterable, Match
 
 from wcwidth import wcswidth
 
+from .cache import CacheInfo
+
 RE_LINK = re.compile(r"(?:\x1b\]8;;([^\\]*)\x1b\\([^\\]*?)\x1b\]8;;\x1b\\)")
 RE_ANSI_NEW = re.compile(
     rf"(\x1b\[(.*?)[mHJK])|{RE_LINK.pattern}|(\x1b\]8;;\x1b\\)|(\x1b_G(.*?)\x1b\\)"
@@ -17,6 +19,9 @@ RE_MACRO = re.compile(r"(![a-z0-9_\-]+)(?:\(([\w\/\.?\-=:]+)\))?")
 RE_MARKUP = re.compile(r"((\\*)\[([^\[\]]*)\])")
 RE_POSITION = re.compile(r"\x1b\[(\d*?)(?:;(\d*))?H")
 RE_PIXEL_SIZE = re.compile(r"\x1b\[4;([\d]+);([\d]+)t")
+RE_SEQUENCE = re.compile(
+    r"\x1b\[([0-9;:?]*)([@-~])|\x1b\](.*?)(?:\x1b\\|\x07)|\x1b_.*?\x1b\\"
+)
 
 RE_256 = re.compile(r"^([\d]{1,3})$")
 RE_HEX = re.compile(r"#?([0-9a-fA-F]{6})")
@@ -27,13 +32,35 @@ __all__ = [
     "strip_markup",
     "escape_markup",
     "real_length",
+    "real_lengths",
+    "width_cache_info",
+    "clear_width_cache",
 ]
 
+WIDTH_CACHE_SIZE = 4096
+"""The most entries each of the `strip_ansi` and `real_length` caches may hold."""
+
+
+@lru_cache(maxsize=WIDTH_CACHE_SIZE)
+def _strip_ansi(text: str) -> str:
+    """Removes ANSI sequences from text, caching the result."""
+
+    return RE_ANSI.sub("", text)
+
+
+@lru_cache(maxsize=WIDTH_CACHE_SIZE)
+def _real_length(text: str) -> int:
+    """Measures the display-length of text, caching the result."""
+
+    return max(wcswidth(strip_ansi(text)), 0)
+
 
-@lru_cache()
 def strip_ansi(text: str) -> str:
     """Removes ANSI sequences from text.
 
+    Text without escape characters is returned as-is, anything else goes through a
+    bounded cache.
+
     Args:
         text: A string or bytes object containing 0 or more ANSI sequences.
 
@@ -44,7 +71,10 @@ def strip_ansi(text: str) -> str:
     if hasattr(text, "plain"):
         return text.plain  # type: ignore
 
-    return RE_ANSI.sub("", text)
+    if "\x1b" not in text:
+        return text
+
+    return _strip_ansi(text)
 
 
 @lru_cache()
@@ -61,12 +91,14 @@ def strip_markup(text: str) -> str:
     return RE_MARKUP.sub("", text)
 
 
-@lru_cache(maxsize=None)
 def real_length(text: str) -> int:
     """Gets the display-length of text.
 
     This length means no ANSI sequences are counted. This method is a convenience wrapper
-    for `len(strip_ansi(text))`.
+    for `wcswidth(strip_ansi(text))`.
+
+    Printable ASCII text is always exactly as wide as its length, so it is measured
+    directly. Anything else goes through a bounded cache.
 
     Args:
         text: The text to calculate the length of.
@@ -75,7 +107,52 @@ def real_length(text: str) -> int:
         The display-length of text.
     """
 
-    return max(wcswidth(strip_ansi(text)), 0)
+    if text.isascii() and text.isprintable():
+        return len(text)
+
+    return _real_length(text)
+
+
+def real_lengths(lines: Iterable[str]) -> list[int]:
+    """Gets the display-length of many lines, like the ones of a widget.
+
+    Args:
+        lines: The lines to measure.
+
+    Returns:
+        The `real_length` of each line, in order.
+    """
+
+    return [
+        len(line) if line.isascii() and line.isprintable() else _real_length(line)
+        for line in lines
+    ]
+
+
+def width_cache_info() -> dict[str, CacheInfo]:
+    """Returns the statistics of the `strip_ansi` and `real_length` caches.
+
+    Only text that could not take the fast paths is counted.
+    """
+
+    info = {}
+
+    for name, func in (("strip_ansi", _strip_ansi), ("real_length", _real_length)):
+        hits, misses, maxsize, currsize = func.cache_info()
+
+        # Every miss adds an entry, and only evictions remove them between clears
+        info[name] = CacheInfo(
+            hits, misses, misses - currsize, currsize, 0, maxsize, None
+        )
+
+    return info
+
+
+def clear_width_cache() -> None:
+    """Clears the `strip_ansi` and `real_length` caches, along with their stats."""
+
+    _strip_ansi.cache_clear()
+    _real_length.cache_clear()
 
 
 def escape_markup(text: str) -> str:
@@ -0,0 +1,853 @@
+"""A cell-based model of the terminal screen.
+
+`Screen` stores a grid of cells, each holding a glyph and the `Style` it is displayed
+with. Lines of ANSI-coded text can be written onto it, and two screens can be compared
+to get the minimal set of changed runs that need to be written to the terminal.
+
+`CursorPlanner` keeps track of the terminal's cursor, and finds the shortest sequence
+to move it to a new position.
+
+This is what powers `pytermgui.enums.RenderMode.DAMAGE` in the
+`pytermgui.window_manager.Compositor`.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import NamedTuple
+
+from wcwidth import wcswidth, wcwidth
+
+from .regex import RE_SEQUENCE
+
+__all__ = [
+    "Style",
+    "Screen",
+    "CoverageMask",
+    "CursorPlanner",
+    "apply_sgr",
+    "get_cursor_advance",
+    "get_transition",
+    "DEFAULT_STYLE",
+]
+
+ATTRIBUTES = frozenset(("1", "2", "3", "4", "5", "6", "7", "8", "9", "53"))
+
+ATTRIBUTE_CLEARERS = {
+    "22": ("1", "2"),
+    "23": ("3",),
+    "24": ("4",),
+    "25": ("5", "6"),
+    "27": ("7",),
+    "28": ("8",),
+    "29": ("9",),
+    "54": ("53",),
+    "55": ("53",),
+}
+
+# The SGR code that turns off each attribute. Some codes turn off multiple.
+ATTRIBUTE_RESETS = {
+    "1": "22",
+    "2": "22",
+    "3": "23",
+    "4": "24",
+    "5": "25",
+    "6": "25",
+    "7": "27",
+    "8": "28",
+    "9": "29",
+    "53": "55",
+}
+
+LINK_CLOSE = "\x1b]8;;\x1b\\"
+
+# Runs of changed cells separated by less than this many unchanged cells are merged,
+# as rewriting a couple of cells is cheaper than moving the cursor over them.
+RUN_MERGE_GAP = 4
+
+
+class Style(NamedTuple):
+    """The graphical state a cell is displayed with.
+
+    Styles are interned by `apply_sgr`, so two cells with the same style share the
+    same instance.
+    """
+
+    attributes: frozenset = frozenset()
+    """The SGR parameters of the active attributes, e.g. `"1"` for bold."""
+
+    foreground: str | None = None
+    """The SGR parameters of the foreground color, e.g. `"38;5;141"`."""
+
+    background: str | None = None
+    """The SGR parameters of the background color, e.g. `"48;2;10;20;30"`."""
+
+    link: str | None = None
+    """The URI of the OSC 8 hyperlink the cell is a part of."""
+
+    @property
+    def sequence(self) -> str:
+        """Returns the SGR sequence that sets this style up from any state."""
+
+        return _get_sequence(self)
+
+
+DEFAULT_STYLE = Style()
+"""The style of a cell that has no styling applied to it."""
+
+
+@lru_cache(maxsize=4096)
+def _intern(style: Style) -> Style:
+    """Returns the canonical instance of the given style.
+
+    Only recently used styles are kept, so ever-changing true color gradients don't
+    grow the table forever. A style that was dropped gets a new canonical instance,
+    which at worst makes some identity checks fail and their sequences be re-sent.
+    """
+
+    return DEFAULT_STYLE if style == DEFAULT_STYLE else style
+
+
+@lru_cache(maxsize=1024)
+def _get_sequence(style: Style) -> str:
+    """Builds the SGR sequence for a style, starting with a reset."""
+
+    params = sorted(style.attributes, key=int)
+
+    if style.foreground is not None:
+        params.append(style.foreground)
+
+    if style.background is not None:
+        params.append(style.background)
+
+    if len(params) == 0:
+        return "\x1b[0m"
+
+    return "\x1b[0;" + ";".join(params) + "m"
+
+
+@lru_cache(maxsize=4096)
+def get_transition(old: Style, new: Style) -> str:
+    """Gets the shortest SGR sequence that changes the terminal's style from old to new.
+
+    Only the attributes and colors that differ are emitted, unless resetting and
+    setting up `new` from scratch is shorter. Links are not handled here, as they
+    aren't a part of SGR.
+
+    Args:
+        old: The style currently active on the terminal.
+        new: The style to change to.
+
+    Returns:
+        The sequence, or an empty string if the two styles look the same.
+    """
+
+    if (
+        old.attributes == new.attributes
+        and old.foreground == new.foreground
+        and old.background == new.background
+    ):
+        return ""
+
+    resets = {ATTRIBUTE_RESETS[attr] for attr in old.attributes - new.attributes}
+
+    # Resetting e.g. faint also resets bold, so those need to be set again
+    added = [
+        attr
+        for attr in new.attributes
+        if attr not in old.attributes or ATTRIBUTE_RESETS[attr] in resets
+    ]
+
+    params = sorted(resets, key=int) + sorted(added, key=int)
+
+    if old.foreground != new.foreground:
+        params.append("39" if new.foreground is None else new.foreground)
+
+    if old.background != new.background:
+        params.append("49" if new.background is None else new.background)
+
+    delta = "\x1b[" + ";".join(params) + "m"
+
+    return min(delta, new.sequence, key=len)
+
+
+@lru_cache(maxsize=1024)
+def apply_sgr(  # pylint: disable=too-many-branches
+    style: Style, params: str
+) -> Style:
+    """Applies the parameters of an SGR sequence to a style.
+
+    Args:
+        style: The style to start from.
+        params: The parameters of the SGR sequence, e.g. `"1;38;5;141"`.
+
+    Returns:
+        The interned style the parameters result in.
+    """
+
+    attributes = set(style.attributes)
+    foreground, background = style.foreground, style.background
+
+    parts = params.replace(":", ";").split(";")
+    length = len(parts)
+
+    i = 0
+    while i < length:
+        code = parts[i]
+
+        if code in ("", "0"):
+            attributes.clear()
+            foreground = background = None
+
+        elif code in ATTRIBUTES:
+            attributes.add(code)
+
+        elif code in ATTRIBUTE_CLEARERS:
+            attributes.difference_update(ATTRIBUTE_CLEARERS[code])
+
+        elif code in ("38", "48"):
+            kind = parts[i + 1] if i + 1 < length else ""
+            span = 3 if kind == "5" else (5 if kind == "2" else 1)
+
+            value = ";".join(parts[i : i + span]) if i + span <= length else None
+            i += span - 1
+
+            if code == "38":
+                foreground = value
+            else:
+                background = value
+
+        elif code == "39":
+            foreground = None
+
+        elif code == "49":
+            background = None
+
+        elif code.isdigit():
+            index = int(code)
+
+            if 30 <= index <= 37 or 90 <= index <= 97:
+                foreground = code
+
+            elif 40 <= index <= 47 or 100 <= index <= 107:
+                background = code
+
+        i += 1
+
+    return _intern(Style(frozenset(attributes), foreground, background, style.link))
+
+
+@lru_cache(maxsize=256)
+def _with_link(style: Style, link: str | None) -> Style:
+    """Returns the given style with its link replaced."""
+
+    return _intern(style._replace(link=link))
+
+
+@lru_cache(maxsize=1024)
+def get_cursor_advance(text: str) -> int | None:
+    """Gets the amount of columns writing some text moves the cursor by.
+
+    Args:
+        text: The text that is written. It may contain SGR and OSC sequences.
+
+    Returns:
+        The amount of columns, or None if the text contains anything that moves the
+        cursor in other ways, e.g. control characters or CSI sequences other than SGR.
+    """
+
+    plain = text
+
+    if "\x1b" in text:
+        parts = []
+        cursor = 0
+
+        for matchobj in RE_SEQUENCE.finditer(text):
+            _, final, osc = matchobj.groups()
+
+            if final not in (None, "m") or (final is None and osc is None):
+                return None
+
+            parts.append(text[cursor : matchobj.start()])
+            cursor = matchobj.end()
+
+        parts.append(text[cursor:])
+        plain = "".join(parts)
+
+    if not plain.isprintable():
+        return None
+
+    width = wcswidth(plain)
+
+    return None if width < 0 else width
+
+
+class CursorPlanner:
+    """Plans the cheapest cursor movements between positioned writes.
+
+    The planner tracks where the terminal's cursor is, and for each move picks the
+    shortest of doing nothing, CR, CR LF, CUU/CUD, CUF/CUB, CHA and CUP, or
+    combinations of a vertical and horizontal move. While the position is unknown,
+    absolute positioning (CUP) is used.
+
+    Positions are 1-based (x, y) tuples, as in `Screen`.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        """Initializes a planner with an unknown cursor position.
+
+        Args:
+            width: The amount of columns in the terminal.
+            height: The amount of rows in the terminal.
+        """
+
+        self.width = width
+        self.height = height
+
+        self.position: tuple[int, int] | None = None
+        """The current position of the cursor, or None if it is not known."""
+
+    def invalidate(self) -> None:
+        """Marks the cursor position as unknown.
+
+        Call this after writing anything the planner can't follow.
+        """
+
+        self.position = None
+
+    def advance(self, columns: int | None) -> None:
+        """Moves the tracked position right after writing some text.
+
+        Writing into the last column leaves the cursor in a pending-wrap state, so
+        the position becomes unknown.
+
+        Args:
+            columns: The amount of columns written. See `get_cursor_advance`. If None,
+                the position is invalidated.
+        """
+
+        if self.position is None:
+            return
+
+        xpos, ypos = self.position
+
+        if columns is None or xpos + columns > self.width:
+            self.position = None
+            return
+
+        self.position = (xpos + columns, ypos)
+
+    def move(self, pos: tuple[int, int]) -> str:
+        """Gets the shortest sequence that moves the cursor to the given position.
+
+        Args:
+            pos: The (x, y) position to move to.
+
+        Returns:
+            The sequence to write. The tracked position is updated to `pos`.
+        """
+
+        xpos, ypos = pos
+        current = self.position
+
+        if not (0 < xpos <= self.width and 0 < ypos <= self.height):
+            self.position = None
+            return f"\x1b[{ypos};{xpos}H"
+
+        self.position = pos
+
+        if current is None:
+            return _get_absolute_move(xpos, ypos)
+
+        return _get_relative_move(current, pos, self.height)
+
+
+@lru_cache(maxsize=1024)
+def _get_absolute_move(xpos: int, ypos: int) -> str:
+    """Gets the shortest CUP sequence to the given position."""
+
+    if xpos == 1:
+        return "\x1b[H" if ypos == 1 else f"\x1b[{ypos}H"
+
+    return f"\x1b[{ypos};{xpos}H"
+
+
+@lru_cache(maxsize=4096)
+def _get_relative_move(
+    current: tuple[int, int], pos: tuple[int, int], height: int
+) -> str:
+    """Gets the shortest sequence that moves the cursor from current to pos."""
+
+    (old_x, old_y), (xpos, ypos) = current, pos
+
+    if current == pos:
+        return ""
+
+    horizontal = ["\x1b[G" if xpos == 1 else f"\x1b[{xpos}G"]
+    distance = xpos - old_x
+
+    if distance == 0:
+        horizontal.append("")
+
+    elif distance > 0:
+        horizontal.append("\x1b[C" if distance == 1 else f"\x1b[{distance}C")
+
+    else:
+        horizontal.append("\x1b[D" if distance == -1 else f"\x1b[{-distance}D")
+
+    if xpos == 1:
+        horizontal.append("\r")
+
+    horizontal_move = min(horizontal, key=len)
+    distance = ypos - old_y
+
+    candidates = [_get_absolute_move(xpos, ypos)]
+
+    if distance == 0:
+        candidates.append(horizontal_move)
+
+    elif distance > 0:
+        vertical = "\x1b[B" if distance == 1 else f"\x1b[{distance}B"
+        candidates.append(vertical + horizontal_move)
+
+        # A line feed on the last row would scroll the screen
+        if distance == 1 and xpos == 1 and ypos <= height:
+            candidates.append("\r\n")
+
+    else:
+        vertical = "\x1b[A" if distance == -1 else f"\x1b[{-distance}A"
+        candidates.append(vertical + horizontal_move)
+
+    return min(candidates, key=len)
+
+
+class CoverageMask:
+    """Keeps track of which cells of a screen are already occupied.
+
+    This is used to composite overlapping windows from the top down: cells that are
+    covered by a window above are never written, and windows that are covered entirely
+    don't need to be rendered at all.
+
+    Rectangles are given as (left, top, right, bottom), using the same 1-based
+    coordinates as `pytermgui.window_manager.Window.rect`, with right and bottom being
+    exclusive.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        """Initializes an empty mask of the given size."""
+
+        self.width = width
+        self.height = height
+        self.rows = [bytearray(width) for _ in range(height)]
+
+    def _clip(self, rect: tuple[int, int, int, int]) -> tuple[int, int, int, int]:
+        """Converts a rectangle to 0-based indices within the mask."""
+
+        left, top, right, bottom = rect
+
+        return (
+            max(left - 1, 0),
+            max(top - 1, 0),
+            min(right - 1, self.width),
+            min(bottom - 1, self.height),
+        )
+
+    def cover(self, rect: tuple[int, int, int, int]) -> None:
+        """Marks every cell within the given rectangle as covered."""
+
+        left, top, right, bottom = self._clip(rect)
+
+        if left >= right:
+            return
+
+        filled = b"\x01" * (right - left)
+        for row in range(top, bottom):
+            self.rows[row][left:right] = filled
+
+    def is_covered(self, rect: tuple[int, int, int, int]) -> bool:
+        """Determines whether no cell of the given rectangle is visible.
+
+        Parts of the rectangle that fall outside of the mask count as covered.
+        """
+
+        left, top, right, bottom = self._clip(rect)
+
+        if left >= right:
+            return True
+
+        return all(0 not in self.rows[row][left:right] for row in range(top, bottom))
+
+
+class Screen:
+    """A grid of cells representing the contents of a terminal.
+
+    Every cell has a glyph and a `Style`. The cell to the right of a wide (2 column)
+    character holds an empty string as its glyph.
+
+    Positions follow the terminal's convention, and are 1-based (x, y) tuples.
+    """
+
+    def __init__(
+        self, width: int, height: int, mask: CoverageMask | None = None
+    ) -> None:
+        """Initializes a blank screen.
+
+        Args:
+            width: The amount of columns in the screen.
+            height: The amount of rows in the screen.
+            mask: If given, cells that are covered in it are never written to, and
+                every written cell is marked as covered. This allows compositing
+                content from the top layer down.
+        """
+
+        self.width = width
+        self.height = height
+        self.mask = mask
+
+        self.glyphs = [[" "] * width for _ in range(height)]
+        self.styles = [[DEFAULT_STYLE] * width for _ in range(height)]
+
+        self.style = DEFAULT_STYLE
+        """The style that is applied to newly written text."""
+
+        self.bytes_saved = 0
+        """The amount of bytes the last `render` saved by only emitting style deltas
+        and repeating characters, compared to writing each style in full."""
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """Returns the (width, height) of this screen."""
+
+        return self.width, self.height
+
+    def clear(self) -> None:
+        """Resets every cell to a blank, unstyled space."""
+
+        for row in range(self.height):
+            self.glyphs[row] = [" "] * self.width
+            self.styles[row] = [DEFAULT_STYLE] * self.width
+
+    def _put(self, row: int, col: int, text: str, style: Style) -> int:
+        """Puts plain text into the given row, starting at `col`.
+
+        Returns:
+            The column right after the text.
+        """
+
+        glyphs = self.glyphs[row]
+        styles = self.styles[row]
+        width = self.width
+        covered = None if self.mask is None else self.mask.rows[row]
+
+        if text.isascii() and text.isprintable():
+            end = col + len(text)
+            start = max(col, 0)
+            stop = min(end, width)
+
+            if start >= stop:
+                return end
+
+            if covered is not None:
+                if 1 in covered[start:stop]:
+                    return self._put_masked(row, col, text, style)
+
+                covered[start:stop] = b"\x01" * (stop - start)
+
+            if glyphs[start] == "" and start > 0 and not _is_set(covered, start - 1):
+                glyphs[start - 1] = " "
+
+            if stop < width and glyphs[stop] == "" and not _is_set(covered, stop):
+                glyphs[stop] = " "
+
+            glyphs[start:stop] = text[start - col : stop - col]
+            styles[start:stop] = [style] * (stop - start)
+
+            return end
+
+        return self._put_masked(row, col, text, style)
+
+    def _put_masked(  # pylint: disable=too-many-branches
+        self, row: int, col: int, text: str, style: Style
+    ) -> int:
+        """Puts text into the given row character by character.
+
+        This handles wide & combining characters, as well as cells that are already
+        covered in `mask`.
+
+        Returns:
+            The column right after the text.
+        """
+
+        glyphs = self.glyphs[row]
+        styles = self.styles[row]
+        width = self.width
+        covered = None if self.mask is None else self.mask.rows[row]
+
+        for char in text:
+            char_width = wcwidth(char)
+
+            if char_width < 0:
+                continue
+
+            if char_width == 0:
+                target = col - 1
+                if 0 <= target < width and glyphs[target] == "" and target > 0:
+                    target -= 1
+
+                if 0 <= target < width and not _is_set(covered, target):
+                    glyphs[target] += char
+
+                continue
+
+            if 0 <= col < width and not _is_set(covered, col):
+                if glyphs[col] == "" and col > 0 and not _is_set(covered, col - 1):
+                    glyphs[col - 1] = " "
+
+                if char_width == 2 and (col + 1 >= width or _is_set(covered, col + 1)):
+                    char, char_width = " ", 1
+
+                glyphs[col] = char
+                styles[col] = style
+
+                if char_width == 2:
+                    glyphs[col + 1] = ""
+                    styles[col + 1] = style
+
+                after = col + char_width
+                if after < width and glyphs[after] == "" and not _is_set(covered, after):
+                    glyphs[after] = " "
+
+                if covered is not None:
+                    covered[col:after] = b"\x01" * char_width
+
+            col += char_width
+
+        return col
+
+    def write(self, pos: tuple[int, int], text: str) -> None:
+        """Writes a line of ANSI-coded text onto the screen.
+
+        SGR sequences and OSC 8 hyperlinks update `Screen.style`, which persists
+        between writes the same way it does on a terminal. Other sequences are
+        ignored, and anything falling outside of the screen is clipped.
+
+        Args:
+            pos: The (x, y) position to start writing at.
+            text: The text to write. It should not contain newlines.
+        """
+
+        col, row = pos[0] - 1, pos[1] - 1
+        style = self.style
+        inside = 0 <= row < self.height
+
+        cursor = 0
+        for matchobj in RE_SEQUENCE.finditer(text):
+            start, end = matchobj.span()
+
+            if cursor < start and inside:
+                col = self._put(row, col, text[cursor:start], style)
+
+            params, final, osc = matchobj.groups()
+
+            if final == "m":
+                style = apply_sgr(style, params)
+
+            elif osc is not None and osc.startswith("8;"):
+                uri = osc.split(";", 2)[-1]
+                style = _with_link(style, uri or None)
+
+            cursor = end
+
+        if cursor < len(text) and inside:
+            self._put(row, col, text[cursor:], style)
+
+        self.style = style
+
+    def render(self, previous: Screen | None = None, repeat: bool = True) -> str:
+        """Gets the output that turns `previous` into this screen.
+
+        The SGR state and cursor position of the terminal are tracked throughout, so
+        style changes only emit the attributes & colors that differ, and the cursor is
+        moved using the shortest available sequences. The amount of bytes this saves over
+        writing out every style in full is stored in `bytes_saved`.
+
+        Args:
+            previous: The screen as it is currently displayed on the terminal. When
+                not given, or when its size is different, the terminal is cleared
+                and this screen is drawn in full.
+            repeat: If set, runs of the same ASCII character are written using REP
+                (`CSI n b`) where that is shorter.
+
+        Returns:
+            A string of sequences and glyphs that only touches the changed cells.
+        """
+
+        writer = _RunWriter(repeat)
+        cursor = CursorPlanner(self.width, self.height)
+
+        if previous is None or previous.size != self.size:
+            writer.buffer.append("\x1b[H\x1b[2J")
+            cursor.position = (1, 1)
+            previous = Screen(self.width, self.height)
+
+        for row in range(self.height):
+            glyphs, styles = self.glyphs[row], self.styles[row]
+            old_glyphs, old_styles = previous.glyphs[row], previous.styles[row]
+
+            if glyphs == old_glyphs and styles == old_styles:
+                continue
+
+            for start, end in _get_runs(glyphs, styles, old_glyphs, old_styles):
+                writer.buffer.append(cursor.move((start + 1, row + 1)))
+                writer.write_run(glyphs, styles, start, end)
+
+                # Runs ending on the left half of a wide character write both halves
+                if end < self.width and glyphs[end] == "":
+                    end += 1
+
+                cursor.advance(end - start)
+
+        self.bytes_saved = writer.saved
+
+        return writer.finish()
+
+
+class _RunWriter:
+    """Writes runs of cells, tracking the terminal's SGR & link state between them."""
+
+    def __init__(self, repeat: bool) -> None:
+        """Initializes the writer.
+
+        Args:
+            repeat: If set, runs of the same ASCII character are written using REP
+                (`CSI n b`) where that is shorter.
+        """
+
+        self.repeat = repeat
+        self.buffer: list[str] = []
+        self.style = DEFAULT_STYLE
+        self.link: str | None = None
+
+        self.saved = 0
+        """The amount of bytes saved over writing out every style in full."""
+
+    def write_run(
+        self, glyphs: list[str], styles: list[Style], start: int, end: int
+    ) -> None:
+        """Writes the cells of a row in [start, end), and closes any open link."""
+
+        col = start
+        while col < end:
+            cell_style = styles[col]
+
+            if cell_style is not self.style:
+                self._set_style(cell_style)
+
+            count = self._get_repeat_count(glyphs, styles, col, end)
+            self.buffer.append(self._encode_glyph(glyphs[col], count))
+            col += count
+
+        if self.link is not None:
+            self.buffer.append(LINK_CLOSE)
+            self.link = None
+            self.style = _with_link(self.style, None)
+
+    def finish(self) -> str:
+        """Resets the style if needed, and returns everything written."""
+
+        if self.style.sequence != DEFAULT_STYLE.sequence:
+            self.buffer.append("\x1b[0m")
+
+        return "".join(self.buffer)
+
+    def _set_style(self, style: Style) -> None:
+        """Emits the link change & SGR delta needed to switch to a style."""
+
+        if style.link != self.link:
+            if self.link is not None:
+                self.buffer.append(LINK_CLOSE)
+
+            self.link = style.link
+
+            if self.link is not None:
+                self.buffer.append(f"\x1b]8;;{self.link}\x1b\\")
+
+        transition = get_transition(self.style, style)
+
+        if transition != "":
+            self.saved += len(style.sequence) - len(transition)
+            self.buffer.append(transition)
+
+        self.style = style
+
+    def _get_repeat_count(
+        self, glyphs: list[str], styles: list[Style], col: int, end: int
+    ) -> int:
+        """Gets the amount of times the glyph at `col` can be written at once."""
+
+        glyph = glyphs[col]
+        count = 1
+
+        if self.repeat and len(glyph) == 1 and glyph.isascii():
+            style = styles[col]
+
+            while (
+                col + count < end
+                and glyphs[col + count] == glyph
+                and styles[col + count] is style
+            ):
+                count += 1
+
+        return count
+
+    def _encode_glyph(self, glyph: str, count: int) -> str:
+        """Encodes a glyph repeated `count` times, using REP where it is shorter."""
+
+        if count == 1:
+            return glyph
+
+        rep = f"\x1b[{count - 1}b"
+
+        if len(rep) < count - 1:
+            self.saved += count - 1 - len(rep)
+            return glyph + rep
+
+        return glyph * count
+
+
+def _is_set(covered: bytearray | None, col: int) -> bool:
+    """Determines whether a column is covered within a row of a `CoverageMask`."""
+
+    return covered is not None and covered[col] == 1
+
+
+def _get_runs(
+    glyphs: list[str],
+    styles: list[Style],
+    old_glyphs: list[str],
+    old_styles: list[Style],
+) -> list[tuple[int, int]]:
+    """Gets the (start, end) column ranges of changed cells within a row."""
+
+    changed = [
+        col
+        for col, (glyph, style, old_glyph, old_style) in enumerate(
+            zip(glyphs, styles, old_glyphs, old_styles)
+        )
+        if glyph != old_glyph or style is not old_style
+    ]
+
+    runs: list[tuple[int, int]] = []
+
+    for col in changed:
+        if len(runs) > 0 and col - runs[-1][1] < RUN_MERGE_GAP:
+            runs[-1] = (runs[-1][0], col + 1)
+            continue
+
+        runs.append((col, col + 1))
+
+    # Never start a run on the right half of a wide character
+    return [
+        (start - 1 if glyphs[start] == "" and start > 0 else start, end)
+        for start, end in runs
+    ]
@@ -18,8 +18,10 @@ from io import StringIO
 from shutil import get_terminal_size
 from typing import TYPE_CHECKING, Any, Callable, Generator, TextIO
 
-from .input import getch_timeout
-from .regex import RE_PIXEL_SIZE, has_open_sequence, real_length, strip_ansi
+from .helpers import slice_ansi
+from .input import getch, getch_timeout
+from .regex import RE_PIXEL_SIZE, strip_ansi
+from .screen import CursorPlanner, get_cursor_advance
 
 if TYPE_CHECKING:
     from .fancy_repr import FancyYield
@@ -260,12 +262,22 @@ class Terminal:  # pylint: disable=too-many-instance-attributes
         self._recorder: Recorder | None = None
 
         self.size: tuple[int, int] = self._get_size()
+        self.cursor = CursorPlanner(*self.size)
+        self._frame_depth = 0
         self.forced_colorsystem: ColorSystem | None = _get_env_colorsys()
 
         self._listeners: dict[int, list[Callable[..., Any]]] = {}
 
         # Async-signal-safe resize mechanism
         self._resize_pending = threading.Event()
+        self._listen_for_resize()
+
+        self._diff_buffer = [
+            ["" for _ in range(self.width)] for y in range(self.height)
+        ]
+
+    def _listen_for_resize(self) -> None:
+        """Sets up `_resize_pending` to be set whenever the terminal is resized."""
 
         if hasattr(signal, "SIGWINCH"):
             signal.signal(signal.SIGWINCH, self._update_size)
@@ -278,10 +290,6 @@ class Terminal:  # pylint: disable=too-many-instance-attributes
                 daemon=True,
             ).start()
 
-        self._diff_buffer = [
-            ["" for _ in range(self.width)] for y in range(self.height)
-        ]
-
     def _window_terminal_resize(self) -> None:
         from time import sleep  # pylint: disable=import-outside-toplevel
 
@@ -374,6 +382,7 @@ class Terminal:  # pylint: disable=too-many-instance-attributes
             del self.__dict__["resolution"]
 
         self.size = self._get_size()
+        self.cursor = CursorPlanner(*self.size)
         self._call_listener(self.RESIZE, self.size)
 
         # Wipe the screen in case anything got messed up
@@ -474,6 +483,12 @@ class Terminal:  # pylint: disable=too-many-instance-attributes
 
         buffer = StringIO()
 
+        # Anything may have been output since the last frame, e.g. by `print`
+        if self._frame_depth == 0:
+            self.cursor.invalidate()
+
+        self._frame_depth += 1
+
         try:
             # Write directly to stream to avoid write()'s auto-clear behavior
             self._stream.write("\x1b[?2026h")
@@ -491,12 +506,23 @@ class Terminal:  # pylint: disable=too-many-instance-attributes
             self._stream.write("\x1b[?2026l")
             self._stream.flush()
 
+            self._frame_depth -= 1
+            self.cursor.invalidate()
+
     @staticmethod
     def isatty() -> bool:
         """Returns whether sys.stdin is a tty."""
 
         return sys.stdin.isatty()
 
+    def getch(self, printable: bool = False, interrupts: bool = True) -> str:
+        """Reads a keypress from the terminal's input.
+
+        See `pytermgui.input.getch` for the arguments.
+        """
+
+        return getch(printable=printable, interrupts=interrupts)
+
     def replay(self, recorder: Recorder) -> None:
         """Replays a recording."""
 
@@ -532,38 +558,28 @@ class Terminal:  # pylint: disable=too-many-instance-attributes
     ) -> None:
         """Writes the given data to the terminal's stream.
 
+        Within a `frame`, positioned writes are tracked by `Terminal.cursor`, so the
+        cursor is moved using the shortest available sequence. Outside of frames, and
+        after any write with unknown effects on the cursor (including all
+        non-positioned ones), the cursor is moved using absolute positioning, as
+        output that bypasses the terminal (e.g. the builtin `print`) may have moved it.
+
         Args:
             data: The data to write.
             pos: Terminal-character space position to write the data to, (x, y).
             flush: If set, `flush` will be called on the stream after reading.
             slice_too_long: If set, lines that are outside of the terminal will be
-                sliced to fit. Involves a sizable performance hit.
+                sliced to fit, using `pytermgui.helpers.slice_ansi`.
         """
 
-        def _slice(line: str, maximum: int) -> str:
-            length = 0
-            sliced = ""
-            for char in line:
-                sliced += char
-                if char == "\x1b":
-                    continue
-
-                if (
-                    length > maximum
-                    and real_length(sliced) > maximum
-                    and not has_open_sequence(sliced)
-                ):
-                    break
-
-                length += 1
-
-            return sliced
-
         # Truncate pending buffer on clear (may help on Windows)
         if "\x1b[2J" in data:
             self.clear_stream()
 
         if pos is not None:
+            if self._frame_depth == 0:
+                self.cursor.invalidate()
+
             xpos, ypos = pos
             xpos += self.origin[0]
             ypos += self.origin[1]
@@ -572,16 +588,29 @@ class Terminal:  # pylint: disable=too-many-instance-attributes
                 if not self.height + self.origin[1] + 1 > ypos >= 0:
                     return
 
-                maximum = self.width - xpos
+                # The columns of data that fall within the terminal
+                start = max(self.origin[0] - xpos, 0)
+                end = self.width - xpos + 1
+
+                if end <= start:
+                    return
 
                 xpos = max(xpos, self.origin[0])
 
-                sliced = _slice(data, maximum) if len(data) > maximum else data
+                sliced = data
+                if start > 0 or len(data) > end:
+                    sliced = slice_ansi(data, start, end)
 
-                data = f"\x1b[{ypos};{xpos}H{sliced}\x1b[0m"
+                data = self.cursor.move((xpos, ypos)) + sliced + "\x1b[0m"
+                self.cursor.advance(get_cursor_advance(sliced))
 
             else:
-                data = f"\x1b[{ypos};{xpos}H{data}"
+                moved = self.cursor.move((xpos, ypos))
+                self.cursor.advance(get_cursor_advance(data))
+                data = moved + data
+
+        else:
+            self.cursor.invalidate()
 
         self._stream.write(data)
 
@@ -606,6 +635,7 @@ class Terminal:  # pylint: disable=too-many-instance-attributes
                 raise
 
         self._stream.write("\x1b[H\x1b[2J")
+        self.cursor.position = (1, 1)
 
     def print(
         self,
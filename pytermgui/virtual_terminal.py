@@ -0,0 +1,593 @@
+"""An in-memory terminal, for running applications without a TTY.
+
+`VirtualTerminal` interprets everything written to it into a `pytermgui.screen.Screen`,
+so its contents can be inspected the same way a user would see them. Input is given
+using `ScriptedInput`, which feeds keys to `VirtualTerminal.getch` one at a time.
+
+```python3
+import pytermgui as ptg
+
+term = ptg.VirtualTerminal(size=(40, 10))
+ptg.set_global_terminal(term)
+
+manager = ptg.WindowManager(framerate=120)
+manager.add(ptg.Window("[bold]Hello", width=20), animate=False)
+
+ptg.ScriptedInput([0.1, manager.stop]).start()
+manager.run()
+
+assert "Hello" in term.get_text()
+```
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from io import TextIOBase
+from threading import Thread
+from typing import Callable, Iterable, Union
+
+from wcwidth import wcwidth
+
+from .input import _pop_fed_text, feed, feeder_stream
+from .screen import DEFAULT_STYLE, Screen, apply_sgr
+from .term import Terminal
+
+__all__ = ["VirtualTerminal", "ScriptedInput"]
+
+RE_ESCAPE = re.compile(
+    r"\x1b(?:\[([0-9;:?<=>]*)[ -/]*([@-~])|\](.*?)(?:\x1b\\|\x07)|_.*?\x1b\\|([^\[\]_]))",
+    re.DOTALL,
+)
+RE_PARTIAL_CSI = re.compile(r"\x1b\[[0-9;:?<=>]*[ -/]*$")
+RE_CONTROL = re.compile(r"[\x00-\x1f\x7f]")
+
+ScriptStep = Union[str, float, Callable[[], object]]
+
+
+class _VirtualStream(TextIOBase):
+    """A stream that passes everything written to it to a `VirtualTerminal`."""
+
+    def __init__(self, terminal: VirtualTerminal) -> None:
+        """Initializes the stream."""
+
+        super().__init__()
+        self._terminal = terminal
+
+    def write(self, data: str) -> int:  # type: ignore
+        """Interprets the given data."""
+
+        self._terminal.interpret(data)
+        return len(data)
+
+    def truncate(self, _: int | None = None) -> int:
+        """Does nothing, as written data has already been interpreted."""
+
+        return 0
+
+    def flush(self) -> None:
+        """Does nothing."""
+
+
+class VirtualTerminal(Terminal):  # pylint: disable=too-many-instance-attributes
+    """A terminal that interprets its output into a screen in memory.
+
+    The following is understood:
+
+    - Printable text, including wide characters & autowrapping at the right edge
+    - CR, LF (interpreted as CR LF, like a terminal with `ONLCR`), BS & TAB
+    - Cursor movement: CUP, CUU/CUD/CUF/CUB, CNL/CPL, CHA, VPA and save/restore
+    - ED and EL erasing, and REP
+    - SGR styling & OSC 8 hyperlinks
+    - Private modes, such as the alternate buffer (1049), cursor visibility (25) and
+      synchronized output (2026), which is used to count frames
+
+    Anything else is ignored.
+    """
+
+    def __init__(self, size: tuple[int, int] = (80, 24)) -> None:
+        """Initializes the virtual terminal.
+
+        Args:
+            size: The (width, height) of the terminal.
+        """
+
+        self.screen = Screen(*size)
+        """The contents of the terminal."""
+
+        self.position = (1, 1)
+        """The (x, y) position of the cursor."""
+
+        self.modes: set[str] = set()
+        """The private modes currently set, e.g. `"25"` for a visible cursor."""
+
+        self.title = ""
+        """The window title, as set by OSC 0 or 2."""
+
+        self.bytes_written = 0
+        """The amount of bytes written to the terminal in total."""
+
+        self.frame_bytes: list[int] = []
+        """The amount of bytes written within each synchronized frame."""
+
+        self.input_timeout = 0.01
+        """The longest time `getch` waits for scripted input before returning."""
+
+        self._pending = ""
+        self._wrap_pending = False
+        self._last_char = " "
+        self._saved_position = (1, 1)
+        self._main_screen: Screen | None = None
+        self._frame_start: int | None = None
+
+        super().__init__(_VirtualStream(self), size=size)  # type: ignore
+
+    def _listen_for_resize(self) -> None:
+        """Does nothing, as virtual terminals are only resized using `resize`."""
+
+    @property
+    def frames(self) -> int:
+        """Returns the amount of synchronized frames drawn so far."""
+
+        return len(self.frame_bytes)
+
+    @staticmethod
+    def isatty() -> bool:
+        """Returns False, as a virtual terminal is never a TTY."""
+
+        return False
+
+    def getch(self, printable: bool = False, interrupts: bool = True) -> str:
+        """Waits up to `input_timeout` for text given to `pytermgui.input.feed`.
+
+        Returns:
+            The fed text, or an empty string if there was none.
+        """
+
+        deadline = time.perf_counter() + self.input_timeout
+
+        while True:
+            key = _pop_fed_text()
+
+            if key != "" or time.perf_counter() >= deadline:
+                break
+
+            time.sleep(0.001)
+
+        if key == chr(3) and interrupts:
+            raise KeyboardInterrupt("Unhandled interrupt")
+
+        if printable:
+            key = key.encode("unicode_escape").decode("utf-8")
+
+        return key
+
+    def resize(self, size: tuple[int, int]) -> None:
+        """Resizes the terminal.
+
+        Content within the new size is kept. Like with a real terminal, listeners are
+        notified once `process_pending_resize` is called.
+
+        Args:
+            size: The new (width, height).
+        """
+
+        screen = Screen(*size)
+
+        for row in range(min(self.screen.height, screen.height)):
+            width = min(self.screen.width, screen.width)
+
+            screen.glyphs[row][:width] = self.screen.glyphs[row][:width]
+            screen.styles[row][:width] = self.screen.styles[row][:width]
+
+        screen.style = self.screen.style
+
+        self.screen = screen
+        self._size = size
+        self.position = (min(self.position[0], size[0]), min(self.position[1], size[1]))
+        self._resize_pending.set()
+
+    def get_lines(self) -> list[str]:
+        """Returns the text of every row, without styling."""
+
+        return ["".join(row) for row in self.screen.glyphs]
+
+    def get_text(self) -> str:
+        """Returns the text of the screen, with rows separated by newlines."""
+
+        return "\n".join(self.get_lines())
+
+    def interpret(self, data: str) -> None:
+        """Interprets some output, updating the screen.
+
+        Sequences that are split between calls are held back until they are complete.
+
+        Args:
+            data: The output to interpret.
+        """
+
+        self.bytes_written += len(data.encode("utf-8"))
+
+        text = self._pending + data
+        self._pending = ""
+
+        cursor = 0
+        length = len(text)
+
+        while cursor < length:
+            control = RE_CONTROL.search(text, cursor)
+
+            if control is None:
+                self._print(text[cursor:])
+                break
+
+            start = control.start()
+
+            if start > cursor:
+                self._print(text[cursor:start])
+
+            if text[start] != "\x1b":
+                self._control(text[start])
+                cursor = start + 1
+                continue
+
+            matchobj = RE_ESCAPE.match(text, start)
+
+            if matchobj is None:
+                if self._is_partial(text[start:]):
+                    self._pending = text[start:]
+                    break
+
+                cursor = start + 1
+                continue
+
+            self._escape(matchobj)
+            cursor = matchobj.end()
+
+    def _byte_offset(self, matchobj: re.Match, index: int) -> int:
+        """Returns the offset in `bytes_written` of an index in the matched text."""
+
+        return self.bytes_written - len(matchobj.string[index:].encode("utf-8"))
+
+    @staticmethod
+    def _is_partial(text: str) -> bool:
+        """Determines whether an unmatched escape sequence could still complete."""
+
+        if text == "\x1b" or RE_PARTIAL_CSI.match(text) is not None:
+            return True
+
+        return text[1] in "]_" and len(text) < 4096
+
+    def _move(self, xpos: int, ypos: int) -> None:
+        """Moves the cursor, clamping it to the screen."""
+
+        self.position = (
+            max(1, min(xpos, self.screen.width)),
+            max(1, min(ypos, self.screen.height)),
+        )
+        self._wrap_pending = False
+
+    def _line_feed(self) -> None:
+        """Moves the cursor down a line, scrolling the screen at the bottom."""
+
+        xpos, ypos = self.position
+
+        if ypos < self.screen.height:
+            self._move(xpos, ypos + 1)
+            return
+
+        screen = self.screen
+        screen.glyphs.pop(0)
+        screen.styles.pop(0)
+        screen.glyphs.append([" "] * screen.width)
+        screen.styles.append([DEFAULT_STYLE] * screen.width)
+
+        self._wrap_pending = False
+
+    def _print(self, text: str) -> None:
+        """Prints text at the cursor, wrapping it at the right edge of the screen."""
+
+        width = self.screen.width
+
+        while text != "":
+            if self._wrap_pending:
+                self._move(1, self.position[1])
+                self._line_feed()
+
+            xpos, ypos = self.position
+            space = width - xpos + 1
+
+            if text.isascii():
+                chunk, text = text[:space], text[space:]
+                chunk_width = len(chunk)
+
+            else:
+                end = 0
+                chunk_width = 0
+
+                for end, char in enumerate(text):
+                    char_width = max(wcwidth(char), 0)
+
+                    if chunk_width + char_width > space:
+                        break
+
+                    chunk_width += char_width
+                else:
+                    end = len(text)
+
+                # A wide character that doesn't fit in the last column is wrapped
+                if end == 0:
+                    self._wrap_pending = True
+                    continue
+
+                chunk, text = text[:end], text[end:]
+
+            self.screen.write(self.position, chunk)
+            self._last_char = chunk[-1]
+
+            if xpos + chunk_width > width:
+                self.position = (width, ypos)
+                self._wrap_pending = True
+            else:
+                self.position = (xpos + chunk_width, ypos)
+
+    def _control(self, char: str) -> None:
+        """Handles a C0 control character."""
+
+        xpos, ypos = self.position
+
+        if char == "\r":
+            self._move(1, ypos)
+
+        elif char in "\n\x0b\x0c":
+            self._move(1, ypos)
+            self._line_feed()
+
+        elif char == "\b":
+            self._move(xpos - 1, ypos)
+
+        elif char == "\t":
+            self._move(xpos + 8 - (xpos - 1) % 8, ypos)
+
+    def _escape(self, matchobj: re.Match) -> None:
+        """Handles a matched escape sequence."""
+
+        params, final, osc, single = matchobj.groups()
+
+        if final is not None:
+            self._csi(params, final, matchobj)
+
+        elif osc is not None:
+            code, _, value = osc.partition(";")
+
+            if code == "8":
+                self.screen.write(self.position, matchobj.group(0))
+
+            elif code in ("0", "2"):
+                self.title = value
+
+        elif single == "7":
+            self._saved_position = self.position
+
+        elif single == "8":
+            self._move(*self._saved_position)
+
+    def _csi(  # pylint: disable=too-many-branches, too-many-statements
+        self, params: str, final: str, matchobj: re.Match
+    ) -> None:
+        """Handles a CSI sequence."""
+
+        xpos, ypos = self.position
+
+        if params.startswith("?"):
+            if final in "hl":
+                for mode in params[1:].split(";"):
+                    self._set_mode(mode, final == "h", matchobj)
+
+            return
+
+        if final == "m":
+            self.screen.style = apply_sgr(self.screen.style, params)
+            return
+
+        numbers = [int(part) if part.isdigit() else 0 for part in params.split(";")]
+        count = max(numbers[0], 1)
+
+        if final in "Hf":
+            column = numbers[1] if len(numbers) > 1 else 0
+            self._move(max(column, 1), count)
+
+        elif final == "A":
+            self._move(xpos, ypos - count)
+
+        elif final == "B":
+            self._move(xpos, ypos + count)
+
+        elif final == "C":
+            self._move(xpos + count, ypos)
+
+        elif final == "D":
+            self._move(xpos - count, ypos)
+
+        elif final == "E":
+            self._move(1, ypos + count)
+
+        elif final == "F":
+            self._move(1, ypos - count)
+
+        elif final == "G":
+            self._move(count, ypos)
+
+        elif final == "d":
+            self._move(xpos, count)
+
+        elif final == "J":
+            self._erase_display(numbers[0])
+
+        elif final == "K":
+            self._erase_line(ypos - 1, numbers[0])
+
+        elif final == "b":
+            self._print(self._last_char * count)
+
+        elif final == "s":
+            self._saved_position = self.position
+
+        elif final == "u":
+            self._move(*self._saved_position)
+
+        elif final == "n" and numbers[0] == 6:
+            feed(f"\x1b[{ypos};{xpos}R")
+
+    def _set_mode(self, mode: str, value: bool, matchobj: re.Match) -> None:
+        """Sets or resets a private mode."""
+
+        if value:
+            self.modes.add(mode)
+        else:
+            self.modes.discard(mode)
+
+        if mode == "2026":
+            if value:
+                self._frame_start = self._byte_offset(matchobj, matchobj.start())
+
+            elif self._frame_start is not None:
+                end = self._byte_offset(matchobj, matchobj.end())
+                self.frame_bytes.append(end - self._frame_start)
+                self._frame_start = None
+
+        elif mode == "1049":
+            if value and self._main_screen is None:
+                self._main_screen = self.screen
+                self._saved_position = self.position
+                self.screen = Screen(*self.screen.size)
+
+            elif not value and self._main_screen is not None:
+                self.screen = self._main_screen
+                self._main_screen = None
+                self._move(*self._saved_position)
+
+    def _erase_line(self, row: int, mode: int) -> None:
+        """Erases part of a row, based on an ED/EL mode."""
+
+        width = self.screen.width
+        col = self.position[0] - 1
+
+        if mode == 0:
+            start, end = col, width
+        elif mode == 1:
+            start, end = 0, col + 1
+        else:
+            start, end = 0, width
+
+        self.screen.glyphs[row][start:end] = [" "] * (end - start)
+        self.screen.styles[row][start:end] = [DEFAULT_STYLE] * (end - start)
+
+    def _erase_display(self, mode: int) -> None:
+        """Erases part of the screen, based on an ED mode."""
+
+        row = self.position[1] - 1
+
+        if mode == 0:
+            self._erase_line(row, 0)
+            rows = range(row + 1, self.screen.height)
+
+        elif mode == 1:
+            self._erase_line(row, 1)
+            rows = range(row)
+
+        else:
+            rows = range(self.screen.height)
+
+        for other in rows:
+            self._erase_line(other, 2)
+
+
+class ScriptedInput:
+    """Feeds a script of input to `getch`, one step at a time.
+
+    Each step of the script can be:
+
+    - A string, which is fed as a single keypress. The next step waits until it has
+      been read.
+    - A number, which pauses the script for that many seconds.
+    - A callable, which is called with no arguments.
+
+    ```python3
+    from pytermgui import ScriptedInput, keys
+
+    script = ScriptedInput([keys.DOWN, keys.ENTER, 0.5, manager.stop])
+    script.start()
+    ```
+    """
+
+    def __init__(self, steps: Iterable[ScriptStep], interval: float = 0.0) -> None:
+        """Initializes the script.
+
+        Args:
+            steps: The steps of the script.
+            interval: The time to wait between each keypress.
+        """
+
+        self.steps = list(steps)
+        self.interval = interval
+        self.timeout = 5.0
+        """The longest time a key may go unread before the script gives up."""
+
+        self._thread: Thread | None = None
+
+    @property
+    def is_done(self) -> bool:
+        """Determines whether the script has finished running."""
+
+        return self._thread is not None and not self._thread.is_alive()
+
+    def _wait_until_read(self) -> bool:
+        """Waits until the last fed key has been read by `getch`."""
+
+        deadline = time.perf_counter() + self.timeout
+
+        while feeder_stream.getvalue() != "":
+            if time.perf_counter() >= deadline:
+                return False
+
+            time.sleep(0.001)
+
+        return True
+
+    def run(self) -> None:
+        """Runs the script in the current thread."""
+
+        for step in self.steps:
+            if isinstance(step, str):
+                feed(step)
+
+                if not self._wait_until_read():
+                    break
+
+                time.sleep(self.interval)
+
+            elif isinstance(step, (int, float)):
+                time.sleep(step)
+
+            else:
+                step()
+
+    def start(self) -> ScriptedInput:
+        """Runs the script in a background thread.
+
+        Returns:
+            This object, for chaining.
+        """
+
+        self._thread = Thread(name="ScriptedInput", target=self.run, daemon=True)
+        self._thread.start()
+
+        return self
+
+    def wait(self, timeout: float | None = None) -> None:
+        """Waits for a started script to finish."""
+
+        if self._thread is not None:
+            self._thread.join(timeout)
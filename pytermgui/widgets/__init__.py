@@ -20,6 +20,7 @@ from .pixel_matrix import *
 from .slider import Slider
 from .styles import *
 from .toggle import Toggle
+from .virtual_list import *
 
 WidgetType = Union[Widget, Type[Widget]]
 
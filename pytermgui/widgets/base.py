@@ -18,7 +18,7 @@ from ..enums import HorizontalAlignment, SizePolicy, WidgetChange
 from ..fancy_repr import FancyYield
 from ..helpers import break_line
 from ..input import keys
-from ..markup import get_markup
+from ..markup import get_markup, tim
 from ..regex import real_length
 from ..term import Terminal, get_terminal
 from . import styles as w_styles
@@ -28,6 +28,16 @@ __all__ = ["Widget", "Label"]
 BoundCallback = Callable[..., Any]
 WidgetType = Union["Widget", Type["Widget"]]
 
+# Attributes that never affect the lines of a widget
+_UNTRACKED_ATTRIBUTES = frozenset(
+    ("is_dirty", "parent", "pos", "positioned_line_buffer", "set_char", "set_style")
+)
+
+# Types whose equal values are not worth re-rendering for
+_VALUE_TYPES = (str, int, float, tuple)
+
+_MISSING = object()
+
 
 def _set_obj_or_cls_style(
     obj_or_cls: Type[Widget] | Widget, key: str, value: w_styles.StyleType
@@ -73,6 +83,9 @@ def _set_obj_or_cls_char(
 
     obj_or_cls.chars[key] = value
 
+    if isinstance(obj_or_cls, Widget):
+        obj_or_cls.mark_dirty()
+
     return obj_or_cls
 
 
@@ -112,11 +125,32 @@ class Widget:  # pylint: disable=too-many-public-methods
     parent_align = HorizontalAlignment.get_default()
     """`pytermgui.enums.HorizontalAlignment` to align widget by"""
 
+    is_dirty = False
+    """Whether something affecting the lines of this widget changed since it was last
+    rendered by its parent (or the compositor, for windows).
+
+    It is set when assigning to a public attribute, and spreads to all ancestors. See
+    `mark_dirty`."""
+
+    retain_lines = False
+    """Allows parents to reuse the lines of this widget while it isn't dirty.
+
+    This is only correct for widgets whose lines change solely through attribute
+    assignments, so subclasses that override `get_lines` need to set it again."""
+
     from_data: Callable[..., Widget | list[Widget] | None]
 
     # We cannot import boxes here due to cyclic imports.
     box: Any
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Disables `retain_lines` for subclasses with their own `get_lines`."""
+
+        super().__init_subclass__(**kwargs)
+
+        if "get_lines" in vars(cls) and "retain_lines" not in vars(cls):
+            cls.retain_lines = False
+
     def __init__(self, **attrs: Any) -> None:
         """Initialize object"""
 
@@ -147,6 +181,27 @@ class Widget:  # pylint: disable=too-many-public-methods
         for attr, value in attrs.items():
             setattr(self, attr, value)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Sets an attribute, and marks this widget dirty if it could affect its lines.
+
+        Private attributes, positions and values equal to the current one are ignored.
+        """
+
+        old = self.__dict__.get(name, _MISSING)
+        object.__setattr__(self, name, value)
+
+        if name.startswith("_") or name in _UNTRACKED_ATTRIBUTES or old is value:
+            return
+
+        if (
+            type(old) is type(value)
+            and isinstance(value, _VALUE_TYPES)
+            and old == value
+        ):
+            return
+
+        self.mark_dirty()
+
     def __repr__(self) -> str:
         """Return repr string of this widget.
 
@@ -361,6 +416,28 @@ class Widget:  # pylint: disable=too-many-public-methods
 
         return None
 
+    def mark_dirty(self) -> None:
+        """Marks this widget, and all of its ancestors as dirty.
+
+        Parents reuse the lines of children that aren't dirty, so this needs to be
+        called after changing anything that affects `get_lines` without assigning to
+        an attribute, such as mutating a list in-place.
+        """
+
+        self.__dict__["is_dirty"] = True
+
+        parent = self.__dict__.get("parent")
+        if parent is not None:
+            parent.mark_dirty()
+
+    def can_retain_lines(self) -> bool:
+        """Determines whether the lines of the last render can be reused while clean.
+
+        This is checked right after this widget is rendered by its parent.
+        """
+
+        return self.retain_lines
+
     def contains(self, pos: tuple[int, int]) -> bool:
         """Determines whether widget contains `pos`.
 
@@ -577,6 +654,9 @@ class Widget:  # pylint: disable=too-many-public-methods
     def move(self, diff_x: int, diff_y: int) -> None:
         """Moves the widget by the given x and y changes."""
 
+        if diff_x == diff_y == 0:
+            return
+
         self.pos = (self.pos[0] + diff_x, self.pos[1] + diff_y)
 
         adjusted = []
@@ -741,6 +821,15 @@ class Label(Widget):
     serialized = Widget.serialized + ["*value", "align", "padding"]
     styles = w_styles.StyleManager(value="")
 
+    retain_lines = True
+
+    cache_lines = True
+    """Reuse the lines of the previous `get_lines` call while nothing affecting them
+    changes, i.e. the value, width, paddings, depth, value style or the markup context.
+
+    Labels whose markup calls impure macros, or that are styled by anything but markup
+    or highlighters, are always rendered again."""
+
     def __init__(
         self,
         value: str = "",
@@ -768,16 +857,62 @@ class Label(Widget):
         self.non_first_padding = non_first_padding
         self.width = real_length(value) + self.padding
 
+        # The key, value style & lines of the last render that can be reused
+        self._line_cache: tuple[tuple, w_styles.StyleCall, list[str]] | None = None
+
         if style != "":
             self.styles.value = style
 
+    def _is_cacheable(self, style: w_styles.StyleCall) -> bool:
+        """Determines whether the output of the given value style can be reused."""
+
+        return style.is_pure() and not tim.has_impure_macro(self.value)
+
+    def can_retain_lines(self) -> bool:
+        """Determines whether the lines of the last render can be reused while clean.
+
+        This is the case when the lines are cacheable, see `cache_lines`.
+        """
+
+        return (
+            self.retain_lines
+            and self.cache_lines
+            and self._is_cacheable(self.styles.value)
+        )
+
     def get_lines(self) -> list[str]:
         """Get lines representing this Label, breaking lines as necessary"""
 
+        style = self.styles.value
+        key = (
+            self.value,
+            self.width,
+            self.padding,
+            self.non_first_padding,
+            self.depth,
+            tim.version,
+        )
+
+        if self.cache_lines and self._line_cache is not None:
+            cached_key, cached_style, cached_lines = self._line_cache
+
+            if cached_key == key and cached_style is style:
+                return cached_lines.copy()
+
+        lines = self._render_lines(style)
+
+        if self.cache_lines and self._is_cacheable(style):
+            self._line_cache = key, style, lines.copy()
+
+        return lines
+
+    def _render_lines(self, style: w_styles.StyleCall) -> list[str]:
+        """Styles & breaks the value into lines."""
+
         lines = []
         limit = self.width - self.padding
         broken = break_line(
-            self.styles.value(self.value),
+            style(self.value),
             limit=limit,
             non_first_limit=limit - self.non_first_padding,
         )
@@ -826,7 +961,11 @@ class ScrollableWidget(Widget):
             max(0, self._scroll_offset + offset), self._max_scroll
         )
 
-        return base != self._scroll_offset
+        if base == self._scroll_offset:
+            return False
+
+        self.mark_dirty()
+        return True
 
     def scroll_end(self, end: int) -> int:
         """Scrolls to either top or bottom end of this object.
@@ -847,7 +986,11 @@ class ScrollableWidget(Widget):
         elif end == -1:
             self._scroll_offset = self._max_scroll
 
-        return base != self._scroll_offset
+        if base == self._scroll_offset:
+            return False
+
+        self.mark_dirty()
+        return True
 
     def get_lines(self) -> list[str]:
         ...
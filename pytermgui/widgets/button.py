@@ -7,6 +7,7 @@ from typing import Any, Callable, Optional
 
 from ..ansi_interface import MouseAction, MouseEvent
 from ..input import keys
+from ..markup import tim
 from . import styles as w_styles
 from .base import Widget
 
@@ -22,6 +23,8 @@ class Button(Widget):
 
     chars: dict[str, w_styles.CharType] = {"delimiter": ["  ", "  "]}
 
+    retain_lines = True
+
     def __init__(
         self,
         label: str = "Button",
@@ -85,6 +88,24 @@ class Button(Widget):
 
         return False
 
+    def can_retain_lines(self) -> bool:
+        """Determines whether the lines of the last render can be reused while clean.
+
+        This is only the case when every style is pure (see
+        `pytermgui.widgets.styles.StyleCall.is_pure`), and neither the label nor the
+        delimiters call impure macros.
+        """
+
+        if not self.retain_lines:
+            return False
+
+        delimiters = self._get_char("delimiter")
+        text = "".join(delimiters) + self.label
+
+        return not tim.has_impure_macro(text) and all(
+            self.styles[key].is_pure() for key in ("label", "highlight", "_current")
+        )
+
     def get_lines(self) -> list[str]:
         """Get object lines"""
 
@@ -6,6 +6,8 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from itertools import accumulate
 from typing import Any, Callable, Iterator, cast
 
 from ..ansi_interface import MouseAction, MouseEvent, clear, reset
@@ -20,7 +22,8 @@ from ..enums import (
 )
 from ..exceptions import WidthExceededError
 from ..input import keys
-from ..regex import real_length, strip_markup
+from ..markup import tim
+from ..regex import real_length, real_lengths, strip_markup
 from . import boxes
 from . import styles as w_styles
 from .base import ScrollableWidget, Widget
@@ -53,10 +56,44 @@ class Container(ScrollableWidget):
 
     overflow = Overflow.get_default()
 
+    retain_lines = True
+
+    virtualize = False
+    """When set and `overflow` is `Overflow.SCROLL`, only the children within the
+    scrolled viewport are rendered.
+
+    The heights of children are remembered from when they were last rendered, and the
+    ones that haven't been rendered yet are estimated from the average of the others.
+    This makes rendering cost independent of the amount of children, at the expense
+    of the scrollbar range being approximate until every child has been seen."""
+
     # TODO: Add `WidgetConvertible`? type instead of Any
     def __init__(self, *widgets: Any, **attrs: Any) -> None:
         """Initialize Container data"""
 
+        self._child_heights: dict[int, int] = {}
+        self._layout_width = 0
+        self._layout_widgets: list[Widget] = []
+        self._layout_heights: list[int] = []
+        self._layout_offsets: list[int] = [0]
+        self._visible_range: tuple[int, int] | None = None
+
+        # The key & lines of retainable children, and whether all rendered children
+        # were retainable the last time
+        self._retained_lines: dict[int, tuple[tuple, list[str]]] = {}
+        self._retains_children = True
+
+        # Whether this container stays dirty once the lines of its last render are used,
+        # see `_settle_dirty`
+        self._dirty_after_render = False
+
+        # The key of the aligners, the left, center & right aligners, the left border's
+        # length and the inner width
+        self._aligners: tuple[tuple, tuple, int, int] | None = None
+
+        # The alignment key, source lines & aligned lines of each child
+        self._aligned_lines: dict[int, tuple[tuple, list[str], list[str]]] = {}
+
         super().__init__(**attrs)
 
         autosize = self.overflow is Overflow.SCROLL and "height" not in attrs
@@ -299,6 +336,7 @@ class Container(ScrollableWidget):
         """
 
         self._widgets[index] = value
+        self.mark_dirty()
 
     def __contains__(self, other: object) -> bool:
         """Determines if self._widgets contains other widget.
@@ -344,12 +382,17 @@ class Container(ScrollableWidget):
         assert isinstance(other, Widget)
 
         self._widgets.append(other)
+        self.mark_dirty()
+
         if isinstance(other, Container):
             other.set_recursive_depth(self.depth + 2)
         else:
             other.depth = self.depth + 1
 
-        other.get_lines()
+        # Virtualized children are rendered once they are scrolled into view
+        if not self.virtualize:
+            other.get_lines()
+
         other.parent = self
 
         if run_get_lines:
@@ -359,7 +402,7 @@ class Container(ScrollableWidget):
 
     def _get_aligners(
         self, widget: Widget, borders: tuple[str, str]
-    ) -> tuple[Callable[[str], str], int]:
+    ) -> tuple[Callable[..., str], int]:
         """Gets an aligning method and position offset.
 
         Args:
@@ -369,24 +412,72 @@ class Container(ScrollableWidget):
         Returns:
             A tuple of a method that, when called with a line, will return that line
             centered using the passed in widget's parent_align and width, as well as
-            the horizontal offset resulting from the widget being aligned.
+            the horizontal offset resulting from the widget being aligned. The method
+            optionally takes the line's already known `real_length` as its second
+            argument.
+        """
+
+        key = (
+            self.width,
+            self.depth,
+            borders,
+            self.styles.border,
+            self.styles.fill,
+            tim.version,
+        )
+
+        if self._aligners is None or self._aligners[0] != key:
+            self._aligners = (key, *self._create_aligners(borders))
+
+        _, aligners, left_length, inner_width = self._aligners
+        align_left, align_center, align_right = aligners
+
+        if widget.parent_align == HorizontalAlignment.CENTER:
+            total = inner_width - widget.width
+            padding, offset = divmod(total, 2)
+            return align_center, left_length + padding + offset
+
+        if widget.parent_align == HorizontalAlignment.RIGHT:
+            return align_right, self.width - left_length - widget.width
+
+        # Default to left-aligned
+        return align_left, left_length
+
+    def _create_aligners(
+        self, borders: tuple[str, str]
+    ) -> tuple[tuple[Callable[..., str], ...], int, int]:
+        """Creates the aligning methods used by `_get_aligners`.
+
+        Args:
+            borders: The left and right borders to put lines within.
+
+        Returns:
+            The left, center & right aligning methods, the length of the left border
+            and the width available between the borders.
         """
 
         left, right = self.styles.border(borders[0]), self.styles.border(borders[1])
         char = " "
 
         fill = self.styles.fill
+        inner_width = self.width - real_length(left + right)
 
-        def _align_left(text: str) -> str:
+        def _align_left(text: str, length: int | None = None) -> str:
             """Align line to the left"""
 
-            padding = self.width - real_length(left + right) - real_length(text)
+            if length is None:
+                length = real_length(text)
+
+            padding = inner_width - length
             return left + text + fill(padding * char) + right
 
-        def _align_center(text: str) -> str:
+        def _align_center(text: str, length: int | None = None) -> str:
             """Align line to the center"""
 
-            total = self.width - real_length(left + right) - real_length(text)
+            if length is None:
+                length = real_length(text)
+
+            total = inner_width - length
             padding, offset = divmod(total, 2)
             return (
                 left
@@ -396,22 +487,18 @@ class Container(ScrollableWidget):
                 + right
             )
 
-        def _align_right(text: str) -> str:
+        def _align_right(text: str, length: int | None = None) -> str:
             """Align line to the right"""
 
-            padding = self.width - real_length(left + right) - real_length(text)
-            return left + fill(padding * char) + text + right
+            if length is None:
+                length = real_length(text)
 
-        if widget.parent_align == HorizontalAlignment.CENTER:
-            total = self.width - real_length(left + right) - widget.width
-            padding, offset = divmod(total, 2)
-            return _align_center, real_length(left) + padding + offset
+            padding = inner_width - length
+            return left + fill(padding * char) + text + right
 
-        if widget.parent_align == HorizontalAlignment.RIGHT:
-            return _align_right, self.width - real_length(left) - widget.width
+        aligners = (_align_left, _align_center, _align_right)
 
-        # Default to left-aligned
-        return _align_left, real_length(left)
+        return aligners, real_length(left), inner_width
 
     def _update_width(self, widget: Widget) -> None:
         """Updates the width of widget or self.
@@ -499,6 +586,362 @@ class Container(ScrollableWidget):
             f"Vertical alignment {self.vertical_align} is not implemented for {type(self)}."
         )
 
+    def _update_layout(self) -> None:
+        """Updates the heights & offsets of children used for virtualization.
+
+        Heights are remembered from when children were last rendered, and unknown ones
+        are estimated from the average of the known ones. They are only gathered again
+        when the children or the width of this container change. In the latter case
+        they are forgotten, as the lines of children might wrap differently.
+        """
+
+        if self._layout_width == self.width and self._layout_widgets == self._widgets:
+            return
+
+        if self._layout_width != self.width:
+            self._child_heights = {}
+            self._layout_width = self.width
+
+        known = self._child_heights
+
+        # Drop the heights of removed children every once in a while
+        if len(known) > 2 * len(self._widgets):
+            ids = {id(widget) for widget in self._widgets}
+            self._child_heights = known = {
+                key: value for key, value in known.items() if key in ids
+            }
+
+        estimate = round(sum(known.values()) / len(known)) if known else 1
+
+        self._layout_widgets = self._widgets.copy()
+        self._layout_heights = [
+            known.get(id(widget), estimate) for widget in self._widgets
+        ]
+        self._layout_offsets = list(accumulate(self._layout_heights, initial=0))
+
+    def _get_visible_lines(
+        self, borders: list[str], has_top_bottom: tuple[bool, bool]
+    ) -> tuple[list[str], list[Widget]]:
+        """Renders only the children that intersect the scrolled viewport.
+
+        Children are positioned the same way as when every one of them is rendered,
+        so mouse handling and `positioned_line_buffer` remain correct.
+
+        Args:
+            borders: The border characters of this container.
+            has_top_bottom: Whether there is a top and bottom border.
+
+        Returns:
+            The visible lines, already scrolled, as well as the children that were
+            rendered.
+        """
+
+        self._update_layout()
+
+        heights = self._layout_heights
+        content_height = self.height - sum(has_top_bottom)
+        align_key = self._get_align_key(borders)
+
+        first, top = self._get_viewport_start(content_height)
+
+        lines: list[str] = []
+        last = first
+        changed = False
+
+        while (
+            last < len(self._widgets)
+            and top + len(lines) < self._scroll_offset + content_height
+        ):
+            widget = self._widgets[last]
+
+            # Let children that were never rendered settle their size first, as they
+            # missed out on the layout passes of previous frames
+            if id(widget) not in self._child_heights:
+                widget.get_lines()
+                self._update_width(widget)
+
+            source, aligned = self._layout_child(
+                widget,
+                borders,
+                self.pos[1] + top + len(lines) + (1 if has_top_bottom[0] else 0),
+                align_key,
+            )
+            lines.extend(aligned)
+
+            self._child_heights[id(widget)] = len(source)
+
+            if heights[last] != len(source):
+                heights[last] = len(source)
+                changed = True
+
+            last += 1
+
+        if changed:
+            self._layout_offsets = list(accumulate(heights, initial=0))
+            self._max_scroll = self._layout_offsets[-1] - content_height
+
+        self._visible_range = (first, last)
+
+        start = self._scroll_offset - top
+        return lines[start : start + content_height], self._widgets[first:last]
+
+    def _get_viewport_start(self, content_height: int) -> tuple[int, int]:
+        """Clamps the scroll offset, and finds the first child within the viewport.
+
+        Args:
+            content_height: The height available for the children.
+
+        Returns:
+            The index of the first child whose bottom reaches into the viewport, and
+            the vertical offset of its top within the content.
+        """
+
+        offsets = self._layout_offsets
+
+        self._max_scroll = offsets[-1] - content_height
+        self._scroll_offset = max(0, min(self._scroll_offset, self._max_scroll))
+
+        first = bisect_right(offsets, self._scroll_offset) - 1
+        return first, offsets[first]
+
+    def _get_all_lines(
+        self, borders: list[str], has_top_bottom: tuple[bool, bool]
+    ) -> tuple[list[str], list[Widget]]:
+        """Renders every child, and applies `overflow` to the result.
+
+        Args:
+            borders: The border characters of this container.
+            has_top_bottom: Whether there is a top and bottom border.
+
+        Returns:
+            The lines within the container, already scrolled, as well as the children
+            that were rendered.
+        """
+
+        self._visible_range = None
+
+        lines: list[str] = []
+        overflow = self.overflow
+        content_height = self.height - sum(has_top_bottom)
+        align_key = self._get_align_key(borders)
+
+        for widget in self._widgets:
+            _, widget_lines = self._layout_child(
+                widget,
+                borders,
+                self.pos[1] + len(lines) + (1 if has_top_bottom[0] else 0),
+                align_key,
+            )
+
+            available = content_height - len(lines)
+
+            if len(widget_lines) > available:
+                if overflow is Overflow.HIDE:
+                    widget_lines = widget_lines[: max(available, 0)]
+
+                elif overflow == Overflow.AUTO:
+                    overflow = Overflow.SCROLL
+
+            lines.extend(widget_lines)
+
+        if overflow == Overflow.SCROLL:
+            self._max_scroll = len(lines) - content_height
+            scroll = max(0, min(self._scroll_offset, len(lines) - content_height))
+
+            self._scroll_offset = scroll
+            lines = lines[scroll : scroll + content_height]
+
+        elif overflow == Overflow.RESIZE:
+            self.height = len(lines) + sum(has_top_bottom)
+
+        return lines, self._widgets
+
+    def _layout_child(
+        self, widget: Widget, borders: list[str], ypos: int, align_key: tuple
+    ) -> tuple[list[str], list[str]]:
+        """Sizes, renders & aligns a child.
+
+        The width of retained children can't have changed, as `align_key` includes
+        everything the available width depends on, so they aren't resized.
+
+        Args:
+            widget: The child to lay out.
+            borders: The border characters of this container.
+            ypos: The vertical position of the child.
+            align_key: The result of `_get_align_key`.
+
+        Returns:
+            The lines of the child, and the same lines aligned within this container.
+        """
+
+        if not self._is_retained(widget, align_key):
+            self._update_width(widget)
+
+        align, offset = self._get_aligners(widget, (borders[0], borders[2]))
+
+        source = self._render_child(widget, (self.pos[0] + offset, ypos), align_key)
+        aligned = self._align_child(
+            widget, source, align, align_key + (widget.parent_align,)
+        )
+
+        return source, aligned
+
+    def _get_virtual_top(self, widget: Widget) -> int:
+        """Gets the vertical position of a child, whether it was rendered or not."""
+
+        self._update_layout()
+
+        borders = self._get_char("border")
+        assert isinstance(borders, list)
+
+        top = self._layout_offsets[self._widgets.index(widget)]
+        return self.pos[1] + top + (1 if real_length(borders[1]) else 0)
+
+    def can_retain_lines(self) -> bool:
+        """Determines whether the lines of the last render can be reused while clean.
+
+        This is only the case when all children rendered by it could be retained.
+        """
+
+        return self.retain_lines and self._retains_children
+
+    def _is_retained(self, widget: Widget, key: tuple) -> bool:
+        """Determines whether a child can reuse the lines of its last render.
+
+        Args:
+            widget: The child to check.
+            key: Everything besides the child itself that its lines depend on, such as
+                the markup version and the width available to it.
+        """
+
+        cached = self._retained_lines.get(id(widget))
+
+        return cached is not None and not widget.is_dirty and cached[0] == key
+
+    def _render_child(
+        self, widget: Widget, pos: tuple[int, int], key: tuple
+    ) -> list[str]:
+        """Moves a child to `pos`, and gets its lines.
+
+        Children that aren't dirty and could be retained reuse the lines of their last
+        render, and are moved along with their own children instead of rendering them.
+
+        Args:
+            widget: The child to render.
+            pos: The new position of the child.
+            key: See `_is_retained`.
+
+        Returns:
+            The lines of the child.
+        """
+
+        if self._is_retained(widget, key):
+            widget.move(pos[0] - widget.pos[0], pos[1] - widget.pos[1])
+            return self._retained_lines[id(widget)][1]
+
+        # Cleared before rendering, so children may re-dirty themselves in get_lines
+        widget.is_dirty = False
+        widget.pos = pos
+
+        lines = widget.get_lines()
+
+        if isinstance(widget, Container):
+            widget._settle_dirty()  # pylint: disable=protected-access
+
+        if widget.can_retain_lines() and len(widget.positioned_line_buffer) == 0:
+            self._retained_lines[id(widget)] = key, lines
+
+        else:
+            self._retained_lines.pop(id(widget), None)
+            self._retains_children = False
+
+        return lines
+
+    def _align_child(
+        self,
+        widget: Widget,
+        source: list[str],
+        align: Callable[..., str],
+        key: tuple,
+    ) -> list[str]:
+        """Aligns the lines of a child, reusing them while its lines are retained.
+
+        Args:
+            widget: The child the lines belong to.
+            source: The lines of the child.
+            align: The aligner returned by `_get_aligners`.
+            key: Everything besides the source lines that the alignment depends on.
+
+        Returns:
+            The aligned lines. These must not be mutated.
+        """
+
+        cached = self._aligned_lines.get(id(widget))
+
+        if cached is not None and cached[1] is source and cached[0] == key:
+            return cached[2]
+
+        aligned = list(map(align, source, real_lengths(source)))
+        self._aligned_lines[id(widget)] = key, source, aligned
+
+        return aligned
+
+    def _get_align_key(self, borders: list[str]) -> tuple:
+        """Gets everything but the child's alignment that aligned lines depend on."""
+
+        return (
+            self.width,
+            self.depth,
+            borders[0],
+            borders[2],
+            self.styles.border,
+            self.styles.fill,
+            tim.version,
+        )
+
+    def _record_dirty(self, width: int, rendered: list[Widget]) -> None:
+        """Records whether this container should stay dirty after its render is used.
+
+        Resizing children during rendering marks them, and so this container, as dirty,
+        even though the new lines already reflect it. Only a change to the container's
+        own width (see `_update_width`), or children that dirtied themselves while
+        rendering, should leave it dirty.
+
+        Args:
+            width: The width of this container when rendering started.
+            rendered: The children that were rendered.
+        """
+
+        self._dirty_after_render = self.width != width or any(
+            widget.is_dirty for widget in rendered
+        )
+
+    def _settle_dirty(self) -> None:
+        """Clears the dirtiness caused by the last render, once its lines were used.
+
+        This is called by whatever took the lines, i.e. the parent container, or the
+        compositor for windows. Until then the container stays dirty, so a render
+        requested by anything else (like `_add_widget`) doesn't hide changes from the
+        parent.
+        """
+
+        self.__dict__["is_dirty"] = self._dirty_after_render
+
+    def _prune_retained_lines(self) -> None:
+        """Drops the retained lines of removed children every once in a while."""
+
+        cached = len(self._retained_lines) + len(self._aligned_lines)
+
+        if cached > 4 * len(self._widgets):
+            ids = {id(widget) for widget in self._widgets}
+
+            self._retained_lines = {
+                key: value for key, value in self._retained_lines.items() if key in ids
+            }
+            self._aligned_lines = {
+                key: value for key, value in self._aligned_lines.items() if key in ids
+            }
+
     def lazy_add(self, other: object) -> None:
         """Adds `other` without running get_lines.
 
@@ -513,6 +956,9 @@ class Container(ScrollableWidget):
     def move(self, diff_x: int, diff_y: int) -> None:
         """Moves the widget and its children by the given x and y changes."""
 
+        if diff_x == diff_y == 0:
+            return
+
         super().move(diff_x, diff_y)
 
         for child in self._widgets:
@@ -522,7 +968,8 @@ class Container(ScrollableWidget):
         """Gets all lines by spacing out inner widgets.
 
         This method reflects & applies both width settings, as well as
-        the `parent_align` field.
+        the `parent_align` field. Children that aren't dirty reuse the lines of their
+        last render when possible, see `pytermgui.widgets.base.Widget.retain_lines`.
 
         Returns:
             A list of all lines that represent this Container.
@@ -547,59 +994,34 @@ class Container(ScrollableWidget):
                 + self.styles.corner(right)
             )
 
-        lines: list[str] = []
+        start_width = self.width
 
         borders = self._get_char("border")
         corners = self._get_char("corner")
 
         has_top_bottom = (real_length(borders[1]) > 0, real_length(borders[3]) > 0)
 
-        align, offset = self._get_aligners(self, (borders[0], borders[2]))
-
-        overflow = self.overflow
-
-        for widget in self._widgets:
-            align, offset = self._get_aligners(widget, (borders[0], borders[2]))
-
-            self._update_width(widget)
-
-            widget.pos = (
-                self.pos[0] + offset,
-                self.pos[1] + len(lines) + (1 if has_top_bottom[0] else 0),
-            )
+        align, _ = self._get_aligners(self, (borders[0], borders[2]))
 
-            widget_lines: list[str] = []
-            for line in widget.get_lines():
-                if len(lines) + len(widget_lines) >= self.height - sum(has_top_bottom):
-                    if overflow is Overflow.HIDE:
-                        break
+        self._retains_children = True
+        self._prune_retained_lines()
 
-                    if overflow == Overflow.AUTO:
-                        overflow = Overflow.SCROLL
+        if self.virtualize and self.overflow is Overflow.SCROLL:
+            lines, rendered = self._get_visible_lines(borders, has_top_bottom)
 
-                widget_lines.append(align(line))
-
-            lines.extend(widget_lines)
-
-        if overflow == Overflow.SCROLL:
-            self._max_scroll = len(lines) - self.height + sum(has_top_bottom)
-            height = self.height - sum(has_top_bottom)
-
-            self._scroll_offset = max(0, min(self._scroll_offset, len(lines) - height))
-            lines = lines[self._scroll_offset : self._scroll_offset + height]
-
-        elif overflow == Overflow.RESIZE:
-            self.height = len(lines) + sum(has_top_bottom)
+        else:
+            lines, rendered = self._get_all_lines(borders, has_top_bottom)
 
         vertical_offset, lines = self._apply_vertalign(
             lines, self.height - len(lines) - sum(has_top_bottom), align("")
         )
 
-        for widget in self._widgets:
+        for widget in rendered:
             widget.move(0, vertical_offset)
 
-            self.positioned_line_buffer.extend(widget.positioned_line_buffer)
-            widget.positioned_line_buffer = []
+            if widget.positioned_line_buffer:
+                self.positioned_line_buffer.extend(widget.positioned_line_buffer)
+                widget.positioned_line_buffer = []
 
         if has_top_bottom[0]:
             lines.insert(0, _get_border(corners[0], borders[1], corners[1]))
@@ -608,6 +1030,8 @@ class Container(ScrollableWidget):
             lines.append(_get_border(corners[3], borders[3], corners[2]))
 
         self.height = len(lines)
+        self._record_dirty(start_width, rendered)
+
         return lines
 
     def set_widgets(self, new: list[Widget]) -> None:
@@ -618,6 +1042,8 @@ class Container(ScrollableWidget):
         """
 
         self._widgets = []
+        self.mark_dirty()
+
         for widget in new:
             self._add_widget(widget)
 
@@ -650,7 +1076,10 @@ class Container(ScrollableWidget):
             The widget that was popped off the list.
         """
 
-        return self._widgets.pop(index)
+        widget = self._widgets.pop(index)
+        self.mark_dirty()
+
+        return widget
 
     def remove(self, other: Widget) -> None:
         """Remove widget from self._widgets
@@ -661,7 +1090,8 @@ class Container(ScrollableWidget):
             other: The widget to remove.
         """
 
-        return self._widgets.remove(other)
+        self._widgets.remove(other)
+        self.mark_dirty()
 
     def set_recursive_depth(self, value: int) -> None:
         """Set depth for this Container and all its children.
@@ -709,6 +1139,11 @@ class Container(ScrollableWidget):
         parent = widget.parent
 
         while isinstance(parent, Container):
+            # Children of virtualized containers might not have been positioned yet
+            if parent.virtualize:
+                # pylint: disable=protected-access
+                widget.pos = (widget.pos[0], parent._get_virtual_top(widget))
+
             if parent.overflow is Overflow.SCROLL:
                 borders = parent._get_char("border")  # pylint: disable=protected-access
                 assert isinstance(borders, list)
@@ -822,11 +1257,19 @@ class Container(ScrollableWidget):
 
         release = MouseEvent(MouseAction.RELEASE, event.position)
 
-        selectables_index = 0
         event.position = (event.position[0], event.position[1] + self._scroll_offset)
 
+        # Only the children within the viewport of a virtualized container have
+        # up-to-date positions
+        first, last = self._visible_range or (0, len(self._widgets))
+        selectables_index = sum(
+            widget.selectables_length
+            for widget in self._widgets[:first]
+            if widget.is_selectable
+        )
+
         handled = False
-        for widget in self._widgets:
+        for widget in self._widgets[first:last]:
             if (
                 widget.pos[1] - self.pos[1] - self._scroll_offset
                 > self.content_dimensions[1]
@@ -1020,15 +1463,33 @@ class Splitter(Container):
     }
 
     parent_align = HorizontalAlignment.RIGHT
+    retain_lines = True
+
+    def __init__(self, *widgets: Any, **attrs: Any) -> None:
+        """Initialize Splitter data"""
+
+        self._separator_cache: tuple[tuple, tuple[str, int]] | None = None
+        self._column_cache: dict[int, tuple[tuple, list[str], Any]] = {}
+        self._next_column_cache: dict[int, tuple[tuple, list[str], Any]] = {}
+        self._joined_cache: tuple[list[list[str]], str, list[str]] | None = None
+
+        super().__init__(*widgets, **attrs)
 
     def _align_line(
-        self, alignment: HorizontalAlignment, target_width: int, line: str
+        self,
+        alignment: HorizontalAlignment,
+        target_width: int,
+        line: str,
+        length: int | None = None,
     ) -> tuple[int, str]:
         """Align a line
 
         r/wordavalanches"""
 
-        available = target_width - real_length(line)
+        if length is None:
+            length = real_length(line)
+
+        available = target_width - length
         fill_style = self._get_style("fill")
 
         char = fill_style(" ")
@@ -1049,25 +1510,82 @@ class Splitter(Container):
 
         return self.height, self.width
 
+    def _get_separator(self) -> tuple[str, int]:
+        """Gets the styled separator and its length, reusing them if nothing changed."""
+
+        style = self._get_style("separator")
+        char = self._get_char("separator")
+        key = (style, char, tim.version)
+
+        if self._separator_cache is None or self._separator_cache[0] != key:
+            # An error will be raised if `separator` is not the correct type (str).
+            separator = style(char)  # type: ignore
+            self._separator_cache = key, (separator, real_length(separator))
+
+        return self._separator_cache[1]
+
+    def _get_column(self, widget: Widget, width: int) -> tuple[list[str], int, int]:
+        """Gets the aligned lines of a child, reusing them if nothing changed.
+
+        Args:
+            widget: The child to get the column of.
+            width: The width the child's lines are aligned to.
+
+        Returns:
+            The aligned lines, the horizontal padding before the child and the width
+            the column takes up.
+        """
+
+        source = self._render_child(widget, widget.pos, (tim.version,))
+        key = (width, widget.parent_align, self._get_style("fill"), tim.version)
+
+        cached = self._column_cache.get(id(widget))
+        if cached is not None and cached[0] == key and cached[1] == source:
+            self._next_column_cache[id(widget)] = cached
+            return cached[2]
+
+        inner = []
+        padding = 0
+        lengths = real_lengths(source)
+
+        for line, length in zip(source, lengths):
+            # See `enums.py` for information about this ignore
+            padding, aligned = self._align_line(
+                cast(HorizontalAlignment, widget.parent_align), width, line, length
+            )
+            inner.append(aligned)
+
+        # Aligning pads lines up to `width`, but never shortens them
+        column_width = max(width, lengths[-1]) if lengths else 0
+
+        result = inner, padding, column_width
+        self._next_column_cache[id(widget)] = key, source, result
+
+        return result
+
     def get_lines(self) -> list[str]:  # pylint: disable=too-many-locals
-        """Join all widgets horizontally."""
+        """Join all widgets horizontally.
 
-        # An error will be raised if `separator` is not the correct type (str).
-        separator = self._get_style("separator")(self._get_char("separator"))  # type: ignore
-        separator_length = real_length(separator)
+        The aligned lines of each child are reused while its lines & width stay the
+        same, and the joined lines while no column changed.
+        """
+
+        separator, separator_length = self._get_separator()
+        start_width = self.width
 
         target_width, error = divmod(
             self.width - (len(self._widgets) - 1) * separator_length, len(self._widgets)
         )
 
         self.positioned_line_buffer = []
+        self._next_column_cache = {}
+        self._retains_children = True
+        self._prune_retained_lines()
         vertical_lines = []
         column_widths = []
         total_offset = 0
 
         for widget in self._widgets:
-            inner = []
-
             if widget.size_policy is SizePolicy.STATIC:
                 target_width += target_width - widget.width
                 width = widget.width
@@ -1078,13 +1596,7 @@ class Splitter(Container):
 
             column_widths.append(width)
 
-            aligned: str | None = None
-            for line in widget.get_lines():
-                # See `enums.py` for information about this ignore
-                padding, aligned = self._align_line(
-                    cast(HorizontalAlignment, widget.parent_align), width, line
-                )
-                inner.append(aligned)
+            inner, padding, column_width = self._get_column(widget, width)
 
             new_pos = (
                 self.pos[0] + padding + total_offset,
@@ -1094,7 +1606,11 @@ class Splitter(Container):
             diff_x = new_pos[0] - widget.pos[0]
             diff_y = new_pos[1] - widget.pos[1]
 
+            # Moving also updates the positions of the child's own children
             widget.pos = new_pos
+            if isinstance(widget, Container):
+                for child in widget:
+                    child.move(diff_x, diff_y)
 
             for pos, line in widget.positioned_line_buffer:
                 self.positioned_line_buffer.append(
@@ -1103,22 +1619,54 @@ class Splitter(Container):
 
             widget.positioned_line_buffer = []
 
-            if aligned is not None:
-                total_offset += real_length(inner[-1]) + separator_length
+            if column_width > 0:
+                total_offset += column_width + separator_length
 
             vertical_lines.append(inner)
 
-        # Pad columns to max height using each column's actual width.
-        # (target_width is mutated above, so we can't use it as a fillvalue)
-        max_height = max(len(col) for col in vertical_lines) if vertical_lines else 0
-        for i, col in enumerate(vertical_lines):
-            fill = " " * column_widths[i]
-            while len(col) < max_height:
-                col.append(fill)
+        # Forget the columns of removed children
+        self._column_cache = self._next_column_cache
+
+        cached = self._joined_cache
+        if (
+            cached is not None
+            and cached[1] == separator
+            and len(cached[0]) == len(vertical_lines)
+            and all(old is new for old, new in zip(cached[0], vertical_lines))
+        ):
+            lines = cached[2].copy()
 
-        lines = []
-        for horizontal in zip(*vertical_lines):
-            lines.append((reset() + separator).join(horizontal))
+        else:
+            lines = self._join_columns(vertical_lines, column_widths, separator)
+            self._joined_cache = vertical_lines, separator, lines.copy()
 
         self.height = max(widget.height for widget in self)
+        self._record_dirty(start_width, self._widgets)
+
         return lines
+
+    @staticmethod
+    def _join_columns(
+        columns: list[list[str]], widths: list[int], separator: str
+    ) -> list[str]:
+        """Joins columns of lines horizontally.
+
+        Args:
+            columns: The lines of each column.
+            widths: The width of each column, used to pad the shorter ones.
+            separator: The string put between the columns.
+
+        Returns:
+            The joined lines.
+        """
+
+        # Pad columns to max height using each column's actual width.
+        # (target_width is mutated while laying out, so it can't be used as fillvalue)
+        max_height = max(len(col) for col in columns) if columns else 0
+        padded = [
+            col + [" " * width] * (max_height - len(col))
+            for col, width in zip(columns, widths)
+        ]
+
+        joiner = reset() + separator
+        return [joiner.join(horizontal) for horizontal in zip(*padded)]
@@ -74,6 +74,20 @@ class StyleCall:
 
         return other.method == self.method
 
+    def is_pure(self) -> bool:
+        """Determines whether the output of this style only depends on its input.
+
+        This is the case for highlighters, and markup that calls no impure macros.
+        """
+
+        if isinstance(self.method, HighlighterStyle):
+            return True
+
+        if not isinstance(self.method, MarkupFormatter):
+            return False
+
+        return not tim.has_impure_macro(self.method.markup)
+
 
 @dataclass
 class MarkupFormatter:
@@ -270,12 +284,16 @@ class StyleManager(UserDict):  # pylint: disable=too-many-ancestors
 
         if isinstance(item, StyleCall):
             self.data[key] = StyleCall(self.parent, item.method)
-            return
 
-        if isinstance(item, str):
-            item = self.expand_shorthand(item)
+        else:
+            if isinstance(item, str):
+                item = self.expand_shorthand(item)
+
+            self.data[key] = StyleCall(self.parent, item)
 
-        self.data[key] = StyleCall(self.parent, item)
+        # Widgets re-use their lines until they are marked dirty
+        if self._is_setup and not isinstance(self.parent, type):
+            self.parent.mark_dirty()  # type: ignore
 
     def __setitem__(self, key: str, value: StyleValue) -> None:
         """Sets an item in `self.data`.
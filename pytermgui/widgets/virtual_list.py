@@ -0,0 +1,500 @@
+"""Widgets that display rows pulled lazily from a data source.
+
+Unlike a `pytermgui.widgets.containers.Container` of labels, these widgets never create
+an object per row. Rows are fetched from their source & styled only when they are
+scrolled into view, so showing a million rows costs as much as showing a hundred:
+
+```python3
+import pytermgui as ptg
+
+processes = [(pid, f"worker-{pid}", pid % 100 / 10) for pid in range(1_000_000)]
+
+table = ptg.DataTable(
+    processes,
+    columns=["PID", "Name", "CPU%"],
+    widths=[10, 20, 8],
+    height=20,
+)
+```
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Sequence, Union
+
+from ..ansi_interface import MouseAction, MouseEvent
+from ..cache import LRUCache
+from ..helpers import clip_ansi
+from ..input import keys
+from ..markup import tim
+from ..regex import escape_markup, real_length
+from . import styles as w_styles
+from .base import ScrollableWidget
+
+__all__ = ["VirtualList", "DataTable"]
+
+RowSource = Union[Sequence[Any], Callable[[int], Any]]
+
+
+class VirtualList(ScrollableWidget):  # pylint: disable=too-many-instance-attributes
+    """A scrollable, selectable list of rows pulled lazily from a data source.
+
+    The source is either a sequence, or a callable returning the row at an index.
+    Rows are turned into markup text by `formatter`, and every row takes up
+    `row_height` lines; longer text is cut off, shorter text is padded.
+
+    Styled rows are kept in a bounded cache keyed by their text, so rows that don't
+    change are only styled once, while changes to the source always show up.
+
+    The scroll offset of this widget is the index of the first visible row.
+    """
+
+    styles = w_styles.StyleManager(
+        row="",
+        highlight="@surface+1 #auto",
+    )
+
+    keys = {
+        "next": {keys.DOWN, keys.CTRL_N, "j"},
+        "previous": {keys.UP, keys.CTRL_P, "k"},
+        "page_down": {keys.CTRL_D},
+        "page_up": {keys.CTRL_U},
+        "first": {keys.HOME, "g"},
+        "last": {keys.END, "G"},
+    }
+
+    cache_size = 1024
+    """The most styled rows kept in the cache of each instance."""
+
+    def __init__(
+        self,
+        source: RowSource,
+        length: int | Callable[[], int] | None = None,
+        formatter: Callable[[Any], str] = str,
+        row_height: int | Callable[[int], int] = 1,
+        onselect: Callable[[int, Any], Any] | None = None,
+        **attrs: Any,
+    ) -> None:
+        """Initializes a VirtualList.
+
+        Args:
+            source: A sequence of rows, or a callable that returns the row at an index.
+            length: The amount of rows, or a callable returning it for sources that
+                grow. Required when `source` is a callable, defaults to `len(source)`
+                otherwise.
+            formatter: Turns a row into the markup text displayed for it. Rows of
+                multiple lines are separated by newlines.
+            row_height: The amount of lines each row takes up, or a callable returning
+                the height of the row at an index.
+            onselect: Called with the index & row whenever a row gets selected.
+        """
+
+        if length is None and callable(source):
+            raise ValueError("A length must be given for callable sources.")
+
+        self.source = source
+        self.length = length
+        self.formatter = formatter
+        self.row_height = row_height
+        self.onselect = onselect
+        self.selected_row: int | None = None
+
+        self._row_cache: LRUCache[list[str]] = LRUCache(maxsize=self.cache_size)
+        self._markup_version = -1
+        self._visible_rows: list[tuple[int, int]] = []
+
+        if "width" not in attrs:
+            attrs["width"] = 40
+
+        if "height" not in attrs:
+            attrs["height"] = 10
+
+        super().__init__(**attrs)
+
+        self._selectables_length = 1
+
+    @property
+    def row_count(self) -> int:
+        """Returns the current amount of rows."""
+
+        if self.length is None:
+            return len(self.source)  # type: ignore
+
+        if callable(self.length):
+            return self.length()
+
+        return self.length
+
+    @property
+    def viewport_height(self) -> int:
+        """Returns the amount of lines available for rows."""
+
+        return self.height
+
+    def get_row(self, index: int) -> Any:
+        """Gets a row from the source.
+
+        Args:
+            index: The index of the row.
+
+        Returns:
+            The row, as stored in the source.
+        """
+
+        if callable(self.source):
+            return self.source(index)
+
+        return self.source[index]
+
+    def get_row_height(self, index: int) -> int:
+        """Gets the amount of lines a row takes up."""
+
+        if callable(self.row_height):
+            return max(self.row_height(index), 1)
+
+        return self.row_height
+
+    def refresh(self) -> None:
+        """Clears the styled rows, so they are styled again when next displayed.
+
+        This only needs to be called after changing this widget's styles.
+        """
+
+        self._row_cache.clear()
+
+    def _update_max_scroll(self) -> None:
+        """Finds the first row that lets the last rows fill the viewport."""
+
+        index = self.row_count
+        available = self.viewport_height
+
+        while index > 0:
+            height = self.get_row_height(index - 1)
+
+            if height > available:
+                break
+
+            available -= height
+            index -= 1
+
+        self._max_scroll = index
+
+    def scroll(self, offset: int) -> bool:
+        """Scrolls by some amount of rows.
+
+        Args:
+            offset: The amount of rows to scroll by. Positive offsets scroll down,
+                negative up.
+
+        Returns:
+            True if the scroll offset changed, False otherwise.
+        """
+
+        self._update_max_scroll()
+
+        return super().scroll(offset)
+
+    def scroll_end(self, end: int) -> int:
+        """Scrolls to either the first or last rows.
+
+        Args:
+            end: 0 goes to the very top, -1 to the very bottom.
+
+        Returns:
+            True if the scroll offset changed, False otherwise.
+        """
+
+        self._update_max_scroll()
+
+        return super().scroll_end(end)
+
+    def scroll_to(self, index: int) -> None:
+        """Scrolls the least amount needed for a row to become fully visible.
+
+        Args:
+            index: The index of the row.
+        """
+
+        if index < self._scroll_offset:
+            self._scroll_offset = index
+            return
+
+        # Find the first row that still lets the target row fit below it
+        first = index
+        available = self.viewport_height - self.get_row_height(index)
+
+        while first > self._scroll_offset:
+            height = self.get_row_height(first - 1)
+
+            if height > available:
+                break
+
+            available -= height
+            first -= 1
+
+        self._scroll_offset = first
+
+    def select_row(self, index: int | None) -> None:
+        """Selects a row, and scrolls it into view.
+
+        Args:
+            index: The index of the row to select, or None to clear the selection.
+                It is clamped to the available rows.
+        """
+
+        count = self.row_count
+
+        if index is None or count == 0:
+            self.selected_row = None
+            return
+
+        index = max(0, min(index, count - 1))
+
+        self.selected_row = index
+        self.scroll_to(index)
+
+        if self.onselect is not None:
+            self.onselect(index, self.get_row(index))
+
+    def get_row_at(self, pos: tuple[int, int]) -> int | None:
+        """Gets the index of the row displayed at a position.
+
+        Args:
+            pos: The position to look at, in the terminal's coordinates.
+
+        Returns:
+            The index of the row, or None if no row is displayed there.
+        """
+
+        line = pos[1] - self.pos[1] - (self.height - self.viewport_height)
+
+        for index, top in self._visible_rows:
+            if top <= line < top + self.get_row_height(index):
+                return index
+
+        return None
+
+    def handle_key(self, key: str) -> bool:
+        """Moves the selection, returning False at the ends so parents can move on."""
+
+        if self.execute_binding(key):
+            return True
+
+        count = self.row_count
+        current = self.selected_row
+
+        if count == 0:
+            return False
+
+        page = max(self.viewport_height // self.get_row_height(current or 0), 1)
+
+        if key in self.keys["next"]:
+            if current == count - 1:
+                return False
+
+            target = 0 if current is None else current + 1
+
+        elif key in self.keys["previous"]:
+            if current is None or current == 0:
+                return False
+
+            target = current - 1
+
+        elif key in self.keys["page_down"]:
+            target = (current or 0) + page
+
+        elif key in self.keys["page_up"]:
+            target = (current or 0) - page
+
+        elif key in self.keys["first"]:
+            target = 0
+
+        elif key in self.keys["last"]:
+            target = count - 1
+
+        else:
+            return False
+
+        self.select_row(target)
+        return True
+
+    def handle_mouse(self, event: MouseEvent) -> bool:
+        """Scrolls on mouse wheel events, and selects rows on click."""
+
+        if super().handle_mouse(event):
+            return True
+
+        if event.action is MouseAction.SCROLL_UP:
+            return self.scroll(-1)
+
+        if event.action is MouseAction.SCROLL_DOWN:
+            return self.scroll(1)
+
+        if event.action is MouseAction.LEFT_CLICK:
+            index = self.get_row_at(event.position)
+
+            if index is not None:
+                self.select_row(index)
+                return True
+
+        return False
+
+    def _style_line(self, line: str, style: w_styles.DepthlessStyleType) -> str:
+        """Styles a line of markup, and fits it to the width of this widget."""
+
+        styled = style(line)
+        length = real_length(styled)
+
+        if length > self.width:
+            return clip_ansi(styled, self.width)
+
+        if length < self.width:
+            # Pad within the style, so backgrounds span the entire row
+            return style(line + " " * (self.width - length))
+
+        return styled
+
+    def _render_row(self, text: str, height: int, selected: bool) -> list[str]:
+        """Gets the lines of a row, from the cache if possible.
+
+        Args:
+            text: The markup text of the row.
+            height: The amount of lines the row takes up.
+            selected: Whether the row is the selected one.
+
+        Returns:
+            Exactly `height` lines, each as wide as this widget.
+        """
+
+        key = (text, self.width, height, selected)
+        lines = self._row_cache.get(key)
+
+        if lines is None:
+            source = text.split("\n")[:height]
+            source += [""] * (height - len(source))
+
+            style = self.styles.highlight if selected else self.styles.row
+            lines = [self._style_line(line, style) for line in source]
+            self._row_cache.set(key, lines)
+
+        return lines
+
+    def _get_row_lines(self) -> list[str]:
+        """Gets the lines of the rows within the viewport."""
+
+        # Styles may refer to aliases, which can be changed at any time
+        if self._markup_version != tim.version:
+            self._row_cache.clear()
+            self._markup_version = tim.version
+
+        count = self.row_count
+        viewport = self.viewport_height
+
+        self._update_max_scroll()
+        self._scroll_offset = max(0, min(self._scroll_offset, self._max_scroll))
+
+        lines: list[str] = []
+        self._visible_rows = []
+
+        index = self._scroll_offset
+        while len(lines) < viewport and index < count:
+            self._visible_rows.append((index, len(lines)))
+
+            text = self.formatter(self.get_row(index))
+            lines.extend(
+                self._render_row(
+                    text, self.get_row_height(index), index == self.selected_row
+                )
+            )
+
+            index += 1
+
+        empty = self._style_line("", self.styles.row)
+
+        return lines[:viewport] + [empty] * (viewport - len(lines))
+
+    def get_lines(self) -> list[str]:
+        """Gets the lines of the visible rows."""
+
+        return self._get_row_lines()
+
+
+class DataTable(VirtualList):
+    """A `VirtualList` that displays rows of cells in aligned columns, under a header.
+
+    Each row is a sequence with one value per column. Values are displayed as plain
+    text, cut off or padded to the width of their column.
+    """
+
+    styles = w_styles.StyleManager.merge(
+        VirtualList.styles,
+        header="bold surface+2",
+    )
+
+    chars = {"separator": " "}
+
+    def __init__(
+        self,
+        source: RowSource,
+        columns: Sequence[str],
+        widths: Sequence[int] | None = None,
+        **attrs: Any,
+    ) -> None:
+        """Initializes a DataTable.
+
+        Args:
+            source: A sequence of rows, or a callable that returns the row at an index.
+                Each row is a sequence with one value per column.
+            columns: The titles of the columns.
+            widths: The width of each column. If not given, the available width is
+                split evenly between them.
+
+        See `VirtualList` for the rest of the arguments.
+        """
+
+        self.columns = list(columns)
+        self.widths = list(widths) if widths is not None else None
+
+        attrs.setdefault("formatter", self._format_row)
+
+        super().__init__(source, **attrs)
+
+    @property
+    def viewport_height(self) -> int:
+        """Returns the amount of lines available for rows, below the header."""
+
+        return max(self.height - 1, 0)
+
+    def get_column_widths(self) -> list[int]:
+        """Gets the width of each column."""
+
+        if self.widths is not None:
+            return self.widths
+
+        separator = self._get_char("separator")
+        assert isinstance(separator, str)
+
+        available = self.width - real_length(separator) * (len(self.columns) - 1)
+        width, extra = divmod(available, max(len(self.columns), 1))
+
+        return [width + (1 if i < extra else 0) for i in range(len(self.columns))]
+
+    def _format_row(self, row: Sequence[Any]) -> str:
+        """Fits the values of a row to their columns, and joins them into markup."""
+
+        separator = self._get_char("separator")
+        assert isinstance(separator, str)
+
+        cells = []
+        for value, width in zip(row, self.get_column_widths()):
+            cell = clip_ansi(str(value), width)
+            cells.append(cell + " " * (width - real_length(cell)))
+
+        return escape_markup(separator.join(cells))
+
+    def get_lines(self) -> list[str]:
+        """Gets the header, followed by the lines of the visible rows."""
+
+        header = self._format_row(self.columns)
+
+        return [self._style_line(header, self.styles.header)] + self._get_row_lines()
@@ -13,4 +13,5 @@ and handles mouse input and more.
 from .compositor import Compositor
 from .layouts import Layout
 from .manager import WindowManager
+from .stats import FrameStats, FrameStatsWindow, summarize_frames
 from .window import Window
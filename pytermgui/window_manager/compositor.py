@@ -5,13 +5,19 @@
 from __future__ import annotations
 
 import time
-from threading import Thread
+from collections import deque
+from threading import Event, Thread
 from typing import Iterator, List, Tuple
 
 from ..animations import animator
-from ..enums import WidgetChange
+from ..enums import RenderMode
+from ..helpers import slice_ansi
+from ..markup import tim
+from ..regex import real_length
+from ..screen import CoverageMask, CursorPlanner, Screen, get_cursor_advance
 from ..term import Terminal, get_terminal
 from ..widgets import Widget
+from .stats import FrameStats
 from .window import Window
 
 PositionedLineList = List[Tuple[Tuple[int, int], str]]
@@ -26,26 +32,79 @@ class Compositor:
     Calling its `run` method will start the drawing thread, which will draw the current
     window states onto the screen. This routine targets `framerate`, though will likely
     not match it perfectly.
+
+    The way frames are written is controlled by `render_mode`. See
+    `pytermgui.enums.RenderMode` for the available options.
+
+    When `event_driven` is set, the draw loop instead blocks until a frame is requested
+    using `request_frame`, or an animation is running. Frames are still limited to
+    `framerate`.
+
+    Statistics of the most recent frames are kept in `frame_stats`. See
+    `pytermgui.window_manager.stats`.
     """
 
-    def __init__(self, windows: list[Window], framerate: int) -> None:
+    def __init__(
+        self,
+        windows: list[Window],
+        framerate: int,
+        render_mode: RenderMode | None = None,
+        retained: bool = False,
+        event_driven: bool = False,
+    ) -> None:
         """Initializes the Compositor.
 
         Args:
             windows: A list of the windows to be drawn.
+            framerate: The target framerate of the draw loop.
+            render_mode: The way frames are written to the terminal. Defaults to
+                `RenderMode.get_default()`.
+            retained: If set, the lines of each window are cached, and only
+                re-rendered once the window is marked dirty. See `composite`.
+            event_driven: If set, the draw loop only draws when a frame is requested,
+                instead of at a fixed rate. See `request_frame`.
         """
 
         self._windows = windows
         self._is_running = False
 
         self._previous: PositionedLineList = []
+        self._screen: Screen | None = None
         self._frametime = 0.0
         self._should_redraw: bool = True
-        self._cache: dict[int, list[str]] = {}
+        self._frame_requested = Event()
+        self._cache: dict[int, tuple[tuple, PositionedLineList]] = {}
+        self._frame: FrameStats | None = None
 
         self.fps = 0
         self.framerate = framerate
 
+        self.render_mode = render_mode or RenderMode.get_default()
+        self.retained = retained
+        self.event_driven = event_driven
+
+        self.idle_timeout = 0.25
+        """The longest time an event-driven draw loop blocks for.
+
+        Terminal resizes are picked up when the loop wakes up, so this is the most time
+        a resize may go unnoticed for.
+        """
+
+        self.bytes_written = 0
+        """The amount of bytes written to the terminal during the last frame."""
+
+        self.bytes_saved = 0
+        """The amount of bytes `RenderMode.DAMAGE` saved during the last frame, by
+        only emitting style deltas and repeating characters."""
+
+        self.repeat_chars = True
+        """Whether `RenderMode.DAMAGE` may use REP (`CSI n b`) for repeated characters.
+
+        Unset this for terminals that don't support it."""
+
+        self.frame_stats: deque[FrameStats] = deque(maxlen=120)
+        """The statistics of the most recently drawn frames, oldest first."""
+
     @property
     def terminal(self) -> Terminal:
         """Returns the current global terminal."""
@@ -67,10 +126,15 @@ class Compositor:
 
             self.terminal.process_pending_resize()
 
+            stats = FrameStats(
+                start=time.perf_counter(), dropped=self._get_dropped(elapsed)
+            )
+
             animator.step(elapsed)
+            stats.animation_time = time.perf_counter() - stats.start
 
             last_frame = time.perf_counter()
-            self.draw()
+            self._draw_frame(stats)
 
             framecount += 1
 
@@ -79,45 +143,150 @@ class Compositor:
                 fps_start_time = last_frame
                 framecount = 0
 
-    # NOTE: This is not needed at the moment, but might be at some point soon.
-    # def _get_lines(self, window: Window) -> list[str]:
-    #     """Gets lines from the window, caching when possible.
+    def _event_draw_loop(self) -> None:
+        """A loop that only draws when requested, or while animations are running."""
 
-    #     This also applies the blurred style of the window, if it has no focus.
-    #     """
+        framecount = 0
+        last_frame = fps_start_time = time.perf_counter()
+        was_animating = False
 
-    #     if window.allow_fullscreen:
-    #         window.pos = self.terminal.origin
-    #         window.width = self.terminal.width
-    #         window.height = self.terminal.height
+        while self._is_running:
+            if not animator.is_active:
+                self._frame_requested.wait(self.idle_timeout)
 
-    #     return window.get_lines()
+            # `stop` wakes the loop up, which must not draw another frame
+            if not self._is_running:
+                break
 
-    #     if window.has_focus or window.is_noblur:
-    #         return window.get_lines()
+            elapsed = time.perf_counter() - last_frame
 
-    #     _id = id(window)
-    #     if not window.is_dirty and _id in self._cache:
-    #         return self._cache[_id]
+            if elapsed < self._frametime:
+                time.sleep(self._frametime - elapsed)
+                elapsed = self._frametime
+
+            resized = self.terminal.process_pending_resize()
+
+            if not (self._frame_requested.is_set() or animator.is_active or resized):
+                continue
 
-    #     lines: list[str] = []
-    #     for line in window.get_lines():
-    #         if not window.has_focus:
-    #             line = tim.parse("[239]" + strip_ansi(line).replace("[", r"\["))
+            self._frame_requested.clear()
+
+            # Frames can only be dropped while animating, otherwise the loop was idle
+            stats = FrameStats(
+                start=time.perf_counter(),
+                dropped=self._get_dropped(elapsed) if was_animating else 0,
+            )
+
+            # Time spent idle should not count towards newly scheduled animations
+            animator.step(elapsed if was_animating else 0.0)
+            was_animating = animator.is_active
+            stats.animation_time = time.perf_counter() - stats.start
+
+            last_frame = time.perf_counter()
+            self._draw_frame(stats)
 
-    #         lines.append(line)
+            framecount += 1
+
+            if last_frame - fps_start_time >= 1:
+                self.fps = framecount
+                fps_start_time = last_frame
+                framecount = 0
+
+        self.fps = 0
 
-    #     self._cache[_id] = lines
-    #     return lines
+    def _get_dropped(self, elapsed: float) -> int:
+        """Gets the amount of frames missed, given the time since the last one."""
+
+        return max(0, int(elapsed / self._frametime) - 1)
+
+    def _on_schedule(self, _: object) -> None:
+        """Wakes up the draw loop when an animation is scheduled."""
+
+        self.request_frame()
+
+    def request_frame(self) -> None:
+        """Requests a new frame to be drawn.
+
+        This wakes up an event-driven draw loop. It is safe to call from any thread, and
+        multiple requests before the next frame are merged into one.
+        """
+
+        self._frame_requested.set()
+
+    def _invalidate_animated(self) -> None:
+        """Marks windows affected by running animations as dirty.
+
+        Attribute animations only dirty the window their target lives in. Any other
+        animation could modify anything in its callbacks, so all windows are dirtied.
+        """
+
+        for animation in animator.animations:
+            target = getattr(animation, "target", None)
+
+            if target is None or animation.on_step is not None:
+                for window in self._windows:
+                    window.is_dirty = True
+
+                return
+
+            while getattr(target, "parent", None) is not None:
+                target = target.parent
+
+            if target in self._windows:
+                target.is_dirty = True
+
+    def _get_window_lines(self, window: Window) -> PositionedLineList:
+        """Gets the positioned lines of a window.
+
+        In retained mode the lines are cached, and only re-rendered when the window is
+        dirty, or its position, size, focus or scroll offset has changed.
+        """
+
+        if self.retained:
+            cached = self._cache.get(id(window))
+
+            if (
+                cached is not None
+                and not window.is_dirty
+                and len(window.positioned_line_buffer) == 0
+                and cached[0] == self._get_cache_key(window)
+            ):
+                return cached[1]
+
+        # Cleared before rendering, so windows may re-dirty themselves in get_lines
+        window.is_dirty = False
+
+        start = time.perf_counter()
+        lines = list(self._iter_positioned(window))
+        window._settle_dirty()  # pylint: disable=protected-access
+
+        if self._frame is not None:
+            self._frame.render_times[window] = time.perf_counter() - start
+
+        if self.retained:
+            self._cache[id(window)] = (self._get_cache_key(window), lines)
+
+        return lines
+
+    def _get_cache_key(self, window: Window) -> tuple:
+        """Gets the state a window's cached lines are valid for."""
+
+        return (
+            window.pos,
+            window.width,
+            window.height,
+            window.has_focus,
+            window._scroll_offset,  # pylint: disable=protected-access
+            self.terminal.size,
+            # Aliases & themes may be changed at any time
+            tim.version,
+        )
 
     def _iter_positioned(
         self, widget: Widget, until: int | None = None
     ) -> Iterator[tuple[tuple[int, int], str]]:
         """Iterates through (pos, line) tuples from widget.get_lines()."""
 
-        # get_lines = widget.get_lines
-        # if isinstance(widget, Window):
-        #     get_lines = lambda *_: self._get_lines(widget)  # type: ignore
         width, height = self.terminal.size
 
         if until is None:
@@ -167,104 +336,237 @@ class Compositor:
         """Runs the compositor draw loop as a thread."""
 
         self._is_running = True
-        Thread(name="CompositorDrawLoop", target=self._draw_loop, daemon=True).start()
+
+        target = self._draw_loop
+
+        if self.event_driven:
+            target = self._event_draw_loop
+            animator.subscribe(self._on_schedule)
+            self.request_frame()
+
+        Thread(name="CompositorDrawLoop", target=target, daemon=True).start()
 
     def stop(self) -> None:
         """Stops the compositor."""
 
         self._is_running = False
 
+        animator.unsubscribe(self._on_schedule)
+        self._frame_requested.set()
+
     def composite(self) -> PositionedLineList:
         """Creates a composited buffer from the assigned windows.
 
-        Note that this is currently not used."""
+        In retained mode, windows are only re-rendered when they are dirty. A window is
+        dirty when its `is_dirty` flag is set, which happens when it handles input, gets
+        focused or blurred, is targeted by a running animation, or an attribute of any
+        widget within it is assigned (see `pytermgui.widgets.base.Widget.mark_dirty`).
+        Changes to its position, size, focus or scroll offset, as well as terminal
+        resizes, also cause it to re-render. Content changed in other ways, such as by
+        mutating a list in-place, should be followed by calling `mark_dirty` on the
+        widget that changed.
 
-        lines = []
-        windows = self._windows
+        Windows that aren't dirty re-use their cached lines, so an idle window costs no
+        `get_lines` calls.
 
-        # Don't unnecessarily print under full screen windows
-        if any(window.allow_fullscreen for window in self._windows):
-            for window in reversed(self._windows):
-                if window.allow_fullscreen:
-                    windows = [window]
-                    break
-
-        size_changes = {WidgetChange.WIDTH, WidgetChange.HEIGHT, WidgetChange.SIZE}
-        for window in reversed(windows):
-            if not window.has_focus:
-                continue
+        Returns:
+            The positioned lines of all visible windows, bottom-most first.
+        """
 
-            change = window.get_change()
+        lines: PositionedLineList = []
 
-            if change is None:
-                continue
+        for layer in reversed(self._get_layers(CoverageMask(*self.terminal.size))):
+            lines.extend(layer)
 
-            if window.is_dirty or change in size_changes:
-                for pos, line in self._iter_positioned(window):
-                    lines.append((pos, line))
+        return lines
 
-                window.is_dirty = False
-                continue
+    def set_redraw(self) -> None:
+        """Flags compositor for full redraw.
 
-            if change is not None:
-                remaining = window.content_dimensions[1]
+        Note:
+            At the moment the compositor will always redraw the entire screen.
+        """
 
-                for widget in window.dirty_widgets:
-                    for pos, line in self._iter_positioned(widget, until=remaining):
-                        lines.append((pos, line))
+        self._should_redraw = True
 
-                    remaining -= widget.height
+        for window in self._windows:
+            window.is_dirty = True
 
-                window.dirty_widgets = []
-                continue
+        self.request_frame()
 
-            if window.allow_fullscreen:
-                break
+    def _get_layers(self, mask: CoverageMask) -> list[PositionedLineList]:
+        """Gets the positioned lines of each visible window, from the top down.
 
-        return lines
+        Windows are checked in z-order. Once a window is rendered, its rectangle is
+        marked as covered in `mask`, so windows entirely hidden below others (or
+        outside of the terminal) are skipped without calling their `get_lines`.
 
-    def set_redraw(self) -> None:
-        """Flags compositor for full redraw.
+        Args:
+            mask: The mask used to track the area already covered by windows.
 
-        Note:
-            At the moment the compositor will always redraw the entire screen.
+        Returns:
+            A list of layers, the first of which is the topmost window.
         """
 
-        self._should_redraw = True
+        layers: list[PositionedLineList] = []
+
+        if self.retained:
+            self._invalidate_animated()
+
+            for key in self._cache.keys() - {id(window) for window in self._windows}:
+                del self._cache[key]
+
+        for window in self._windows:
+            if mask.is_covered(window.rect):
+                continue
+
+            layers.append(self._get_window_lines(window))
+            mask.cover(window.rect)
+
+        return layers
 
     def draw(self, force: bool = False) -> None:
         """Writes composited screen to the terminal.
 
-        At the moment this uses full-screen rewrites. There is a compositing
-        implementation in `composite`, but it is currently not performant enough to use.
+        Windows that are entirely covered by others are not rendered. With
+        `RenderMode.FULL` this clears the screen and rewrites every line of the
+        remaining windows. With `RenderMode.DAMAGE` the windows are composited onto a
+        `pytermgui.screen.Screen` from the top down, skipping covered cells, and only
+        the cells that differ from the previous frame are written, using as few
+        style sequences as possible. See `bytes_saved`.
+
+        In retained mode, only dirty windows are re-rendered. See `composite`.
+
+        The frame's statistics are appended to `frame_stats`.
 
         Args:
             force: When set, new composited lines will not be checked against the
-                previous ones, and everything will be redrawn.
+                previous ones, cached window lines are dropped, and everything will be
+                redrawn.
         """
 
-        # if self._should_redraw or force:
+        self._draw_frame(FrameStats(start=time.perf_counter()), force)
+
+    def _draw_frame(self, stats: FrameStats, force: bool = False) -> None:
+        """Draws a frame, recording its timings into `stats`."""
+
+        if force:
+            self._cache.clear()
+
+        self._frame = stats
+
+        try:
+            layers = self._get_layers(CoverageMask(*self.terminal.size))
+        finally:
+            self._frame = None
+
         lines: PositionedLineList = []
 
-        for window in reversed(self._windows):
-            lines.extend(self._iter_positioned(window))
+        for layer in reversed(layers):
+            lines.extend(layer)
 
         self._should_redraw = False
 
-        # else:
-        # lines = self.composite()
-
         if not force and self._previous == lines:
+            self.bytes_written = self.bytes_saved = 0
+
+            stats.skipped = True
+            self._finish_frame(stats)
             return
 
+        self.bytes_saved = 0
+        diff_start = time.perf_counter()
+
+        if self.render_mode is RenderMode.DAMAGE:
+            content = self._render_damage(layers, force)
+
+        else:
+            content = self._render_full(lines)
+
+        self.bytes_written = len(content.encode("utf-8"))
+
+        write_start = time.perf_counter()
+        stats.diff_time = write_start - diff_start
+
         with self.terminal.frame() as frame:
-            frame_write = frame.write
-            frame_write("\x1b[H\x1b[2J")
+            frame.write(content)
 
-            for pos, line in lines:
-                frame_write(f"\x1b[{pos[1]};{pos[0]}H{line}")
+        stats.write_time = time.perf_counter() - write_start
+        stats.bytes_written = self.bytes_written
+        stats.bytes_saved = self.bytes_saved
 
         self._previous = lines
+        self._finish_frame(stats)
+
+    def _finish_frame(self, stats: FrameStats) -> None:
+        """Records a finished frame."""
+
+        stats.total_time = time.perf_counter() - stats.start
+        self.frame_stats.append(stats)
+
+    def _render_full(self, lines: PositionedLineList) -> str:
+        """Clears the screen and writes every line, moving the cursor between them.
+
+        Lines are clipped to the terminal, so windows that are partly outside of it
+        don't wrap or scroll.
+        """
+
+        width, height = self.terminal.size
+        cursor = CursorPlanner(width, height)
+        cursor.position = (1, 1)
+
+        buffer = ["\x1b[H\x1b[2J"]
+
+        for (xpos, ypos), line in lines:
+            if not 1 <= ypos <= height:
+                continue
+
+            # The columns of the line that fall within the terminal
+            start = max(1 - xpos, 0)
+            end = width - xpos + 1
+
+            if end <= start:
+                continue
+
+            if start > 0 or real_length(line) > end:
+                line = slice_ansi(line, start, end)
+
+            buffer.append(cursor.move((max(xpos, 1), ypos)))
+            buffer.append(line)
+
+            cursor.advance(get_cursor_advance(line))
+
+        return "".join(buffer)
+
+    def _render_damage(self, layers: list[PositionedLineList], force: bool) -> str:
+        """Composites layers onto a new screen, and gets its difference to the last one.
+
+        Layers are written from the top down onto a masked screen, so cells that are
+        covered by a higher window are never written.
+
+        Args:
+            layers: The positioned lines of each window, topmost first.
+            force: If set, the previous screen is discarded and everything is redrawn.
+
+        Returns:
+            The output needed to update the terminal to the new frame.
+        """
+
+        width, height = self.terminal.size
+        screen = Screen(width, height, mask=CoverageMask(width, height))
+
+        for layer in layers:
+            # Items of the positioned line buffer come last, but are on top
+            for pos, line in reversed(layer):
+                screen.write(pos, line)
+
+        previous = None if force else self._screen
+        self._screen = screen
+
+        content = screen.render(previous, repeat=self.repeat_chars)
+        self.bytes_saved = screen.bytes_saved
+
+        return content
 
     def redraw(self) -> None:
         """Force-redraws the buffer."""
@@ -13,9 +13,8 @@ from ..ansi_interface import MouseAction, MouseEvent
 from ..colors import str_to_color
 from ..context_managers import MouseTranslator, alt_buffer, mouse_handler
 from ..enums import Overflow
-from ..input import getch, feed
+from ..input import feed
 from ..regex import real_length
-from ..term import terminal
 from ..widgets import Container, Widget
 from ..widgets.base import BoundCallback
 from ..win32console import enable_virtual_processing
@@ -61,8 +60,18 @@ class WindowManager(Widget):  # pylint: disable=too-many-instance-attributes
         layout_type: Type[Layout] = Layout,
         framerate: int = 60,
         autorun: bool | None = None,
+        **compositor_options: Any,
     ) -> None:
-        """Initialize the manager."""
+        """Initialize the manager.
+
+        Args:
+            layout_type: The `Layout` subclass used to position windows.
+            framerate: The framerate the compositor targets.
+            autorun: Whether the manager should be run when its context is exited.
+            **compositor_options: Passed to the compositor, like `render_mode`,
+                `retained` and `event_driven`. See
+                `pytermgui.window_manager.compositor.Compositor`.
+        """
 
         super().__init__()
 
@@ -76,7 +85,11 @@ class WindowManager(Widget):  # pylint: disable=too-many-instance-attributes
             self.autorun = autorun
 
         self.layout = layout_type()
-        self.compositor = Compositor(self._windows, framerate=framerate)
+        self.compositor = Compositor(
+            self._windows,
+            framerate=framerate,
+            **compositor_options,
+        )
         self.mouse_translator: MouseTranslator | None = None
 
         self._mouse_target: Window | None = None
@@ -87,7 +100,7 @@ class WindowManager(Widget):  # pylint: disable=too-many-instance-attributes
         # This isn't quite implemented at the moment.
         self.restrict_within_bounds = True
 
-        terminal.subscribe(terminal.RESIZE, self.on_resize)
+        self.terminal.subscribe(self.terminal.RESIZE, self.on_resize)
 
     def __iadd__(self, other: object) -> WindowManager:
         """Adds a window to the manager."""
@@ -133,7 +146,7 @@ class WindowManager(Widget):  # pylint: disable=too-many-instance-attributes
 
         with enable_virtual_processing():
             while self._is_running:
-                key = getch(interrupts=False)
+                key = self.terminal.getch(interrupts=False)
 
                 # Windows getch is non-blocking so the manager can be stopped from
                 # another thread. Avoid spinning while no console input is pending.
@@ -145,10 +158,10 @@ class WindowManager(Widget):  # pylint: disable=too-many-instance-attributes
                     self.stop()
                     break
 
-                if self.handle_key(key):
-                    continue
+                if not self.handle_key(key):
+                    self.process_mouse(key)
 
-                self.process_mouse(key)
+                self.compositor.request_frame()
 
     def get_lines(self) -> list[str]:
         """Gets the empty list."""
@@ -162,6 +175,19 @@ class WindowManager(Widget):  # pylint: disable=too-many-instance-attributes
 
         self.compositor.clear_cache(window)
 
+    def request_frame(self) -> None:
+        """Requests the compositor to draw a new frame.
+
+        Input, resizes, animations and changes to the window list request frames
+        automatically, as does assigning to a public attribute of a widget within one
+        of the managed windows (see `pytermgui.widgets.base.Widget.mark_dirty`). When
+        running `event_driven`, call this (or
+        `pytermgui.window_manager.window.Window.request_frame`) after changing widgets
+        in other ways, e.g. mutating a list in-place.
+        """
+
+        self.compositor.request_frame()
+
     def on_resize(self, size: tuple[int, int]) -> None:
         """Correctly updates window positions & prints when terminal gets resized.
 
@@ -283,6 +309,7 @@ class WindowManager(Widget):  # pylint: disable=too-many-instance-attributes
 
         if not animate:
             _on_finish(None)
+            self.request_frame()
             return self
 
         animator.animate_attr(
@@ -309,6 +336,8 @@ class WindowManager(Widget):  # pylint: disable=too-many-instance-attributes
 
             window.focus()
 
+        self.request_frame()
+
     def focus_next(self, step: int = 1) -> Window | None:
         """Focuses the next window in focus order, looping to first at the end.
 
@@ -347,10 +376,8 @@ class WindowManager(Widget):  # pylint: disable=too-many-instance-attributes
 
         # Apply focused window binding, or send to InputField
         if self.focused is not None:
-            if self.focused.execute_binding(key):
-                return True
-
-            if self.focused.handle_key(key):
+            if self.focused.execute_binding(key) or self.focused.handle_key(key):
+                self.focused.is_dirty = True
                 return True
 
         return False
@@ -371,6 +398,8 @@ class WindowManager(Widget):  # pylint: disable=too-many-instance-attributes
 
             offset = self._drag_offsets[index]
 
+            terminal = self.terminal
+
             # TODO: This -2 is a very magical number. Not good.
             maximum = terminal.size[index] - ((window.width, window.height)[index] - 2)
 
@@ -513,9 +542,11 @@ class WindowManager(Widget):  # pylint: disable=too-many-instance-attributes
                         self._mouse_target.handle_mouse(
                             MouseEvent(MouseAction.RELEASE, event.position)
                         )
+                        self._mouse_target.is_dirty = True
 
                     self._mouse_target = window
                     window.handle_mouse(event)
+                    window.is_dirty = True
                     break
 
                 if window.is_modal:
@@ -528,6 +559,7 @@ class WindowManager(Widget):  # pylint: disable=too-many-instance-attributes
                     self._mouse_target.handle_mouse(
                         MouseEvent(MouseAction.RELEASE, event.position)
                     )
+                    self._mouse_target.is_dirty = True
 
                 self._mouse_target = None
 
@@ -570,7 +602,7 @@ class WindowManager(Widget):  # pylint: disable=too-many-instance-attributes
             _show_positions(widget)
         self.terminal.flush()
 
-        getch()
+        self.terminal.getch()
 
     def alert(self, *items: Any, center: bool = True, **attributes: Any) -> Window:
         """Creates a modal popup of the given elements and attributes.
@@ -0,0 +1,201 @@
+"""Per-frame statistics of the Compositor, and a window to display them.
+
+Every frame the compositor draws is recorded as a `FrameStats` in
+`pytermgui.window_manager.compositor.Compositor.frame_stats`. These can be used to
+figure out where time is spent:
+
+```python3
+from pytermgui import WindowManager
+from pytermgui.window_manager.stats import summarize_frames
+
+with WindowManager() as manager:
+    ...
+
+print(summarize_frames(manager.compositor.frame_stats))
+```
+
+For a live view, add a `FrameStatsWindow` to the manager.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Iterable
+
+from ..widgets import Label
+from .window import Window
+
+if TYPE_CHECKING:
+    from .compositor import Compositor
+
+__all__ = ["FrameStats", "FrameStatsWindow", "summarize_frames"]
+
+
+@dataclass
+class FrameStats:  # pylint: disable=too-many-instance-attributes
+    """Statistics of a single frame. Times are in seconds."""
+
+    start: float = 0.0
+    """The `time.perf_counter` value at the start of the frame."""
+
+    animation_time: float = 0.0
+    """Time spent in `pytermgui.animations.Animator.step`."""
+
+    render_times: dict[Window, float] = field(default_factory=dict)
+    """Time spent getting the lines of each window that was rendered this frame.
+
+    Windows that were culled, or reused their cached lines, are not included."""
+
+    diff_time: float = 0.0
+    """Time spent comparing to the previous frame and encoding the output."""
+
+    write_time: float = 0.0
+    """Time spent writing the output to the terminal."""
+
+    total_time: float = 0.0
+    """Time spent on the frame in total."""
+
+    bytes_written: int = 0
+    """The amount of bytes written to the terminal."""
+
+    bytes_saved: int = 0
+    """See `pytermgui.window_manager.compositor.Compositor.bytes_saved`."""
+
+    skipped: bool = False
+    """Whether nothing was written, as nothing changed since the last frame."""
+
+    dropped: int = 0
+    """The amount of frames missed before this one, because the previous frame took
+    longer than the frametime to render & write."""
+
+    @property
+    def render_time(self) -> float:
+        """Returns the time spent getting the lines of all windows."""
+
+        return sum(self.render_times.values())
+
+
+def summarize_frames(frames: Iterable[FrameStats]) -> dict[str, float]:
+    """Summarizes some frames.
+
+    Args:
+        frames: The frames to summarize, in the order they were drawn.
+
+    Returns:
+        A dictionary with the amount of `frames`, `skipped` and `dropped` frames, the
+        achieved `fps`, the average `animation_time`, `render_time`, `diff_time`,
+        `write_time` & `total_time` in milliseconds, and the average `bytes_written`.
+    """
+
+    frames = list(frames)
+    count = len(frames)
+
+    summary: dict[str, float] = {
+        "frames": count,
+        "skipped": sum(frame.skipped for frame in frames),
+        "dropped": sum(frame.dropped for frame in frames),
+        "fps": 0.0,
+    }
+
+    divisor = max(count, 1)
+
+    for name in (
+        "animation_time",
+        "render_time",
+        "diff_time",
+        "write_time",
+        "total_time",
+    ):
+        summary[name] = sum(getattr(frame, name) for frame in frames) * 1000 / divisor
+
+    summary["bytes_written"] = sum(frame.bytes_written for frame in frames) / divisor
+
+    if count > 1:
+        elapsed = frames[-1].start - frames[0].start
+        summary["fps"] = (count - 1) / elapsed if elapsed > 0 else 0.0
+
+    return summary
+
+
+class FrameStatsWindow(Window):
+    """A window that displays a summary of the compositor's recent frames.
+
+    It is re-rendered every frame, so it should only be used for debugging. The stats
+    are refreshed at most once every `refresh_interval` seconds, as each refresh
+    requests another frame. This lets event-driven managers go idle.
+    """
+
+    is_noblur = True
+    is_persistent = True
+
+    refresh_interval = 0.5
+    """The least amount of seconds between two refreshes of the displayed stats."""
+
+    def __init__(self, compositor: Compositor, **attrs: Any) -> None:
+        """Initializes the window.
+
+        Args:
+            compositor: The compositor whose stats are displayed.
+        """
+
+        attrs.setdefault("title", "Frame stats")
+        attrs.setdefault("width", 32)
+
+        super().__init__(**attrs)
+
+        self.compositor = compositor
+        self._last_refresh: float | None = None
+        self._labels = {
+            name: Label(name, parent_align=0)
+            for name in (
+                "fps",
+                "total_time",
+                "animation_time",
+                "render_time",
+                "diff_time",
+                "write_time",
+                "bytes_written",
+                "skipped",
+                "dropped",
+            )
+        }
+
+        for label in self._labels.values():
+            self._add_widget(label)
+
+    def _refresh(self) -> None:
+        """Updates the labels to show the current stats."""
+
+        summary = summarize_frames(self.compositor.frame_stats)
+
+        for name, label in self._labels.items():
+            value = summary[name]
+
+            if name.endswith("_time"):
+                text = f"{value:.2f}ms"
+            elif name == "fps":
+                text = f"{value:.1f}"
+            else:
+                text = f"{value:.0f}"
+
+            label.value = f"[surface+2]{name.replace('_', ' ')}:[/] {text}"
+
+    def get_lines(self) -> list[str]:
+        """Updates the displayed stats if they are due a refresh, and gets the lines."""
+
+        now = time.perf_counter()
+
+        if (
+            self._last_refresh is None
+            or now - self._last_refresh >= self.refresh_interval
+        ):
+            self._last_refresh = now
+            self._refresh()
+
+        lines = super().get_lines()
+
+        # Stay dirty, so the refresh timer is checked on every frame
+        self._dirty_after_render = True
+
+        return lines
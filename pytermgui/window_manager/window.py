@@ -38,9 +38,6 @@ class Window(Container):  # pylint: disable=too-many-instance-attributes
     is_noresize = False
     """No-resize windows cannot be resized using the mouse."""
 
-    is_dirty = False
-    """Controls whether the window should be redrawn in the next frame."""
-
     is_persistent = False
     """Persistent windows will be set noblur automatically, and remain clickable even through
     modals.
@@ -209,6 +206,7 @@ class Window(Container):  # pylint: disable=too-many-instance-attributes
         """Focuses this window."""
 
         self.has_focus = True
+        self.is_dirty = True
 
         if not self.is_noblur:
             self.styles.border = self.styles.border_focused
@@ -218,6 +216,7 @@ class Window(Container):  # pylint: disable=too-many-instance-attributes
         """Blurs (unfocuses) this window."""
 
         self.has_focus = False
+        self.is_dirty = True
         self.select(None)
         self.handle_mouse(MouseEvent(MouseAction.RELEASE, (0, 0)))
 
@@ -225,6 +224,28 @@ class Window(Container):  # pylint: disable=too-many-instance-attributes
             self.styles.border = self.styles.border_blurred
             self.styles.corner = self.styles.corner_blurred
 
+    def mark_dirty(self) -> None:
+        """Marks this window as dirty, and requests a frame from its manager.
+
+        This is called whenever something within the window changes, so event-driven
+        managers redraw without needing an explicit `request_frame` call. Requests
+        made before the next frame are merged into one.
+        """
+
+        super().mark_dirty()
+
+        manager = self.__dict__.get("manager")
+        if manager is not None:
+            manager.request_frame()
+
+    def request_frame(self) -> None:
+        """Marks this window as dirty, and requests a new frame from its manager."""
+
+        self.is_dirty = True
+
+        if self.manager is not None:
+            self.manager.request_frame()
+
     def clear_cache(self) -> None:
         """Clears manager compositor's cached blur state."""
 
@@ -0,0 +1,68 @@
+from pytermgui.benchmarks import (
+    BENCHMARKS,
+    Benchmark,
+    BenchmarkResult,
+    compare_results,
+    load_results,
+    run_benchmarks,
+    save_results,
+)
+from pytermgui.term import ColorSystem, get_terminal
+
+
+def test_run_benchmarks():
+    results = run_benchmarks("real_length", repeat=1)
+
+    assert list(results) == ["real_length (cold)", "real_length (warm)"]
+    assert all(result.best > 0 for result in results.values())
+
+
+def test_run_benchmarks_terminal():
+    original = get_terminal()
+    original_colorsystem = original.forced_colorsystem
+    systems = []
+
+    run_benchmarks(
+        "real_length",
+        repeat=1,
+        on_result=lambda *_: systems.append(get_terminal().colorsystem),
+    )
+
+    assert systems == [ColorSystem.TRUE, ColorSystem.TRUE]
+    assert get_terminal() is original
+    assert original.forced_colorsystem is original_colorsystem
+
+
+def test_benchmark_warms_up():
+    calls = []
+    result = Benchmark("warm-up", lambda: calls.append(1), number=3).run(repeat=2)
+
+    assert len(calls) == 1 + 3 * 2
+    assert result.repeat == 2
+
+
+def test_benchmarks_are_unique():
+    names = [benchmark.name for benchmark in BENCHMARKS]
+
+    assert len(names) == len(set(names))
+
+
+def test_save_and_compare(tmp_path):
+    baseline = {
+        "fast": BenchmarkResult(best=1.0, mean=1.0, number=1, repeat=1),
+        "slow": BenchmarkResult(best=1.0, mean=1.0, number=1, repeat=1),
+    }
+
+    path = str(tmp_path / "baseline.json")
+    save_results(baseline, path)
+    assert load_results(path) == baseline
+
+    current = {
+        "fast": BenchmarkResult(best=1.05, mean=1.05, number=1, repeat=1),
+        "slow": BenchmarkResult(best=1.5, mean=1.5, number=1, repeat=1),
+        "new": BenchmarkResult(best=1.0, mean=1.0, number=1, repeat=1),
+    }
+
+    comparisons = compare_results(current, baseline)
+    assert [comp.name for comp in comparisons] == ["fast", "slow"]
+    assert [comp.is_regression(0.1) for comp in comparisons] == [False, True]
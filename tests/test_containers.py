@@ -0,0 +1,266 @@
+import pytermgui as ptg
+from pytermgui.ansi_interface import MouseAction, MouseEvent
+from pytermgui.enums import Overflow
+
+
+def _get_labels(count):
+    return [
+        ptg.Label(f"Label {i}" if i % 7 else f"A longer label number {i} " * 2)
+        for i in range(count)
+    ]
+
+
+def test_virtualized_matches_full():
+    full = ptg.Container(*_get_labels(100), height=12, overflow=Overflow.SCROLL)
+    virtual = ptg.Container(
+        *_get_labels(100), height=12, overflow=Overflow.SCROLL, virtualize=True
+    )
+
+    # Let every height be measured, rather than estimated
+    for offset in range(0, 200, 5):
+        virtual._scroll_offset = offset
+        virtual.get_lines()
+
+    for offset in (0, 3, 41, 120, 1000):
+        full._scroll_offset = virtual._scroll_offset = offset
+
+        assert virtual.get_lines() == full.get_lines()
+        assert virtual._max_scroll == full._max_scroll
+
+        first, last = virtual._visible_range
+        assert last - first < 12
+        assert [widget.pos for widget in virtual[first:last]] == [
+            widget.pos for widget in full[first:last]
+        ]
+
+
+def test_virtualized_renders_visible():
+    rendered = []
+
+    class CountingLabel(ptg.Label):
+        def get_lines(self):
+            rendered.append(self)
+            return super().get_lines()
+
+    container = ptg.Container(height=10, overflow=Overflow.SCROLL, virtualize=True)
+
+    for i in range(10000):
+        container.lazy_add(CountingLabel(f"Label {i}"))
+
+    assert rendered == []
+
+    container.get_lines()
+    container.scroll(5000)
+    lines = container.get_lines()
+
+    assert "Label 5000" in lines[1]
+    assert len(rendered) <= 4 * 8
+    assert container._max_scroll == 10000 - 8
+
+
+def test_virtualized_select_and_click():
+    clicks = []
+
+    container = ptg.Container(
+        *(ptg.Button(f"Button {i}", lambda _, i=i: clicks.append(i)) for i in range(500)),
+        height=10,
+        overflow=Overflow.SCROLL,
+        virtualize=True,
+    )
+
+    container.select(300)
+    container.get_lines()
+
+    assert any("Button 300" in line for line in container.get_lines())
+
+    button = container[298]
+    container.handle_mouse(
+        MouseEvent(
+            MouseAction.LEFT_CLICK,
+            (button.pos[0] + 1, button.pos[1] - container._scroll_offset),
+        )
+    )
+
+    assert clicks == [298]
+    assert container.selected_index == 298
+
+
+def test_splitter_reuses_columns():
+    left, right = ptg.Label("Left"), ptg.Label("[bold]Right")
+    splitter = ptg.Splitter(left, right, width=40)
+
+    first = splitter.get_lines()
+    assert splitter.get_lines() == first
+
+    column = splitter._column_cache[id(left)]
+    right.value = "[italic]Changed"
+    lines = splitter.get_lines()
+
+    # Only the changed column is aligned again
+    assert splitter._column_cache[id(left)] is column
+    assert lines != first and "Changed" in lines[0]
+
+    splitter.width = 60
+    assert ptg.real_length(splitter.get_lines()[0]) == 60
+
+    splitter.width = 40
+    right.value = "[bold]Right"
+    assert splitter.get_lines() == first
+
+
+def test_splitter_pads_short_columns():
+    splitter = ptg.Splitter(ptg.Label("One"), ptg.Container("Two", "Lines"), width=40)
+
+    lines = splitter.get_lines()
+    assert len(set(ptg.real_length(line) for line in lines)) == 1
+
+    # Padding the cached columns must not change them
+    assert splitter.get_lines() == lines
+
+
+def test_dirty_propagation():
+    label = ptg.Label("Hello")
+    inner = ptg.Container(label)
+    root = ptg.Container(inner)
+
+    root.get_lines()
+    assert not label.is_dirty and not inner.is_dirty
+
+    root.is_dirty = False
+    label.value = "Hello"
+    label.pos = (10, 10)
+    assert not root.is_dirty
+
+    label.value = "World"
+    assert label.is_dirty and inner.is_dirty and root.is_dirty
+
+    root.get_lines()
+    label.styles.value = "bold"
+    assert inner.is_dirty
+
+
+def _build_retained(labels):
+    return ptg.Container(ptg.Container(*labels[:10]), ptg.Splitter(*labels[10:13]))
+
+
+def test_retained_children_rendered_once(monkeypatch):
+    labels = _get_labels(20)
+    root = _build_retained(labels)
+    first = root.get_lines()
+
+    calls = []
+    original = ptg.Label.get_lines
+
+    def _get_lines(label):
+        calls.append(label)
+        return original(label)
+
+    monkeypatch.setattr(ptg.Label, "get_lines", _get_lines)
+
+    assert root.get_lines() == first
+    assert calls == []
+
+    labels[3].value = "Changed"
+    labels[11].value = "[bold]Also changed"
+    lines = root.get_lines()
+
+    assert calls == [labels[3], labels[11]]
+
+    fresh = _get_labels(20)
+    fresh[3].value = "Changed"
+    fresh[11].value = "[bold]Also changed"
+
+    assert lines == _build_retained(fresh).get_lines()
+
+
+def test_retained_children_skip_layout(monkeypatch):
+    labels = _get_labels(20)
+    root = _build_retained(labels)
+    root.get_lines()
+
+    # Rendering doesn't leave anything dirty, even though it resizes children
+    assert not root[0].is_dirty and not root[1].is_dirty
+    assert not any(label.is_dirty for label in labels[:13])
+
+    calls = []
+    original = ptg.Container._update_width
+
+    def _update_width(container, widget):
+        calls.append(widget)
+        return original(container, widget)
+
+    monkeypatch.setattr(ptg.Container, "_update_width", _update_width)
+
+    labels[3].value = "Changed"
+    root.get_lines()
+
+    assert calls == [root[0], labels[3]]
+    assert not root[0].is_dirty
+
+    root.width = 30
+    root.get_lines()
+
+    assert labels[5] in calls
+
+
+def test_nested_add_is_rendered():
+    inner = ptg.Container(ptg.Label("first"))
+    root = ptg.Container(inner, width=40)
+    root.get_lines()
+
+    # Adding renders `inner` on its own, which mustn't hide the change from `root`
+    inner += ptg.Label("second")
+    assert any("second" in line for line in root.get_lines())
+
+
+def _build_nested(width):
+    box = ptg.Checkbox()
+    inner = ptg.Container(box, parent_align=ptg.HorizontalAlignment.CENTER)
+    middle = ptg.Container(inner, parent_align=ptg.HorizontalAlignment.CENTER)
+
+    return ptg.Container(middle, width=width), [middle, inner, box]
+
+
+def test_nested_positions_follow_width():
+    root, widgets = _build_nested(40)
+    root.get_lines()
+
+    root.width = 24
+    root.get_lines()
+
+    fresh, fresh_widgets = _build_nested(24)
+    fresh.get_lines()
+
+    assert [widget.pos for widget in widgets] == [
+        widget.pos for widget in fresh_widgets
+    ]
+
+
+def test_custom_get_lines_not_retained():
+    class Clock(ptg.Label):
+        ticks = 0
+
+        def get_lines(self):
+            Clock.ticks += 1
+            return [str(Clock.ticks)]
+
+    assert not Clock.retain_lines
+
+    root = ptg.Container(Clock())
+    assert root.get_lines() != root.get_lines()
+
+
+def test_button_retention_needs_pure_styles():
+    button = ptg.Button("Plain")
+    assert button.can_retain_lines()
+
+    values = iter(range(10))
+    button.styles.label = lambda _, item: item + str(next(values))
+    button.styles["_current"] = button.styles.label
+    assert not button.can_retain_lines()
+
+    root = ptg.Container(button)
+    assert root.get_lines() != root.get_lines()
+
+    ptg.tim.define("!button-counter", lambda text: text + str(next(values)))
+    assert not ptg.Button("[!button-counter]Impure").can_retain_lines()
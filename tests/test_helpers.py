@@ -1,4 +1,4 @@
-from pytermgui import break_line, real_length, tim
+from pytermgui import break_line, clip_ansi, real_length, slice_ansi, tim
 
 
 def test_break_plain():
@@ -34,6 +34,13 @@ def test_break_newline():
     assert list(broken) == ["this is too short", "sike"]
 
 
+def test_break_fitting_lines():
+    # Lines that fit are returned as-is, trailing whitespace is still trimmed
+    assert list(break_line("short\x1b[0m", 10, fill=".")) == ["short\x1b[0m....."]
+    assert list(break_line("short  ", 10)) == ["short"]
+    assert list(break_line("a\tb", 10)) == ["a       b"]
+
+
 # NOTE: This is no longer a part of PTG. It might come back in the future, which is
 #       why the tests are going to stay for now.
 # def test_get_applied_sequences_full_unset():
@@ -54,3 +61,25 @@ def test_break_newline():
 #     text = "\x1b[38;5;249m\x1b[48;5;2m\x1b[1mHello\x1b[49m\x1b[3mThere"
 #
 #     assert get_applied_sequences(text) == "\x1b[38;5;249m\x1b[1m\x1b[3m"
+
+
+def test_slice_ansi():
+    assert slice_ansi("Hello there", 2, 7) == "llo t"
+    assert clip_ansi("Hello", 10) == "Hello"
+
+    text = tim.parse("[bold]Hello[/bold] [141]there")
+    sliced = slice_ansi(text, 3, 8)
+
+    assert real_length(sliced) == 5
+    assert sliced.startswith("\x1b[1m")
+    assert "\x1b[22m" in sliced and sliced.endswith("\x1b[0m")
+
+
+def test_slice_ansi_wide():
+    # Wide characters cut in half are replaced by spaces
+    assert slice_ansi("漢字ab", 1, 5) == " 字a"
+    assert clip_ansi("漢字ab", 3) == "漢 "
+    assert clip_ansi("e\u0301x", 1) == "e\u0301"
+
+    link = "\x1b]8;;https://example.com\x1b\\link\x1b]8;;\x1b\\"
+    assert clip_ansi(link + "\x1b_Gimage\x1b\\", 2) == link.replace("link", "li")
@@ -0,0 +1,44 @@
+import pytermgui as ptg
+
+
+def test_label_reuses_lines(monkeypatch):
+    label = ptg.Label("[bold 141]Some text that is long enough to wrap", width=20)
+    lines = label.get_lines()
+
+    calls = []
+    original = ptg.Label._render_lines
+
+    def _render(self, style):
+        calls.append(self)
+        return original(self, style)
+
+    monkeypatch.setattr(ptg.Label, "_render_lines", _render)
+
+    assert label.get_lines() == lines
+    assert calls == []
+
+    label.get_lines().append("mutated")
+    assert label.get_lines() == lines
+
+    label.width = 10
+    assert len(label.get_lines()) > len(lines)
+
+    label.styles.value = "italic"
+    label.get_lines()
+
+    ptg.tim.alias("label-test", "bold")
+    label.get_lines()
+
+    label.value = "Other"
+    label.get_lines()
+
+    assert len(calls) == 4
+
+
+def test_label_impure_macros_are_not_cached():
+    values = iter(range(10))
+    ptg.tim.define("!counter", lambda text: text + str(next(values)))
+
+    label = ptg.Label("[!counter]count", width=10)
+
+    assert label.get_lines() != label.get_lines()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import pickle
 import random
 import string
 from itertools import zip_longest
@@ -15,9 +16,12 @@ from pytermgui import (
     tokenize_markup,
 )
 from pytermgui.colors import Color, str_to_color
+from pytermgui.exceptions import MarkupSyntaxError
 from pytermgui.markup import StyledText, Token
+from pytermgui.markup import MarkupLanguage
 from pytermgui.markup import tokens as tkns
-from pytermgui.markup.parsing import parse_tokens
+from pytermgui.cache import LRUCache
+from pytermgui.markup.parsing import consume_tag, parse, parse_tokens
 from pytermgui.markup.style_maps import CLEARERS, STYLES
 
 
@@ -153,6 +157,203 @@ class TestFunctionality:
     def test_displayhook_works(self):
         pretty.install()
 
+    def test_parse_cache_is_bounded(self):
+        lang = MarkupLanguage(cache_size=2)
+
+        for i in range(5):
+            lang.parse(f"[bold]{i}")
+
+        lang.parse("[bold]4")
+
+        info = lang.cache_info()
+        assert (info.hits, info.misses, info.evictions) == (1, 5, 3)
+        assert info.currsize == 2
+
+    def test_parse_cache_opt_out(self):
+        lang = MarkupLanguage()
+
+        assert lang.parse("[bold]once", cache=False) == lang.parse("[bold]once")
+        assert lang.cache_info().currsize == 1
+        assert lang.cache_info().misses == 1
+
+    def test_parse_cache_bytes(self):
+        lang = MarkupLanguage(cache_size=None, cache_bytes=400)
+
+        for i in range(20):
+            lang.parse(f"[141]{i}")
+
+        assert 0 < lang.cache_info().currbytes <= 400
+        assert lang.cache_info().evictions > 0
+
+    def test_parse_plain_text(self):
+        assert tim.parse("plain text") == "plain text\x1b[0m"
+        assert tim.parse("plain text", append_reset=False) == "plain text"
+        assert parse("plain text") == parse("plain text[/]")
+        assert parse("plain text", optimize=True) == "plain text\x1b[0m"
+        assert parse("plain text", optimize=True) == parse(
+            "plain text[/]", optimize=True
+        )
+        assert list(tokenize_markup("")) == list(tokenize_ansi("")) == []
+        assert list(tokenize_ansi("plain")) == [tkns.PlainToken("plain")]
+
+    def test_pure_macros(self):
+        lang = MarkupLanguage()
+        calls = []
+
+        def _count(text: str) -> str:
+            calls.append(text)
+            return text
+
+        lang.define("!impure", _count)
+        lang.parse("[!impure]a")
+        lang.parse("[!impure]a")
+        assert len(calls) == 2
+
+        lang.define("!pure", _count, pure=True)
+        lang.parse("[!pure]a")
+        lang.parse("[!pure]a")
+        assert len(calls) == 3
+
+        # Builtins like !upper are pure, !shuffle isn't
+        lang.parse("[!upper]b")
+        lang.parse("[!upper]b")
+        assert lang.cache_info().hits == 3
+
+    def test_compile(self):
+        status = tim.compile("[bold 141]{name}[/] [72]{value:>3} {{braces}}")
+
+        assert status(name="a[b]", value=5) == tim.parse(
+            "[bold 141]a\\[b][/] [72]  5 {braces}"
+        )
+        assert status("ignored", name="x", value=10).endswith("10 {braces}\x1b[0m")
+
+    def test_compile_macros_and_aliases(self):
+        lang = MarkupLanguage()
+        lang.define("!upper", lambda item: item.upper())
+        lang.alias("compiled", "bold")
+
+        shout = lang.compile("[!upper]{}[/!upper] {}")
+        assert shout("hey", "you") == lang.parse("[!upper]hey[/!upper] you")
+
+        styled = lang.compile("[compiled]{}")
+        assert styled(1) == lang.parse("[bold]1")
+
+        lang.alias("compiled", "italic")
+        assert styled(1) == lang.parse("[italic]1")
+
+    def test_compile_placeholder_in_tag(self):
+        for template in ("[{style}]text", "[bold {0:>3}]text", "[~{url}]link"):
+            with pytest.raises(MarkupSyntaxError):
+                tim.compile(template)
+
+
+def test_parse_many() -> None:
+    lang = MarkupLanguage()
+    lang.define("!impure", lambda item: item[::-1])
+
+    texts = [f"[bold 141]{i}[/] [!upper]text" for i in range(10)] + ["[!impure]abc"]
+    expected = [lang.parse(text) for text in texts]
+
+    assert list(lang.parse_many(texts)) == expected
+    assert list(lang.parse_many(iter(texts), workers=2, chunksize=3)) == expected
+
+
+def test_markup_stream() -> None:
+    stream = tim.stream()
+    chunks = ["plain [bo", "ld]bold\n", "[~https://example.com]li", "nk[/~] \x1b[3", "3mok"]
+
+    output = [stream.feed(chunk) for chunk in chunks]
+
+    assert output[0] == "plain "
+    assert output[1] == "\x1b[1mbold\n"
+    assert "https://example.com" in output[2] and "\x1b[0m" not in "".join(output)
+    assert output[4] == "\x1b[33mok"
+    assert stream.style.attributes == {"1"}
+    assert stream.style.foreground == "33"
+
+    assert stream.close() == "\x1b[0m"
+    assert stream.feed("[!upper]a") + stream.feed("b") == "AB"
+    assert stream.close() == ""
+    assert list(stream.parse(["[dim]x"])) == ["\x1b[2mx", "\x1b[0m"]
+
+    # Unmatched brackets only hold back the rest of their line
+    assert stream.feed("array[0\n") == "array[0\n"
+    assert stream.feed("next [bo") == "next "
+
+
+def test_markup_stream_reopened_macros() -> None:
+    stream = tim.stream()
+
+    for _ in range(100):
+        assert stream.feed("[!upper]line\n") == "LINE\n"
+
+    assert len(stream._state.macros) == 1
+
+
+def test_tokens_are_interned() -> None:
+    bold, color = list(tokenize_markup("[bold 141]text"))[:2]
+
+    assert bold is consume_tag("bold")
+    assert color is consume_tag("141")
+    assert not hasattr(color, "__dict__")
+    assert pickle.loads(pickle.dumps(color)) == color
+
+    with pytest.raises(AttributeError):
+        bold.value = "italic"
+
+
+def test_tokenize_ansi_shares_tokens() -> None:
+    first = list(tokenize_ansi("\x1b[1;38;5;141mHello\x1b[0m"))
+    second = list(tokenize_ansi("\x1b[1;38;5;141mThere\x1b[0m"))
+
+    assert first[0] is second[0] is consume_tag("bold")
+    assert first[1] is second[1]
+    assert first[1].color.background is False
+    assert list(tokenize_ansi("\x1b[2K\x1b[2;3H")) == [tkns.CursorToken("2;3", 2, 3)]
+
+
+def test_alias_invalidation() -> None:
+    lang = MarkupLanguage()
+    lang.alias("base", "bold")
+    lang.alias("derived", "base italic")
+
+    assert lang.context["alias_tokens"]["derived"] == (
+        consume_tag("bold"),
+        consume_tag("italic"),
+    )
+
+    unrelated = lang.parse("[141]unrelated")
+    assert lang.parse("[derived]x") == lang.parse("[bold italic]x")
+    assert lang.parse("[later]x") == "[later]x\x1b[0m"
+
+    lang.alias("base", "dim")
+    lang.alias("later", "underline")
+
+    assert lang.parse("[derived]x") == lang.parse("[dim italic]x")
+    assert lang.parse("[later]x") == lang.parse("[underline]x")
+
+    hits = lang.cache_info().hits
+    assert lang.parse("[141]unrelated") == unrelated
+    assert lang.cache_info().hits == hits + 1
+
+
+def test_lru_cache() -> None:
+    cache: LRUCache[int] = LRUCache(maxsize=3, max_bytes=10)
+
+    cache.set("a", 1, size=4)
+    cache.set("b", 2, size=4)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3, size=4)
+    assert "b" not in cache and "a" in cache
+    assert cache.currbytes == 8
+
+    cache.set("huge", 4, size=11)
+    assert "huge" not in cache
+    assert cache.get("huge") is None
+
+    assert LRUCache(maxsize=0).enabled is False
+
 
 def test_random_tokens() -> None:
     def _get_next(previous: tkns.Token | None) -> tkns.Token:
@@ -1,5 +1,14 @@
 import pytermgui as ptg
-from pytermgui.regex import has_open_sequence, real_length, strip_ansi, strip_markup
+from pytermgui.regex import (
+    WIDTH_CACHE_SIZE,
+    clear_width_cache,
+    has_open_sequence,
+    real_length,
+    real_lengths,
+    strip_ansi,
+    strip_markup,
+    width_cache_info,
+)
 
 
 def test_strip_ansi():
@@ -10,6 +19,32 @@ def test_real_length():
     assert real_length(ptg.tim.parse("[!rainbow]Test string")) == len("Test string")
 
 
+def test_real_lengths():
+    lines = ["plain", ptg.tim.parse("[141]styled"), "wide 漢字", "tab\t", ""]
+
+    assert real_lengths(lines) == [real_length(line) for line in lines]
+    assert real_lengths(lines)[:3] == [5, 6, 9]
+
+
+def test_width_cache():
+    clear_width_cache()
+
+    for line in ("plain", "more plain text"):
+        assert real_length(line) == len(line)
+        assert strip_ansi(line) is line
+
+    info = width_cache_info()
+    assert info["real_length"].currsize == info["strip_ansi"].currsize == 0
+
+    real_length("\x1b[1mbold")
+    real_length("\x1b[1mbold")
+
+    info = width_cache_info()["real_length"]
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+    assert info.maxsize == WIDTH_CACHE_SIZE
+    assert info.evictions == 0
+
+
 def test_strip_markup():
     assert strip_markup("[141 @61 !upper]This is a test") == "This is a test"
 
@@ -0,0 +1,417 @@
+from io import StringIO
+from threading import Event, Semaphore
+
+import pytest
+
+from pytermgui import Window, tim
+from pytermgui.enums import RenderMode
+from pytermgui.screen import (
+    DEFAULT_STYLE,
+    CoverageMask,
+    CursorPlanner,
+    Screen,
+    _intern,
+    apply_sgr,
+    get_transition,
+)
+from pytermgui.term import Terminal, get_terminal, set_global_terminal
+from pytermgui.window_manager import (
+    Compositor,
+    FrameStats,
+    FrameStatsWindow,
+    summarize_frames,
+)
+
+
+@pytest.fixture
+def terminal():
+    original = get_terminal()
+    new = Terminal(stream=StringIO(), size=(30, 10))
+
+    set_global_terminal(new)
+    yield new
+    set_global_terminal(original)
+
+
+def test_apply_sgr():
+    style = apply_sgr(DEFAULT_STYLE, "1;38;5;141;48;2;10;20;30")
+
+    assert style.attributes == {"1"}
+    assert style.foreground == "38;5;141"
+    assert style.background == "48;2;10;20;30"
+    assert apply_sgr(style, "22;39;49") is DEFAULT_STYLE
+    assert apply_sgr(style, "0") is DEFAULT_STYLE
+
+
+def test_style_interning_is_bounded():
+    first = apply_sgr(DEFAULT_STYLE, "38;2;1;2;3")
+    assert apply_sgr(DEFAULT_STYLE, "38;2;1;2;3") is first
+
+    for value in range(10000):
+        apply_sgr(DEFAULT_STYLE, f"38;2;{value % 256};{value // 256};0")
+
+    assert _intern.cache_info().currsize <= _intern.cache_info().maxsize
+    assert apply_sgr(first, "0") is DEFAULT_STYLE
+
+
+def test_screen_write():
+    screen = Screen(10, 2)
+    screen.write((2, 1), "\x1b[1mab\x1b[0m字c")
+
+    assert screen.glyphs[0][:6] == [" ", "a", "b", "字", "", "c"]
+    assert screen.styles[0][1].attributes == {"1"}
+    assert screen.styles[0][3] is DEFAULT_STYLE
+
+
+def test_screen_write_clips():
+    screen = Screen(5, 1)
+    screen.write((4, 1), "abcdef")
+    screen.write((1, 5), "out of bounds")
+
+    assert "".join(screen.glyphs[0]) == "   ab"
+
+
+def test_screen_render_diff():
+    first = Screen(10, 2)
+    first.write((1, 1), "Loading |")
+
+    second = Screen(10, 2)
+    second.write((1, 1), "Loading /")
+
+    assert second.render(first) == "\x1b[1;9H/"
+    assert second.render(second) == ""
+    assert second.render().startswith("\x1b[H\x1b[2J")
+
+
+def test_screen_render_links():
+    screen = Screen(10, 1)
+    screen.write((1, 1), "\x1b]8;;https://example.com\x1b\\link\x1b]8;;\x1b\\")
+
+    output = screen.render(Screen(10, 1))
+    assert output == "\x1b[H\x1b]8;;https://example.com\x1b\\link\x1b]8;;\x1b\\"
+
+
+def test_get_transition():
+    bold = apply_sgr(DEFAULT_STYLE, "1;38;5;141")
+    faint = apply_sgr(bold, "2")
+
+    assert get_transition(bold, bold) == ""
+    assert get_transition(bold, apply_sgr(bold, "4")) == "\x1b[4m"
+    assert get_transition(faint, apply_sgr(faint, "22;1")) == "\x1b[22;1m"
+    assert get_transition(bold, apply_sgr(bold, "39")) == "\x1b[39m"
+    assert get_transition(bold, DEFAULT_STYLE) == "\x1b[0m"
+
+
+def test_screen_render_deltas():
+    screen = Screen(20, 2)
+    screen.write((1, 1), "\x1b[1;31mred\x1b[0m\x1b[1;32mgreen\x1b[0m")
+    screen.write((1, 2), "\x1b[1;32m" + "-" * 12 + "\x1b[0m")
+
+    output = screen.render(Screen(20, 2))
+
+    assert output == (
+        "\x1b[H\x1b[1;31mred\x1b[32mgreen" + "\r\n-\x1b[11b\x1b[0m"
+    )
+    assert screen.bytes_saved > 0
+
+    without_rep = screen.render(Screen(20, 2), repeat=False)
+    assert "-" * 12 in without_rep
+
+
+def test_cursor_planner():
+    cursor = CursorPlanner(80, 24)
+
+    assert cursor.move((5, 3)) == "\x1b[3;5H"
+    assert cursor.move((5, 3)) == ""
+    assert cursor.move((12, 3)) == "\x1b[7C"
+    assert cursor.move((1, 3)) == "\r"
+    assert cursor.move((1, 4)) == "\r\n"
+    assert cursor.move((1, 3)) == "\x1b[A"
+    assert cursor.move((40, 10)) == "\x1b[10;40H"
+    assert cursor.move((41, 11)) == "\x1b[B\x1b[C"
+
+    cursor.advance(41)
+    assert cursor.position is None
+    assert cursor.move((1, 1)) == "\x1b[H"
+
+
+def test_terminal_write_moves_cursor(terminal):
+    with terminal.frame():
+        terminal.write("ab", pos=(1, 1))
+        terminal.write("cd", pos=(3, 1))
+        terminal.write("ef", pos=(1, 2))
+
+        assert terminal._stream.getvalue() == (
+            "\x1b[?2026h"
+            + "\x1b[2;2Hab\x1b[0m"
+            + "cd\x1b[0m"
+            + "\x1b[3;2Hef\x1b[0m"
+        )
+
+        terminal.write("\n")
+        assert terminal.cursor.position is None
+
+
+def test_terminal_write_outside_frame(terminal):
+    terminal.write("ab", pos=(1, 1))
+    print("Output the terminal doesn't know about", file=terminal._stream)
+    terminal.write("cd", pos=(3, 1))
+
+    with terminal.frame():
+        terminal.write("ef", pos=(5, 1))
+
+    # Writes outside of frames can't rely on where the last one left the cursor
+    assert terminal._stream.getvalue().endswith(
+        "\x1b[2;4Hcd\x1b[0m" + "\x1b[?2026h" + "\x1b[2;6Hef\x1b[0m" + "\x1b[?2026l"
+    )
+
+
+def test_terminal_write_after_unknown_output(terminal):
+    with terminal.frame():
+        terminal.write("ab", pos=(1, 1))
+        terminal.write("\x1b[5;5H")
+        terminal.write("\tx", pos=(3, 1))
+        terminal.write("cd", pos=(5, 1))
+
+        # Both the non-positioned write and the tab leave the cursor position unknown
+        assert terminal._stream.getvalue() == (
+            "\x1b[?2026h"
+            + "\x1b[2;2Hab\x1b[0m"
+            + "\x1b[5;5H"
+            + "\x1b[2;4H\tx\x1b[0m"
+            + "\x1b[2;6Hcd\x1b[0m"
+        )
+
+
+def test_compositor_damage_mode(terminal):
+    window = Window("Spinner: |", width=20)
+    compositor = Compositor([window], framerate=60, render_mode=RenderMode.DAMAGE)
+
+    compositor.draw()
+    full = compositor.bytes_written
+
+    window[0].value = "Spinner: /"
+    compositor.draw()
+
+    assert 0 < compositor.bytes_written < full
+    assert "/" in terminal._stream.getvalue()[-40:]
+
+
+def test_compositor_skips_unchanged(terminal):
+    compositor = Compositor([Window("Hello")], framerate=60)
+
+    compositor.draw()
+    assert compositor.bytes_written > 0
+
+    compositor.draw()
+    assert compositor.bytes_written == 0
+
+
+def test_compositor_retained(terminal):
+    window = Window("Hello", width=20)
+    compositor = Compositor([window], framerate=60, retained=True)
+
+    calls = []
+    original = window.get_lines
+    window.get_lines = lambda: calls.append(1) or original()
+
+    for _ in range(5):
+        compositor.draw()
+
+    assert len(calls) == 1
+
+    # Changing a widget's attributes dirties its window
+    window[0].value = "World"
+    compositor.draw()
+    assert len(calls) == 2
+    assert "World" in terminal._stream.getvalue()
+
+    window[0].styles.value = "bold"
+    window[0].styles.value = "bold"
+    compositor.draw()
+    assert len(calls) == 3
+
+    window.is_dirty = True
+    compositor.draw()
+    assert len(calls) == 4
+
+    window.pos = (3, 3)
+    compositor.draw()
+    window.blur()
+    compositor.draw()
+    assert len(calls) == 6
+
+    compositor.draw(force=True)
+    assert len(calls) == 7
+
+
+def test_compositor_retained_alias_change(terminal):
+    tim.alias("test-retained", "bold")
+
+    window = Window("[test-retained]Hello", width=20)
+    compositor = Compositor([window], framerate=60, retained=True)
+    compositor.draw()
+    written = len(terminal._stream.getvalue())
+
+    tim.alias("test-retained", "italic")
+    compositor.draw()
+
+    assert "Hello" in terminal._stream.getvalue()[written:]
+
+
+def test_compositor_event_driven(terminal):
+    compositor = Compositor([Window("Hello")], framerate=120, event_driven=True)
+    compositor.idle_timeout = 0.01
+
+    draws = []
+    drawn, resume = Semaphore(0), Event()
+
+    def _draw_frame(*_, **__):
+        draws.append(1)
+        drawn.release()
+        resume.wait(1)
+
+    compositor._draw_frame = _draw_frame
+
+    # The first frame is requested by `run`, and holds the loop until resumed
+    compositor.run()
+    assert drawn.acquire(timeout=1)
+
+    compositor.request_frame()
+    compositor.request_frame()
+    resume.set()
+
+    assert drawn.acquire(timeout=1)
+    assert not drawn.acquire(timeout=0.05)
+    assert len(draws) == 2
+
+    compositor.stop()
+
+
+def test_widget_changes_request_frames(terminal):
+    class _Manager:
+        requests = 0
+
+        def request_frame(self):
+            self.requests += 1
+
+    window = Window("Hello", width=20)
+    window.manager = manager = _Manager()
+    compositor = Compositor([window], framerate=60)
+
+    for value in ("First", "Second"):
+        compositor.draw()
+        assert not window.is_dirty
+
+        requests = manager.requests
+        window[0].value = value
+        assert manager.requests > requests
+
+    compositor.draw()
+    assert "Second" in terminal._stream.getvalue()
+
+
+def test_coverage_mask():
+    mask = CoverageMask(10, 5)
+    mask.cover((1, 1, 6, 3))
+
+    assert mask.is_covered((2, 1, 5, 3))
+    assert not mask.is_covered((2, 1, 8, 3))
+    assert mask.is_covered((20, 20, 25, 25))
+
+
+def test_screen_mask_skips_covered_cells():
+    screen = Screen(10, 1, mask=CoverageMask(10, 1))
+    screen.write((3, 1), "top")
+    screen.write((1, 1), "bottom....")
+
+    assert "".join(screen.glyphs[0]) == "botopm...."
+
+
+def test_compositor_culls_occluded_windows(terminal):
+    top = Window("top", width=20, height=5)
+    hidden = Window("hidden", width=10, height=3)
+    top.pos = (1, 1)
+    hidden.pos = (3, 2)
+
+    calls = []
+    original = hidden.get_lines
+    hidden.get_lines = lambda: calls.append(1) or original()
+
+    for mode in RenderMode:
+        compositor = Compositor([top, hidden], framerate=60, render_mode=mode)
+        compositor.draw()
+
+    assert calls == []
+
+    hidden.pos = (15, 2)
+    compositor.draw()
+
+    assert len(calls) == 1
+
+
+def test_compositor_frame_stats(terminal):
+    window = Window("Hello", width=10)
+    compositor = Compositor([window], framerate=60, render_mode=RenderMode.DAMAGE)
+
+    compositor.draw()
+    compositor.draw()
+
+    first, second = compositor.frame_stats
+
+    assert list(first.render_times) == [window]
+    assert first.bytes_written > 0 and not first.skipped
+    assert second.skipped and second.bytes_written == 0
+    assert first.total_time >= first.render_time + first.diff_time + first.write_time
+
+
+def test_summarize_frames():
+    frames = [
+        FrameStats(start=0.0, total_time=0.002, bytes_written=100),
+        FrameStats(start=0.5, total_time=0.004, skipped=True, dropped=2),
+        FrameStats(start=1.0, total_time=0.003, bytes_written=200),
+    ]
+
+    summary = summarize_frames(frames)
+
+    assert summary["frames"] == 3
+    assert summary["skipped"] == 1
+    assert summary["dropped"] == 2
+    assert summary["fps"] == 2.0
+    assert summary["total_time"] == pytest.approx(3.0)
+    assert summary["bytes_written"] == 100
+    assert summarize_frames([])["fps"] == 0.0
+
+
+def test_frame_stats_window(terminal):
+    window = Window("Hello", width=10)
+    compositor = Compositor([], framerate=60, retained=True)
+    overlay = FrameStatsWindow(compositor)
+    compositor._windows.extend([overlay, window])
+
+    compositor.draw()
+    compositor.draw()
+
+    # The overlay re-renders every frame, the idle window is cached
+    assert list(compositor.frame_stats[-1].render_times) == [overlay]
+    assert any("skipped" in line for line in overlay.get_lines())
+
+
+def test_frame_stats_window_goes_idle(terminal):
+    compositor = Compositor([], framerate=60, retained=True)
+    overlay = FrameStatsWindow(compositor)
+    compositor._windows.append(overlay)
+
+    # Forward the window's frame requests straight to the compositor
+    overlay.manager = compositor
+
+    compositor.draw()
+    compositor._frame_requested.clear()
+    compositor.draw()
+
+    assert not compositor._frame_requested.is_set()
+
+    overlay._last_refresh -= overlay.refresh_interval
+    compositor.draw()
+
+    assert compositor._frame_requested.is_set()
@@ -0,0 +1,78 @@
+import pytermgui as ptg
+from pytermgui import DataTable, VirtualList, keys, real_length
+from pytermgui.ansi_interface import MouseAction, MouseEvent
+
+
+def test_virtual_list_fetches_visible_rows():
+    fetched = []
+
+    def _get_row(index):
+        fetched.append(index)
+        return f"Row {index}"
+
+    rows = VirtualList(_get_row, length=1_000_000, width=20, height=5)
+    rows.scroll(500_000)
+
+    lines = rows.get_lines()
+
+    assert fetched == list(range(500_000, 500_005))
+    assert [ptg.strip_ansi(line).rstrip() for line in lines][0] == "Row 500000"
+    assert all(real_length(line) == 20 for line in lines)
+
+
+def test_virtual_list_variable_heights():
+    rows = VirtualList(
+        [f"Row {i}\nDetails" if i % 2 else f"Row {i}" for i in range(10)],
+        row_height=lambda index: 1 + index % 2,
+        width=20,
+        height=4,
+    )
+
+    rows.scroll_end(-1)
+    lines = [ptg.strip_ansi(line).rstrip() for line in rows.get_lines()]
+
+    # Row 7 would not fit alongside the two lines of row 9
+    assert lines == ["Row 8", "Row 9", "Details", ""]
+    assert rows._max_scroll == 8
+
+
+def test_virtual_list_selection():
+    selected = []
+    rows = VirtualList(
+        list(range(100)),
+        width=20,
+        height=5,
+        onselect=lambda index, row: selected.append(row),
+    )
+
+    rows.get_lines()
+
+    assert rows.handle_key(keys.DOWN)
+    assert rows.handle_key(keys.CTRL_D)
+    assert rows.selected_row == 5
+    assert rows._scroll_offset == 1
+
+    rows.select_row(99)
+    assert not rows.handle_key(keys.DOWN)
+
+    rows.pos = (1, 1)
+    rows.get_lines()
+    assert rows.handle_mouse(MouseEvent(MouseAction.LEFT_CLICK, (2, 2)))
+    assert selected == [0, 5, 99, 96]
+
+
+def test_data_table():
+    table = DataTable(
+        [(1, "init", "[0.1]"), (2, "a very long process name", 4.5)],
+        columns=["PID", "Name", "CPU%"],
+        widths=[5, 10, 6],
+        width=23,
+        height=4,
+    )
+
+    lines = [ptg.strip_ansi(line) for line in table.get_lines()]
+
+    assert lines[0] == "PID   Name       CPU%  "
+    assert lines[1] == "1     init       [0.1] "
+    assert lines[2] == "2     a very lon 4.5   "
+    assert lines[3] == " " * 23
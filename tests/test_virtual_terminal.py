@@ -0,0 +1,139 @@
+import pytest
+
+from pytermgui import Button, ScriptedInput, VirtualTerminal, Window, WindowManager, keys
+from pytermgui.enums import RenderMode
+from pytermgui.term import get_terminal, set_global_terminal
+from pytermgui.window_manager import Compositor
+
+
+@pytest.fixture
+def terminal():
+    original = get_terminal()
+    new = VirtualTerminal(size=(20, 5))
+
+    set_global_terminal(new)
+    yield new
+    set_global_terminal(original)
+
+
+def test_interpret_text(terminal):
+    terminal.write("\x1b[2;3Hab\x1b[1mcd\x1b[0m\x1b[2b")
+    terminal.write("\x1b]8;;https://example.com\x1b\\link\x1b]8;;\x1b\\", pos=(0, 2))
+
+    assert terminal.get_lines()[1] == "  abcddd            "
+    assert terminal.screen.styles[1][4].attributes == {"1"}
+    assert terminal.screen.styles[2][1].link == "https://example.com"
+
+
+def test_interpret_erase_and_wrap(terminal):
+    terminal.write("x" * 25)
+    assert terminal.get_lines()[:2] == ["x" * 20, "xxxxx" + " " * 15]
+
+    terminal.write("\x1b[1;5H\x1b[K\x1b[2;3H\x1b[1J")
+    assert terminal.get_lines()[:2] == ["    " + " " * 16, "   xx" + " " * 15]
+
+    terminal.write("\x1b[2J")
+    assert terminal.get_text().strip() == ""
+
+
+def test_interpret_split_sequences(terminal):
+    terminal.write("\x1b[?10")
+    terminal.write("49h\x1b[3")
+    terminal.write("1mred")
+
+    assert "1049" in terminal.modes
+    assert terminal.get_lines()[0].startswith("red")
+    assert terminal.screen.styles[0][0].foreground == "31"
+
+
+def test_write_clips_to_terminal(terminal):
+    terminal.write("a" * 30, pos=(1, 1))
+    terminal.write("\x1b[1mLEFT\x1b[0m", pos=(-1, 2))
+    terminal.write("漢字" * 10, pos=(15, 3))
+
+    lines = terminal.get_lines()
+    assert lines[1] == " " + "a" * 19
+    assert lines[2] == "EFT" + " " * 17
+    assert lines[3] == " " * 15 + "漢字 "
+
+
+def test_frames(terminal):
+    with terminal.frame() as frame:
+        frame.write("\x1b[Hhello")
+
+    assert terminal.frames == 1
+    assert terminal.frame_bytes == [len("\x1b[?2026h\x1b[Hhello\x1b[?2026l")]
+
+
+def test_frame_bytes_after_non_ascii(terminal):
+    frame = "\x1b[?2026h┌──┐\x1b[?2026l"
+    terminal.interpret("╭─╮" + frame + "╰─╯")
+
+    assert terminal.frame_bytes == [len(frame.encode("utf-8"))]
+
+
+def test_render_modes_match(terminal):
+    terminal.resize((40, 8))
+    assert terminal.process_pending_resize()
+    assert terminal.size == (40, 8)
+
+    top = Window("[bold 141]Top", width=12)
+    bottom = Window("[italic]Bottom window", width=18, height=4)
+    top.pos = (3, 2)
+
+    screens = []
+
+    for mode in RenderMode:
+        terminal.write("\x1b[2J")
+
+        compositor = Compositor([top, bottom], framerate=60, render_mode=mode)
+        compositor.draw()
+
+        screens.append((terminal.get_lines(), terminal.screen.styles))
+
+    assert screens[0] == screens[1]
+
+
+def test_windows_are_clipped_to_terminal(terminal):
+    window = Window("[bold]Overflowing", width=12)
+    window.pos = (15, 2)
+
+    for mode in RenderMode:
+        terminal.write("\x1b[2J")
+
+        compositor = Compositor([window], framerate=60, render_mode=mode)
+        compositor.draw()
+
+        lines = terminal.get_lines()
+
+        # Nothing wraps around to the start of the next line
+        assert all(line[:14] == " " * 14 for line in lines)
+        assert lines[2][14:].strip() != ""
+
+
+def test_scripted_input(terminal):
+    clicks = []
+    snapshots = []
+
+    manager = WindowManager(framerate=120)
+    manager.add(
+        Window("Hello", Button("Click", lambda *_: clicks.append(1)), width=16),
+        animate=False,
+    )
+
+    ScriptedInput(
+        [
+            0.05,
+            keys.DOWN,
+            keys.RETURN,
+            0.05,
+            lambda: snapshots.append(terminal.get_text()),
+            manager.stop,
+        ]
+    ).start()
+
+    manager.run()
+
+    assert clicks == [1]
+    assert "Click" in snapshots[0]
+    assert terminal.frames > 0